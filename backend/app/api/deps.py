@@ -1,20 +1,54 @@
 # backend/app/api/deps.py
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from jose import jwt, JWTError
 
-from app.db.database import get_db
+from app.db.database import AsyncSessionLocal, get_db
 from app.db import models
 from app.core.config import settings
+from app.core.identity import CurrentUser, identity_cache
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
+
+# "scope" claim of the short-lived tokens accepted in ?token= (POST /admin/logs/stream-token)
+LOG_STREAM_SCOPE = "log-stream"
+
+
+def _load_identity(db: Session, user_id: int) -> CurrentUser | None:
+    # one round trip: user + student/mentor ids
+    row = (
+        db.query(models.User, models.Student.id, models.Mentor.id)
+        .outerjoin(models.Student, models.Student.user_id == models.User.id)
+        .outerjoin(models.Mentor, models.Mentor.user_id == models.User.id)
+        .filter(models.User.id == user_id)
+        .first()
+    )
+    if not row:
+        return None
+    user, student_id, mentor_id = row
+    return CurrentUser(
+        id=user.id,
+        email=user.email,
+        full_name=user.full_name,
+        role=user.role,
+        student_id=student_id,
+        mentor_id=mentor_id,
+    )
 
 
 # ---------------------- Get Current User (Core Auth) ---------------------- #
-def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)):
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> CurrentUser:
+    return await _user_from_token(token)
+
+
+async def _user_from_token(token: str | None, scope: str | None = None) -> CurrentUser:
+    """scope: the token's "scope" claim must match (None = a normal login token)."""
     try:
+        if not token:
+            raise JWTError()
         # Decode using the same key/algorithm as used for token creation
         payload = jwt.decode(
             token,
@@ -23,16 +57,23 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
         )
         user_id: int | None = payload.get("sub")
 
-        if not user_id:
+        if not user_id or payload.get("scope") != scope:
             raise JWTError()
 
-        user = db.query(models.User).filter(models.User.id == int(user_id)).first()
-        if not user:
-            raise JWTError()
+        # cached identity: no users / students query while the token is valid
+        exp = int(payload.get("exp") or 0)
+        user = identity_cache.get(int(user_id), exp)
+        if user is None:
+            # a session only on a miss (closed again before the route runs)
+            async with AsyncSessionLocal() as db:
+                user = await db.run_sync(_load_identity, int(user_id))
+            if not user:
+                raise JWTError()
+            identity_cache.put(exp, user)
 
         return user
 
-    except JWTError:
+    except (JWTError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired authentication token",
@@ -41,13 +82,13 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
 
 # ---------------------- Student Only Access ---------------------- #
 def get_current_student(
-    current_user: models.User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     if current_user.role != "student":
         raise HTTPException(status_code=403, detail="Students only")
 
-    student = db.query(models.Student).filter(models.Student.user_id == current_user.id).first()
+    student = db.get(models.Student, current_user.student_id) if current_user.student_id else None
     if not student:
         raise HTTPException(status_code=404, detail="Student profile missing")
 
@@ -55,14 +96,32 @@ def get_current_student(
 
 
 # ---------------------- Admin Only Access ---------------------- #
-def require_admin(current_user: models.User = Depends(get_current_user)):
+async def require_admin(current_user: CurrentUser = Depends(get_current_user)):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admins only")
+    return current_user
+
+
+# ---------------------- Admin, for long-lived streams ---------------------- #
+# EventSource cannot send headers, so the token may also come as ?token=;
+# URLs end up in logs and history, so only a short-lived stream token is
+# accepted there, never the login token. No session is held while a
+# dashboard stays open.
+async def require_admin_stream(
+    header_token: str | None = Depends(optional_oauth2_scheme),
+    token: str | None = Query(None, description="stream token from POST /admin/logs/stream-token"),
+):
+    if header_token:
+        current_user = await _user_from_token(header_token)
+    else:
+        current_user = await _user_from_token(token, scope=LOG_STREAM_SCOPE)
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Admins only")
     return current_user
 
 
 # ---------------------- Mentor Only Access ---------------------- #
-def require_mentor(current_user: models.User = Depends(get_current_user)):
+async def require_mentor(current_user: CurrentUser = Depends(get_current_user)):
     if current_user.role != "mentor":
         raise HTTPException(status_code=403, detail="Mentors only")
     return current_user
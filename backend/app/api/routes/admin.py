@@ -1,209 +1,266 @@
+import io
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from typing import List, Literal
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 
 from app.api.deps import require_admin
-from app.db.database import get_db
+from app.db.database import get_async_read_db, get_db, get_read_db, read_session_factory
 from app.db import models
+from app.db.schemas import InternshipCreate
+from app.services import analytics, audit_log, catalog_import, exports
+from app.services.catalog_import import detect_format
+from app.services.exports import APPLICATION_STATUSES, application_filters
+from app.services.precompute import refresh_after_catalog_change
+from app.services.rec_cache import recommendation_cache
+from app.services.skill_index import get_catalog_version
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 # =================== CREATE INTERNSHIP ===================
 
-class InternshipCreate(BaseModel):
-    title: str
-    company: str
-    location: str | None = None
-    skills: str | None = None
-    industry: str | None = None
-
-
 @router.post("/internships")
 def add_internship(
     data: InternshipCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin=Depends(require_admin),
 ):
+    from_version = get_catalog_version(db)
     internship = models.Internship(
         title=data.title,
         company=data.company,
         location=data.location or "",
         required_skills=data.skills or "",
         industry=data.industry or "",
+        description=data.description or "",
     )
     db.add(internship)
+    db.flush()
+    to_version = get_catalog_version(db)
     db.commit()
     db.refresh(internship)
+
+    recommendation_cache.invalidate_catalog()
+    background_tasks.add_task(
+        refresh_after_catalog_change, [internship.id], from_version, to_version
+    )
     return {"message": "Internship created", "id": internship.id}
 
 
+@router.post("/internships/import")
+def import_internships(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    format: str | None = Query(None, description="csv or jsonl (default: from the file name)"),
+    upsert: bool = Query(False, description="update rows matching (company, title)"),
+    db: Session = Depends(get_db),
+    admin=Depends(require_admin),
+):
+    """
+    Bulk-load internships from CSV (header row) or JSONL, one InternshipCreate
+    per record. The upload is read line by line from its spooled temp file.
+    """
+    try:
+        fmt = detect_format(file.filename, format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    from_version = get_catalog_version(db)
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        report = catalog_import.import_internships(db, lines, fmt, upsert=upsert)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 text")
+    finally:
+        lines.detach()
+    to_version = get_catalog_version(db)
+
+    changed = report.pop("ids")
+    if changed:
+        recommendation_cache.invalidate_catalog()
+        background_tasks.add_task(refresh_after_catalog_change, changed, from_version, to_version)
+    return report
+
+
 @router.get("/internships")
 def list_internships(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(require_admin),
 ):
     return db.query(models.Internship).all()
 
 
+@router.get("/cache/recommendations")
+def recommendation_cache_stats(admin=Depends(require_admin)):
+    return recommendation_cache.stats()
+
+
 # =================== APPLICATIONS - LIST FOR ADMIN PANEL ===================
 
 @router.get("/applications")
-def admin_all_applications(
-    db: Session = Depends(get_db),
+async def admin_all_applications(
+    db: AsyncSession = Depends(get_async_read_db),
     admin=Depends(require_admin),
 ):
-    apps = (
-        db.query(models.Application, models.User, models.Internship)
-        .join(models.Student, models.Application.student_id == models.Student.id)
+    A = models.Application
+    apps = await db.execute(
+        select(A.id, models.User.full_name, models.Internship.title, A.status)
+        .join(models.Student, A.student_id == models.Student.id)
         .join(models.User, models.Student.user_id == models.User.id)
-        .join(models.Internship, models.Application.internship_id == models.Internship.id)
-        .all()
+        .join(models.Internship, A.internship_id == models.Internship.id)
     )
 
     return [
         {
-            "id": a.Application.id,
-            "student_name": a.User.full_name,
-            "internship_title": a.Internship.title,
-            "status": a.Application.status,
+            "id": app_id,
+            "student_name": student_name,
+            "internship_title": internship_title,
+            "status": status,
         }
-        for a in apps
+        for app_id, student_name, internship_title, status in apps
     ]
 
 
-# =================== APPLICATIONS - FILTER VIEW PAGE ===================
+# =================== APPLICANTS FOR ONE INTERNSHIP ===================
+# admin-internships page (/applications) and admin panel (/applicants)
+
 
 @router.get("/internships/{intern_id}/applications")
-def admin_internship_applications(
+@router.get("/internships/{intern_id}/applicants")
+async def list_applicants(
     intern_id: int,
-    status: str | None = None,
-    db: Session = Depends(get_db),
+    status: str | None = Query(None, description="pending / approved / rejected; anything else = all"),
+    q: str = Query("", description="search student name / email"),
+    limit: int | None = Query(None, ge=1, le=200, description="page size; enables {items, next_cursor, total, counts}"),
+    cursor: int | None = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_async_read_db),
     admin=Depends(require_admin),
 ):
     """
-    Applications for a specific internship (used by admin-internships page).
-    Now also returns resume_url so admin can open the PDF in browser.
+    Applicants of one internship, newest first, from one joined query.
+    Without `limit` the full (filtered) list is returned, as before; with it
+    a keyset page on application id plus the total and per-status counts.
     """
-    q = (
-        db.query(models.Application)
-        .filter(models.Application.internship_id == intern_id)
-    )
+    A, S, U = models.Application, models.Student, models.User
 
-    if status in ("pending", "approved", "rejected"):
-        q = q.filter(models.Application.status == status)
-
-    result = []
-    for a in q.all():
-        student_obj = db.query(models.Student).filter_by(id=a.student_id).first()
-        if not student_obj:
-            # should not happen, but skip invalid records instead of crashing UI
-            continue
-        user = student_obj.user
-
-        result.append(
-            {
-                "id": a.id,
-                "student": user.full_name,
-                "email": user.email,
-                "status": a.status,
-                # NEW: url for View Resume button
-                "resume_url": student_obj.resume_path,
-            }
-        )
+    filters = application_filters(intern_id, q=q)
+    status_filter = application_filters(status=status)
 
-    return result
+    stmt = (
+        select(A.id, A.status, A.applied_at, A.resume_url, U.full_name, U.email)
+        .join(S, A.student_id == S.id)
+        .join(U, S.user_id == U.id)
+        .where(*filters, *status_filter)
+        .order_by(A.id.desc())
+    )
+    if cursor is not None:
+        stmt = stmt.where(A.id < cursor)
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    rows = (await db.execute(stmt)).all()
 
+    items = [
+        {
+            "id": r.id,
+            "application_id": r.id,
+            "student": r.full_name,
+            "name": r.full_name,
+            "email": r.email,
+            "status": r.status,
+            # snapshot taken when the student applied
+            "resume_url": r.resume_url or None,
+            "applied_at": r.applied_at.isoformat() if r.applied_at else None,
+        }
+        for r in rows[:limit]
+    ]
+    if limit is None:
+        return items
+
+    counts = dict.fromkeys(APPLICATION_STATUSES, 0)
+    count_rows = await db.execute(
+        select(A.status, func.count())
+        .join(S, A.student_id == S.id)
+        .join(U, S.user_id == U.id)
+        .where(*filters)
+        .group_by(A.status)
+    )
+    for row_status, n in count_rows:
+        counts[row_status] = n
+
+    return {
+        "items": items,
+        "next_cursor": items[-1]["id"] if len(rows) > limit else None,
+        "total": counts.get(status, 0) if status_filter else sum(counts.values()),
+        "counts": counts,
+    }
+
+
+# =================== STREAMING EXPORTS ===================
+
+def _export_response(request: Request, stmt, columns, fmt: str, name: str) -> StreamingResponse:
+    return StreamingResponse(
+        exports.stream_export(read_session_factory(request), stmt, columns, fmt),
+        media_type=exports.MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}-{date.today():%Y%m%d}.{fmt}"'
+        },
+    )
 
-# =================== APPROVE & REJECT ===================
 
-@router.patch("/applications/{app_id}/approve")
-def approve(
-    app_id: int,
-    db: Session = Depends(get_db),
+@router.get("/export/applications")
+def export_applications(
+    request: Request,
+    format: Literal["csv", "ndjson"] = "csv",
+    internship_id: int | None = None,
+    status: str | None = Query(None, description="pending / approved / rejected; anything else = all"),
+    q: str = Query("", description="search student name / email"),
     admin=Depends(require_admin),
 ):
-    app = db.query(models.Application).filter_by(id=app_id).first()
-    if not app:
-        raise HTTPException(status_code=404, detail="Not found")
-    app.status = "approved"
-    db.commit()
-    return {"message": "Approved"}
-
-
-@router.patch("/applications/{app_id}/reject")
-def reject(
-    app_id: int,
-    db: Session = Depends(get_db),
+    """Applications joined with student, user and internship, streamed (filters as in /applicants)."""
+    stmt = exports.applications_query(internship_id, status, q)
+    return _export_response(request, stmt, exports.APPLICATION_COLUMNS, format, "applications")
+
+
+@router.get("/export/submissions")
+def export_submissions(
+    request: Request,
+    format: Literal["csv", "ndjson"] = "csv",
+    internship_id: int | None = None,
+    task_id: int | None = None,
+    status: str | None = Query(None, description="on_time / late; anything else = all"),
+    q: str = Query("", description="search student name / email"),
     admin=Depends(require_admin),
 ):
-    app = db.query(models.Application).filter_by(id=app_id).first()
-    if not app:
-        raise HTTPException(status_code=404, detail="Not found")
-    app.status = "rejected"
-    db.commit()
-    return {"message": "Rejected"}
-
-
-@router.get("/internships/{internship_id}/applicants")
-def get_internship_applicants(internship_id: int, db: Session = Depends(get_db), admin=Depends(require_admin)):
-
-    apps = (
-        db.query(models.Application, models.User, models.Student)
-        .join(models.Student, models.Application.student_id == models.Student.id)
-        .join(models.User, models.Student.user_id == models.User.id)
-        .filter(models.Application.internship_id == internship_id)
-        .all()
-    )
-
-    return [
-        {
-            "application_id": a.Application.id,
-            "name": a.User.full_name,
-            "email": a.User.email,
-            "resume": None,  # later we add upload
-            "status": a.Application.status,
-        }
-        for a in apps
-    ]
+    stmt = exports.submissions_query(internship_id, task_id, status, q)
+    return _export_response(request, stmt, exports.SUBMISSION_COLUMNS, format, "submissions")
 
 
-# =================== VIEW APPLICANTS FOR SPECIFIC INTERNSHIP ===================
+# =================== ANALYTICS ===================
 
-@router.get("/internships/{intern_id}/applicants")
-def view_applicants(intern_id: int, db: Session = Depends(get_db), admin=Depends(require_admin)):
+@router.get("/analytics")
+def admin_analytics(
+    internship_id: int | None = None,
+    weeks: int = Query(12, ge=1, le=104),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_read_db),
+    admin=Depends(require_admin),
+):
     """
-    Returns list of all applicants for a specific internship.
-    Includes: student name, email, resume, status, application_id
+    Status counts, weekly on-time / late submissions and time to approval,
+    read from the aggregate tables (no scans of applications / submissions).
     """
+    return analytics.summary(db, internship_id, weeks, limit)
 
-    data = (
-        db.query(models.Application, models.User, models.Student)
-        .join(models.Student, models.Application.student_id == models.Student.id)
-        .join(models.User, models.Student.user_id == models.User.id)
-        .filter(models.Application.internship_id == intern_id)
-        .all()
-    )
-
-    if not data:
-        return []
-
-    result = []
-    for a, user, student in data:
-        result.append({
-            "application_id": a.id,
-            "name": user.full_name,
-            "email": user.email,
-            "resume": None,  # will replace later when resume upload endpoint added
-            "status": a.status,
-        })
 
-    return result
-
-
-# =================== APPROVE / REJECT (FINAL CLEAN VERSION) ===================
+# =================== APPROVE & REJECT ===================
 
 @router.patch("/applications/{app_id}/approve")
 def approve_application(app_id: int, db: Session = Depends(get_db), admin=Depends(require_admin)):
@@ -215,12 +272,13 @@ def approve_application(app_id: int, db: Session = Depends(get_db), admin=Depend
     app.progress_status = "active"
     app.approved_at = datetime.utcnow()
 
-    db.add(models.ApplicationLog(
+    audit_log.record(
+        db,
         student_id=app.student_id,
         internship_id=app.internship_id,
         event="APPROVED",
-        message="Admin approved application"
-    ))
+        message="Admin approved application",
+    )
     db.commit()
     return {"message": "Approved Successfully"}
 
@@ -234,16 +292,86 @@ def reject_application(app_id: int, db: Session = Depends(get_db), admin=Depends
     app.status = "rejected"
     app.progress_status = "ended"
 
-    db.add(models.ApplicationLog(
+    audit_log.record(
+        db,
         student_id=app.student_id,
         internship_id=app.internship_id,
         event="REJECTED",
-        message="Admin rejected application"
-    ))
+        message="Admin rejected application",
+    )
     db.commit()
     return {"message": "Rejected Successfully"}
 
 
+# =================== BULK APPROVE / REJECT ===================
+
+_DECISIONS = {
+    # decision -> (status, progress_status, log event, log message)
+    "approve": ("approved", "active", "APPROVED", "Admin approved application"),
+    "reject": ("rejected", "ended", "REJECTED", "Admin rejected application"),
+}
+
+
+class BulkDecision(BaseModel):
+    application_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    decision: Literal["approve", "reject"]
+    remarks: str | None = None
+
+
+@router.post("/applications/bulk-decision")
+def bulk_decision(payload: BulkDecision, db: Session = Depends(get_db), admin=Depends(require_admin)):
+    """
+    Decide many pending applications in one transaction: one
+    UPDATE ... WHERE id IN (...) AND status = 'pending' RETURNING, one bulk
+    ApplicationLog batch (audit_log), one analytics counter update. Ids that are not
+    pending are reported, not changed.
+    """
+    A = models.Application
+    status, progress_status, event, message = _DECISIONS[payload.decision]
+    ids = list(dict.fromkeys(payload.application_ids))
+
+    values = {"status": status, "progress_status": progress_status}
+    if status == "approved":
+        values["approved_at"] = datetime.utcnow()
+    if payload.remarks is not None:
+        values["remarks_admin"] = payload.remarks
+
+    updated = db.execute(
+        update(A)
+        .where(A.id.in_(ids), A.status == "pending")
+        .values(**values)
+        .returning(A.id, A.student_id, A.internship_id, A.applied_at, A.approved_at)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    if updated:
+        audit_log.record_many(
+            db,
+            [
+                {
+                    "student_id": r.student_id,
+                    "internship_id": r.internship_id,
+                    "event": event,
+                    "message": f"{message}: {payload.remarks}" if payload.remarks else message,
+                }
+                for r in updated
+            ],
+        )
+        analytics.record_decisions(db.connection(), updated, status)
+
+    updated_ids = {r.id for r in updated}
+    rest = [i for i in ids if i not in updated_ids]
+    decided = dict(db.execute(select(A.id, A.status).where(A.id.in_(rest))).all()) if rest else {}
+    db.commit()
+
+    return {
+        "decision": status,
+        "updated": [i for i in ids if i in updated_ids],
+        "already_decided": [{"id": i, "status": decided[i]} for i in rest if i in decided],
+        "missing": [i for i in rest if i not in decided],
+    }
+
+
 # =============== ADMIN ASSIGN TASK TO STUDENT ==================
 
 from pydantic import BaseModel
@@ -253,7 +381,7 @@ class TaskAssign(BaseModel):
     internship_id:int
     title:str
     description:str | None=None
-    due_date:str
+    due_date:date
 
 @router.post("/assign-task",dependencies=[Depends(require_admin)])
 def assign_task(payload:TaskAssign,db:Session=Depends(get_db)):
@@ -263,17 +391,19 @@ def assign_task(payload:TaskAssign,db:Session=Depends(get_db)):
         description=payload.description or "",
         due_date=payload.due_date
     )
-    db.add(task); db.commit(); db.refresh(task)
+    db.add(task); db.flush()
+    task_id=task.id
 
-    log=models.ApplicationLog(
+    audit_log.record(
+        db,
         student_id=payload.student_id,
         internship_id=payload.internship_id,
         event="TASK_ASSIGNED",
         message=f"Assigned : {payload.title}"
     )
-    db.add(log); db.commit()
+    db.commit()
 
-    return {"message":"Task Assigned","task_id":task.id}
+    return {"message":"Task Assigned","task_id":task_id}
 
 # ============ ADMIN REVIEW SUBMISSION =============
 
@@ -287,7 +417,7 @@ def review(submission_id:int,feedback:str,db:Session=Depends(get_db)):
 
 
 @router.get("/users/accepted")
-def list_accepted_users(db: Session = Depends(get_db), admin=Depends(require_admin)):
+def list_accepted_users(db: Session = Depends(get_read_db), admin=Depends(require_admin)):
     apps = db.query(models.Application).filter_by(status="approved").all()
     data = []
     for a in apps:
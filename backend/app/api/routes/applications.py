@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import datetime
 from app.db.database import get_db
 from app.db import models
 from app.api.deps import get_current_user
+from app.services import audit_log
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -11,7 +13,7 @@ router = APIRouter(prefix="/applications", tags=["applications"])
 # STUDENT APPLIES
 @router.post("/apply/{internship_id}")
 def apply(internship_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    student = db.query(models.Student).filter_by(user_id=user.id).first()
+    student = db.get(models.Student, user.student_id) if user.student_id else None
     if not student:
         raise HTTPException(400, "Student profile missing")
 
@@ -35,32 +37,37 @@ def apply(internship_id: int, db: Session = Depends(get_db), user=Depends(get_cu
     )
 
     db.add(app)
-    db.add(models.ApplicationLog(
-        student_id=student.id,
-        internship_id=internship_id,
-        event="APPLIED",
-        message=f"{student.user.full_name} applied for internship {internship_id}"
-    ))
 
-    db.commit()
+    try:
+        audit_log.record(
+            db,
+            student_id=student.id,
+            internship_id=internship_id,
+            event="APPLIED",
+            message=f"{user.full_name} applied for internship {internship_id}"
+        )
+        db.commit()
+    except IntegrityError:  # concurrent duplicate (uq_applications_student_internship)
+        db.rollback()
+        raise HTTPException(400, "Already applied")
     return {"message": "Application Submitted"}
 
 
 # STUDENT CANCEL APPLICATION
 @router.delete("/cancel/{internship_id}")
 def cancel(internship_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    student = db.query(models.Student).filter_by(user_id=user.id).first()
-    app = db.query(models.Application).filter_by(student_id=student.id, internship_id=internship_id).first()
+    app = db.query(models.Application).filter_by(student_id=user.student_id, internship_id=internship_id).first()
 
     if not app:
         raise HTTPException(404, "Not applied")
 
-    db.add(models.ApplicationLog(
-        student_id=student.id,
+    audit_log.record(
+        db,
+        student_id=user.student_id,
         internship_id=internship_id,
         event="CANCELLED",
         message="Student cancelled application"
-    ))
+    )
 
     db.delete(app)
     db.commit()
@@ -4,16 +4,18 @@ from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.security import (
+    PasswordHashingBusy,
     create_access_token,
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
 )
 from app.db import models
-from app.db.database import get_db
+from app.db.database import get_async_db
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -30,23 +32,35 @@ class UserLogin(BaseModel):
     password: str
 
 
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Authentication is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 # backend/app/api/routes/auth.py
 
 @router.post("/register")
-def register_user(user: UserCreate, db: Session = Depends(get_db)):
-    existing = db.query(models.User).filter(models.User.email == user.email).first()
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    existing = await db.scalar(select(models.User.id).where(models.User.email == user.email))
     if existing:
         raise HTTPException(status_code=400, detail="Email exists")
 
+    try:
+        hashed_password = await get_password_hash(user.password)
+    except PasswordHashingBusy:
+        raise _busy()
+
     new_user = models.User(
         email=user.email,
-        hashed_password=get_password_hash(user.password),
+        hashed_password=hashed_password,
         full_name=user.full_name,
         role=user.role,
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.flush()
 
     # ✅ Create role-specific row
     if user.role == "student":
@@ -56,7 +70,7 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
     elif user.role == "admin":
         db.add(models.Admin(user_id=new_user.id))
 
-    db.commit()
+    await db.commit()
 
     token = create_access_token({"sub": str(new_user.id), "role": new_user.role})
     return {
@@ -66,11 +80,23 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
     }
 
 @router.post("/login")
-def login(user: UserLogin, db: Session = Depends(get_db)):
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if not db_user or not verify_password(user.password, db_user.hashed_password):
+async def login(user: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    db_user = await db.scalar(select(models.User).where(models.User.email == user.email))
+    if not db_user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    try:
+        valid, new_hash = await verify_and_update_password(user.password, db_user.hashed_password)
+    except PasswordHashingBusy:
+        raise _busy()
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    # stored hash uses an old bcrypt cost -> upgrade it transparently
+    if new_hash:
+        db_user.hashed_password = new_hash
+        await db.commit()
+
     token = create_access_token(
         {"sub": str(db_user.id), "role": db_user.role},
         timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
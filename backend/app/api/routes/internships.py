@@ -1,86 +1,155 @@
-from typing import List, Set
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+import base64
+import json
 
-from app.db.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import ReadSessionLocal, SessionLocal, get_async_read_db
 from app.db import models
 from app.api.deps import get_current_user
+from app.services.precompute import precomputed_for
+from app.services.rec_cache import recommendation_cache, skills_fingerprint
+from app.services.scoring import ScoringEngine, get_engine, peek_engine
+from app.services.search import fts_available, fts_token, keyword_hits
+from app.services.skill_index import (
+    get_catalog_version,
+    normalize_skills as _normalize_skills,
+    tokenize_keywords as _tokenize_keywords,
+)
 
 router = APIRouter(prefix="/internships", tags=["internships"])
 
 
-# ================= NORMALIZE SKILL STRINGS =================
-def _normalize_skills(skills_str: str | None) -> Set[str]:
-    if not skills_str:
-        return set()
-    return {s.strip().lower() for s in skills_str.split(",") if s.strip()}
+# ================= PAGINATION CURSOR =================
+# opaque to the client: base64 of the last served (match, tiebreak, id)
+def _encode_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
 
 
-# ================= KEYWORD TOKENIZER =================
-def _tokenize_keywords(keywords: str) -> List[str]:
-    if not keywords:
-        return []
-    return [t.lower() for t in keywords.split() if t.strip()]
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        match, tiebreak, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(match), float(tiebreak), int(last_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# ================= PRECOMPUTED PAGE =================
+def _precomputed_page(stored, limit, after):
+    """
+    Serve from student_recommendations when the stored rows (precomputed_for)
+    are current and cover the requested page; None means "score live".
+    """
+    if stored is None:
+        return None
+    items, total = stored
+    complete = total <= len(items)
+
+    if limit is None:
+        return items if complete else None
+
+    if after is not None:
+        items = [it for it in items if (-it["match"], it["id"]) > (-after[0], after[2])]
+    page = items[:limit]
+    if len(page) < limit and not complete:
+        return None  # page runs past the stored top-N
+
+    more = len(items) > limit or not complete
+    return {
+        "items": page,
+        "next_cursor": _encode_cursor((page[-1]["match"], 0.0, page[-1]["id"])) if more and page else None,
+    }
+
+
+# ================= SCORING ENGINE =================
+def _load_engine(replica: bool) -> ScoringEngine:
+    with (ReadSessionLocal if replica else SessionLocal)() as db:
+        return get_engine(db)
+
+
+async def _scoring_engine(db: AsyncSession, version: int) -> ScoringEngine:
+    # rebuilding reads the whole catalog -> keep it off the event loop,
+    # on the same database (primary / replica) the version came from
+    return peek_engine(version) or await run_in_threadpool(
+        _load_engine, db.info.get("replica", False)
+    )
+
+
+def _score_page(engine: ScoringEngine, user_skills, keyword_tokens, hits, rank, limit, after):
+    if hits is not None:
+        hits = hits + engine.text_hits([t for t in keyword_tokens if not fts_token(t)])
+    match, eligible = engine.score(user_skills, keyword_tokens, hits)
+
+    # without a limit keep the legacy full list; otherwise top-k page
+    if limit is None:
+        return engine.rank(match, eligible, rank)
+    items, last = engine.top_k(match, eligible, limit, after, rank)
+    return {
+        "items": items,
+        "next_cursor": _encode_cursor(last) if last else None,
+    }
 
 
 # ================= RECOMMENDATION + SEARCH =================
 @router.get("/recommendations")
-def get_recommendations(
+async def get_recommendations(
     keywords: str = Query("", description="Search title/company/industry"),
     skills: str = Query("", description="comma skills OR auto from student"),
-    db: Session = Depends(get_db),
+    limit: int | None = Query(None, ge=1, le=100, description="page size; enables {items, next_cursor}"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_async_read_db),
     user=Depends(get_current_user),
 ):
+    after = _decode_cursor(cursor) if cursor else None
+
     try:
         # 1) Get student skills or override if search input is provided
+        student = None
         if skills:
             skills_source = skills
         else:
-            student = db.query(models.Student).filter(models.Student.user_id == user.id).first()
+            student = await db.get(models.Student, user.student_id) if user.student_id else None
             skills_source = student.skills if student else ""
 
         user_skills = _normalize_skills(skills_source)
         keyword_tokens = _tokenize_keywords(keywords)
 
-        # 2) Load all internships
-        internships = db.query(models.Internship).all()
-        results = []
-
-        # 3) Match scoring
-        for i in internships:
-            text_blob = " ".join([
-                i.title or "",
-                i.company or "",
-                i.industry or "",
-                i.description or "",
-                i.required_skills or "",
-            ]).lower()
-
-            text_hits = sum(1 for token in keyword_tokens if token in text_blob)
-            text_score = min(text_hits * 10, 40)
-
-            required = _normalize_skills(i.required_skills)
-            overlap = user_skills & required
-            overlap_ratio = len(overlap) / len(required) if required else 0
-            skill_score = int(overlap_ratio * 60)
-
-            match = min(text_score + skill_score, 100)
-
-            if keyword_tokens and text_hits == 0 and not overlap:
-                continue  # filter irrelevant
-
-            results.append({
-                "id": i.id,
-                "title": i.title,
-                "company": i.company,
-                "location": i.location,
-                "skills": i.required_skills,
-                "match": match,
-            })
-
-        results.sort(key=lambda x: x["match"], reverse=True)
-        return results
+        # cached response for the same skills / keywords / page / catalog version
+        fingerprint = skills_fingerprint(user_skills)
+        page_key = (tuple(keyword_tokens), limit, cursor)
+        version = await db.run_sync(get_catalog_version)
+        cached = recommendation_cache.get(fingerprint, version, *page_key)
+        if cached is not None:
+            return cached
+
+        # 2) Plain "my recommendations" -> materialized rows (one indexed query)
+        if student and not keyword_tokens:
+            stored = await db.run_sync(precomputed_for, student.id, user_skills, version)
+            result = _precomputed_page(stored, limit, after)
+            if result is not None:
+                return result
+
+        # 3) Score against the in-memory catalog (see ScoringEngine).
+        #    A keyword search keeps only internships sharing a skill / token;
+        #    otherwise every internship is listed, unrelated ones with match 0.
+        engine = await _scoring_engine(db, version)
+
+        # 4) Keyword hits come from the FTS5 index when available
+        #    (prefix match, bm25 breaks ties); otherwise substring fallback.
+        #    Tokens FTS5 would rewrite (c++, node.js) always use substrings.
+        hits = rank = None
+        if keyword_tokens and fts_available():
+            hits, rank = await db.run_sync(keyword_hits, engine.ids, keyword_tokens)
+
+        # 5) numpy scoring + ranking is CPU work: keep it off the event loop
+        result = await run_in_threadpool(
+            _score_page, engine, user_skills, keyword_tokens, hits, rank, limit, after
+        )
+
+        recommendation_cache.put(fingerprint, engine.version, *page_key, value=result)
+        return result
 
     except Exception as e:
         print("ERROR /internships/recommendations →", e)
-        return []
+        return [] if limit is None else {"items": [], "next_cursor": None}
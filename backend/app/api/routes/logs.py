@@ -1,18 +1,123 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from app.db.database import get_db
-from app.api.deps import require_admin
-from app.db import models
-
-router = APIRouter(prefix="/logs",tags=["logs"])
-
-@router.get("/")
-def all_logs(db:Session=Depends(get_db),admin=Depends(require_admin)):
-    logs=db.query(models.ApplicationLog).order_by(models.ApplicationLog.id.desc()).all()
-    return [{
-        "event":l.event,
-        "student_id":l.student_id,
-        "internship_id":l.internship_id,
-        "message":l.message,
-        "time":l.created_at
-    } for l in logs]
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.database import SessionLocal, get_read_db
+from app.api.deps import LOG_STREAM_SCOPE, require_admin, require_admin_stream
+from app.services import log_store
+from app.services.log_events import log_broadcaster
+from app.services.log_store import LogFilters
+
+router = APIRouter(prefix="/admin/logs", tags=["logs"])
+
+
+@router.get("")
+def list_logs(
+    event: List[str] = Query([], description="repeatable: APPLIED, APPROVED, ..."),
+    student_id: int | None = None,
+    internship_id: int | None = None,
+    since: datetime | None = Query(None, description="created_at >= since"),
+    until: datetime | None = Query(None, description="created_at < until"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=500),
+    include_archive: bool = Query(False, description="continue into archived (retention) rows"),
+    db: Session = Depends(get_read_db),
+    admin=Depends(require_admin),
+):
+    """Application logs, newest first, keyset-paged on (created_at, id)."""
+    filters = LogFilters(
+        events=tuple(event),
+        student_id=student_id,
+        internship_id=internship_id,
+        since=since,
+        until=until,
+    )
+    try:
+        return log_store.page(db, filters, cursor, limit, include_archive)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+# ================= LIVE TAIL (Server-Sent Events) =================
+RETRY_MS = 3000  # EventSource reconnect delay
+
+
+def _sse(item: dict) -> str:
+    # same fields as the /admin/logs items (log_store.items)
+    return f"id: {item['id']}\nevent: log\ndata: {json.dumps(item)}\n\n"
+
+
+def _replay(after_id: int) -> List[dict]:
+    with SessionLocal() as db:  # primary: the replica may not have the newest rows yet
+        return log_store.items_after(db, after_id, settings.LOG_STREAM_REPLAY_LIMIT)
+
+
+async def _tail(after_id: Optional[int], events: Set[str]):
+    sub, backlog = log_broadcaster.subscribe(after_id)
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        if backlog is None:  # older than the in-memory history
+            backlog = await run_in_threadpool(_replay, after_id)
+            if len(backlog) >= settings.LOG_STREAM_REPLAY_LIMIT:
+                yield "event: gap\ndata: {}\n\n"  # more was missed: reload the table
+
+        last_id = after_id if after_id is not None else -1
+        for log in backlog:
+            if log["id"] > last_id:
+                last_id = log["id"]
+                if not events or log["event"] in events:
+                    yield _sse(log)
+
+        while True:
+            if sub.overflowed and sub.queue.empty():
+                return  # too far behind (or shutting down): the client resumes by id
+            try:
+                log = await asyncio.wait_for(sub.queue.get(), settings.LOG_STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if log is None or log["id"] <= last_id:
+                continue
+            last_id = log["id"]
+            if not events or log["event"] in events:
+                yield _sse(log)
+    finally:
+        log_broadcaster.unsubscribe(sub)
+
+
+@router.post("/stream-token")
+async def stream_token(admin=Depends(require_admin)):
+    """Short-lived ?token= for one EventSource connect to /stream (fetch a new one per reconnect)."""
+    expires_in = settings.LOG_STREAM_TOKEN_SECONDS
+    token = create_access_token(
+        {"sub": str(admin.id), "role": admin.role, "scope": LOG_STREAM_SCOPE},
+        timedelta(seconds=expires_in),
+    )
+    return {"token": token, "expires_in": expires_in}
+
+
+@router.get("/stream")
+async def stream_logs(
+    request: Request,
+    event: List[str] = Query([], description="repeatable: only these events"),
+    last_event_id: int | None = Query(None, description="resume point; the Last-Event-ID header wins"),
+    admin=Depends(require_admin_stream),
+):
+    """
+    New log rows as Server-Sent Events, fed by the in-process broadcaster
+    (no database work per client), with heartbeats and Last-Event-ID resume.
+    """
+    header = request.headers.get("last-event-id")
+    after_id = int(header) if header and header.isdigit() else last_event_id
+    return StreamingResponse(
+        _tail(after_id, set(event)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
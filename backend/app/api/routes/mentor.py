@@ -5,7 +5,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.api.deps import require_mentor
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.db import models
 
 router = APIRouter(prefix="/mentor", tags=["mentor"])
@@ -30,7 +30,7 @@ def get_mentor_profile(
 
 @router.get("/students")
 def list_students_for_mentor(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     mentor_user=Depends(require_mentor),
 ):
     # For now: return all students (you can later filter by mentor)
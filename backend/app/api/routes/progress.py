@@ -3,175 +3,189 @@
 from datetime import date, datetime, timezone
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import String, and_, case, func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
-from app.db.database import get_db
+from app.db.database import get_async_db, get_async_read_db
 from app.db import models
+from app.core.config import settings
+from app.core.identity import CurrentUser, identity_cache
 from app.core.paths import TASK_FILES_DIR
+from app.services import uploads
 
 router = APIRouter(prefix="/progress", tags=["progress"])
 
 
-def _get_or_create_student(db: Session, user: models.User) -> models.Student:
-    student = db.query(models.Student).filter(models.Student.user_id == user.id).first()
+def _get_or_create_student(db: Session, user: CurrentUser) -> models.Student:
+    if user.student_id:
+        student = db.get(models.Student, user.student_id)
+    else:
+        student = db.query(models.Student).filter(models.Student.user_id == user.id).first()
     if not student:
         student = models.Student(user_id=user.id, skills="")
         db.add(student)
         db.commit()
         db.refresh(student)
+        identity_cache.invalidate_user(user.id)
     return student
 
 
 @router.get("/tasks")
-def get_tasks(
-    db: Session = Depends(get_db),
+async def get_tasks(
+    since: datetime | None = Query(None, description="only tasks whose row or status changed at/after this time"),
+    db: AsyncSession = Depends(get_async_read_db),
     user=Depends(get_current_user),
 ):
     """
     Return all tasks for internships where this student has an approved application.
     Each task includes submission status for this student.
+
+    ?since= returns only changed or added tasks; it cannot report removals (a
+    deleted task, an approval withdrawn), so clients reload the full board
+    from time to time.
     """
-    student = _get_or_create_student(db, user)
+    return await db.run_sync(_task_board, user, since)
 
-    approved_apps = (
-        db.query(models.Application)
-        .filter(
-            models.Application.student_id == student.id,
-            models.Application.status == "approved",
-        )
-        .all()
-    )
 
-    if not approved_apps:
+def _task_board(db: Session, user: CurrentUser, since: datetime | None = None) -> list:
+    # read-only (may run on the replica): no profile yet -> no tasks
+    if not user.student_id:
         return []
-
-    internship_ids = [a.internship_id for a in approved_apps]
-
-    task_rows = (
-        db.query(models.InternshipTask, models.Internship)
-        .join(models.Internship, models.InternshipTask.internship_id == models.Internship.id)
-        .filter(models.InternshipTask.internship_id.in_(internship_ids))
-        .order_by(models.InternshipTask.due_date.asc())
-        .all()
-    )
-
+    student_id = user.student_id
+    A, I, T, S = models.Application, models.Internship, models.InternshipTask, models.TaskSubmission
     today = date.today()
-    results = []
 
-    for task, internship in task_rows:
-        submission = (
-            db.query(models.TaskSubmission)
-            .filter(
-                models.TaskSubmission.task_id == task.id,
-                models.TaskSubmission.student_id == student.id,
-            )
-            .first()
-        )
-
-        if submission:
-            status_code = submission.status  # "on_time" or "late"
-            submitted_at = submission.submitted_at
-            file_url = f"/uploads/tasks/{Path(submission.file_path).name}"
-        else:
-            status_code = "not_submitted"
-            submitted_at = None
-            file_url = None
-
-        # derive label for UI
-        if status_code == "not_submitted":
-            if task.due_date < today:
-                label = "Not submitted (Overdue)"
-            else:
-                label = "Pending"
-        elif status_code == "on_time":
-            label = "Submitted (On time)"
-        else:
-            label = "Submitted (Late)"
-
-        results.append(
-            {
-                "task_id": task.id,
-                "internship_title": internship.title,
-                "title": task.title,
-                "description": task.description,
-                "due_date": task.due_date.isoformat(),
-                "status": status_code,
-                "status_label": label,
-                "submitted_at": submitted_at.isoformat() if submitted_at else None,
-                "file_url": file_url,
-            }
+    # one pass: approved applications -> tasks -> this student's submission (if any)
+    status_code = func.coalesce(S.status, "not_submitted")
+    label = case(
+        (S.id.is_(None) & (T.due_date < today), "Not submitted (Overdue)"),
+        (S.id.is_(None), "Pending"),
+        (S.status == "on_time", "Submitted (On time)"),
+        else_="Submitted (Late)",
+    )
+    stmt = (
+        select(
+            T.id, T.title, T.description, T.due_date,
+            I.title.label("internship_title"),
+            status_code.label("status"), label.label("status_label"),
+            S.submitted_at, S.file_path,
         )
+        .select_from(A)
+        .join(I, I.id == A.internship_id)
+        .join(T, T.internship_id == A.internship_id)
+        .outerjoin(S, and_(S.task_id == T.id, S.student_id == student_id))
+        .where(A.student_id == student_id, A.status == "approved")
+        .order_by(T.due_date.asc(), T.id.asc())
+    )
 
-    return results
-
-
-@router.post("/tasks/{task_id}/submit")
+    if since is not None:
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        # updated_at is CURRENT_TIMESTAMP text ("YYYY-MM-DD HH:MM:SS"): compare in
+        # that format, floored to the second, or a task changed later in the
+        # same second sorts before a bound datetime ("... HH:MM:SS.ffffff");
+        # see log_store._stored
+        updated_since = literal(since.replace(microsecond=0).isoformat(sep=" "), String)
+        stmt = stmt.where(or_(
+            T.updated_at >= updated_since,
+            S.submitted_at >= since,
+            A.approved_at >= since,  # newly approved: all of its tasks are new to the client
+            # "Pending" -> "Overdue" happens when the due date passes
+            S.id.is_(None) & (T.due_date >= since.date()) & (T.due_date < today),
+        ))
+
+    return [
+        {
+            "task_id": r.id,
+            "internship_title": r.internship_title,
+            "title": r.title,
+            "description": r.description,
+            "due_date": r.due_date.isoformat(),
+            "status": r.status,
+            "status_label": r.status_label,
+            "submitted_at": r.submitted_at.isoformat() if r.submitted_at else None,
+            "file_url": f"/uploads/tasks/{Path(r.file_path).name}" if r.file_path else None,
+        }
+        for r in db.execute(stmt)
+    ]
+
+
+@router.post("/tasks/{task_id}/submit", openapi_extra=uploads.OPENAPI_FILE_BODY)
 async def submit_task(
     task_id: int,
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(get_current_user),
 ):
     """
     Student uploads a deliverable for a specific task.
 
     Requirements:
-      - Allow ALL file types.
+      - Allow ALL file types (multipart field "file", at most TASK_FILE_MAX_BYTES).
       - Save under uploads/tasks.
       - Status = "on_time" if submitted on or before due_date (by day).
       - Status = "late" if submitted after due_date.
     """
-    student = _get_or_create_student(db, user)
-
-    task = db.query(models.InternshipTask).filter(models.InternshipTask.id == task_id).first()
-    if not task:
+    due_date = await db.scalar(select(models.InternshipTask.due_date).where(models.InternshipTask.id == task_id))
+    if due_date is None:
         raise HTTPException(status_code=404, detail="Task not found")
+    await db.rollback()  # hand the connection back while the file streams in
 
-    # Save file to disk
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-    safe_name = f"task_{task_id}_student_{student.id}_{timestamp}_{file.filename}"
-    dest_path = TASK_FILES_DIR / safe_name
+    try:
+        upload = await uploads.receive_file(request, TASK_FILES_DIR, settings.TASK_FILE_MAX_BYTES)
+    except uploads.UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
 
-    content = await file.read()
-    with open(dest_path, "wb") as f:
-        f.write(content)
+    dest_path = None
+    try:
+        student = await db.run_sync(_get_or_create_student, user)
 
-    # Determine on_time vs late based on calendar day (not hours/seconds)
-    today = date.today()
-    status_code = "on_time" if today <= task.due_date else "late"
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        safe_name = f"task_{task_id}_student_{student.id}_{timestamp}_{upload.filename}"
+        dest_path = upload.save_as(TASK_FILES_DIR / safe_name)
 
-    submission = (
-        db.query(models.TaskSubmission)
-        .filter(
-            models.TaskSubmission.task_id == task_id,
-            models.TaskSubmission.student_id == student.id,
+        # Determine on_time vs late based on calendar day (not hours/seconds)
+        today = date.today()
+        status_code = "on_time" if today <= due_date else "late"
+
+        submission = await db.scalar(
+            select(models.TaskSubmission).where(
+                models.TaskSubmission.task_id == task_id,
+                models.TaskSubmission.student_id == student.id,
+            )
         )
-        .first()
-    )
 
-    now = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
 
-    if submission:
-        submission.file_path = str(dest_path)
-        submission.submitted_at = now
-        submission.status = status_code
-    else:
-        submission = models.TaskSubmission(
-            task_id=task_id,
-            student_id=student.id,
-            file_path=str(dest_path),
-            submitted_at=now,
-            status=status_code,
-        )
-        db.add(submission)
+        if submission:
+            submission.file_path = str(dest_path)
+            submission.submitted_at = now
+            submission.status = status_code
+        else:
+            submission = models.TaskSubmission(
+                task_id=task_id,
+                student_id=student.id,
+                file_path=str(dest_path),
+                submitted_at=now,
+                status=status_code,
+            )
+            db.add(submission)
 
-    db.commit()
-    db.refresh(submission)
+        await db.commit()
+        await db.refresh(submission)
+    except BaseException:
+        upload.discard()  # no-op once renamed
+        if dest_path is not None:
+            dest_path.unlink(missing_ok=True)
+        raise
 
     return {
         "message": "Task submitted",
         "status": submission.status,
         "file_url": f"/uploads/tasks/{dest_path.name}",
+        "size": upload.size,
+        "sha256": upload.sha256,
     }
@@ -1,14 +1,20 @@
+from dataclasses import replace
 from datetime import datetime, date
-from pathlib import Path
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
-from app.db.database import get_db
+from app.db.database import AsyncSessionLocal, get_async_db, get_async_read_db, get_db
 from app.db import models
+from app.core.config import settings
+from app.core.identity import CurrentUser, identity_cache
 from app.core.paths import RESUME_DIR
+from app.services import uploads
+from app.services.precompute import refresh_students
+from app.services.skill_index import normalize_skills as _normalize_skills
 
 router = APIRouter(prefix="/students", tags=["students"])
 
@@ -16,13 +22,17 @@ router = APIRouter(prefix="/students", tags=["students"])
 # ========================================================
 # INTERNAL — ENSURE STUDENT PROFILE EXISTS
 # ========================================================
-def _get_or_create_student(db: Session, user: models.User) -> models.Student:
-    student = db.query(models.Student).filter_by(user_id=user.id).first()
+def _get_or_create_student(db: Session, user: CurrentUser) -> models.Student:
+    if user.student_id:
+        student = db.get(models.Student, user.student_id)
+    else:
+        student = db.query(models.Student).filter_by(user_id=user.id).first()
     if not student:
         student = models.Student(user_id=user.id, skills="")
         db.add(student)
         db.commit()
         db.refresh(student)
+        identity_cache.invalidate_user(user.id)
     return student
 
 
@@ -47,9 +57,16 @@ class StudentProfileUpdate(BaseModel):
 # GET PROFILE — frontend uses this to load page
 # ========================================================
 @router.get("/me/profile")
-def get_profile(db: Session = Depends(get_db), user=Depends(get_current_user)):
-    student = _get_or_create_student(db, user)
+async def get_profile(db: AsyncSession = Depends(get_async_read_db), user=Depends(get_current_user)):
+    student = await db.get(models.Student, user.student_id) if user.student_id else None
+    if student is None:
+        # no profile row yet (or not replicated yet): create / load on the primary
+        async with AsyncSessionLocal() as primary:
+            student = await primary.run_sync(_get_or_create_student, user)
+    return _profile_payload(student, user)
+
 
+def _profile_payload(student: models.Student, user: CurrentUser) -> dict:
     profile_complete = bool(student.phone and student.education and student.resume_url)
 
     return {
@@ -75,14 +92,17 @@ def get_profile(db: Session = Depends(get_db), user=Depends(get_current_user)):
 # ========================================================
 @router.put("/me/profile")
 def update_profile(payload: StudentProfileUpdate,
+                   background_tasks: BackgroundTasks,
                    db: Session = Depends(get_db),
                    user=Depends(get_current_user)):
 
     student = _get_or_create_student(db, user)
+    old_skills = _normalize_skills(student.skills)
 
-    # user
+    # user (the request's CurrentUser is a read-only snapshot)
     if payload.full_name is not None:
-        user.full_name = payload.full_name
+        db.get(models.User, user.id).full_name = payload.full_name
+        user = replace(user, full_name=payload.full_name)
 
     # student fields
     for field, value in payload.dict(exclude_unset=True).items():
@@ -90,29 +110,46 @@ def update_profile(payload: StudentProfileUpdate,
             setattr(student, field, value)
 
     db.commit()
-    return get_profile(db, user)
+    identity_cache.invalidate_user(user.id)
+
+    # materialized recommendations follow the new skill set (the response
+    # cache is keyed by the skills fingerprint and needs no invalidation)
+    if _normalize_skills(student.skills) != old_skills:
+        background_tasks.add_task(refresh_students, [student.id])
+
+    return _profile_payload(student, user)
 
 
 # ========================================================
 # UPLOAD RESUME + save file path in DB
 # ========================================================
-@router.post("/me/resume")
-async def upload_resume(file: UploadFile = File(...),
-                        db: Session = Depends(get_db),
+@router.post("/me/resume", openapi_extra=uploads.OPENAPI_FILE_BODY)
+async def upload_resume(request: Request,
+                        db: AsyncSession = Depends(get_async_db),
                         user=Depends(get_current_user)):
-
-    student = _get_or_create_student(db, user)
-
-    RESUME_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    filename = f"resume_{student.id}_{timestamp}_{file.filename}"
-    path = RESUME_DIR / filename
-
-    with open(path, "wb") as f:
-        f.write(await file.read())
-
-    student.resume_url = f"/uploads/resumes/{filename}"
-    db.commit()
-
-    return {"message": "Resume Uploaded", "resume_url": student.resume_url}
+    """
+    Multipart field "file", streamed to disk (see app.services.uploads);
+    larger than RESUME_MAX_BYTES -> 413.
+    """
+    # the body is read before any query: no pooled connection is held while it arrives
+    try:
+        upload = await uploads.receive_file(request, RESUME_DIR, settings.RESUME_MAX_BYTES)
+    except uploads.UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    path = None
+    try:
+        student = await db.run_sync(_get_or_create_student, user)
+        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        filename = f"resume_{student.id}_{timestamp}_{upload.filename}"
+        path = upload.save_as(RESUME_DIR / filename)
+        student.resume_url = f"/uploads/resumes/{filename}"
+        await db.commit()
+    except BaseException:
+        upload.discard()  # no-op once renamed
+        if path is not None:
+            path.unlink(missing_ok=True)
+        raise
+
+    return {"message": "Resume Uploaded", "resume_url": student.resume_url, "size": upload.size, "sha256": upload.sha256}
 
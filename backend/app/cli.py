@@ -0,0 +1,144 @@
+# backend/app/cli.py
+"""
+Offline jobs, run from backend/:
+
+    python -m app.cli recommendations              # all students
+    python -m app.cli recommendations --student 4 --student 9 --top-n 100
+    python -m app.cli replica-sync --interval 5     # local READ_DATABASE_URL copy
+    python -m app.cli import-internships feed.csv --upsert
+    python -m app.cli analytics-rebuild             # recompute admin analytics
+    python -m app.cli archive-logs --older-than-days 180
+"""
+
+import argparse
+import time
+
+from app.core.config import settings
+from app.db.database import SessionLocal, engine
+from app.db.bootstrap import bootstrap_schema
+from app.services.skill_index import ensure_index
+
+
+def cmd_recommendations(args) -> None:
+    from app.services.precompute import recompute_students
+
+    started = time.perf_counter()
+    bootstrap_schema(engine)
+    with SessionLocal() as db:
+        ensure_index(db)
+        done = recompute_students(db, args.student or None, args.top_n)
+    print(f"recommendations: {done} students in {time.perf_counter() - started:.2f}s")
+
+
+def cmd_import_internships(args) -> None:
+    from app.services.catalog_import import detect_format, import_internships
+    from app.services.precompute import refresh_after_catalog_change
+    from app.services.skill_index import get_catalog_version
+
+    fmt = detect_format(args.path, args.format)
+    started = time.perf_counter()
+    bootstrap_schema(engine)
+    with SessionLocal() as db, open(args.path, encoding="utf-8-sig", newline="") as lines:
+        ensure_index(db)
+        from_version = get_catalog_version(db)
+        report = import_internships(db, lines, fmt, upsert=args.upsert, batch_size=args.batch_size)
+        to_version = get_catalog_version(db)
+    print(f"import: {report['inserted']} inserted, {report['updated']} updated, "
+          f"{report['error_count']} errors in {time.perf_counter() - started:.2f}s")
+    for err in report["errors"]:
+        print(f"  line {err['line']}: {err['error']}")
+
+    if report["ids"] and not args.no_refresh:
+        started = time.perf_counter()
+        refresh_after_catalog_change(report["ids"], from_version, to_version)
+        print(f"recommendations refreshed in {time.perf_counter() - started:.2f}s")
+
+
+def cmd_analytics_rebuild(args) -> None:
+    from app.services.analytics import rebuild
+
+    started = time.perf_counter()
+    bootstrap_schema(engine)
+    with engine.begin() as conn:
+        stats = rebuild(conn)
+    print(f"analytics: {stats['internships']} internships, {stats['approved']} approvals, "
+          f"{stats['submission_weeks']} submission weeks in {time.perf_counter() - started:.2f}s")
+
+
+def cmd_archive_logs(args) -> None:
+    from app.services.log_store import archive_logs
+
+    started = time.perf_counter()
+    bootstrap_schema(engine)
+    stats = archive_logs(engine, args.older_than_days, args.file_rows)
+    print(f"archive-logs: {stats['rows']} rows older than {stats['cutoff']} "
+          f"into {stats['files']} files in {time.perf_counter() - started:.2f}s")
+
+
+def cmd_replica_sync(args) -> None:
+    """
+    Local stand-in for replication: copy the primary SQLite file onto the
+    READ_DATABASE_URL file with the online backup API, once or every N seconds.
+    """
+    import sqlite3
+
+    from sqlalchemy.engine import make_url
+
+    if not settings.READ_DATABASE_URL:
+        raise SystemExit("READ_DATABASE_URL is not set")
+    source = make_url(settings.DATABASE_URL)
+    target = make_url(settings.READ_DATABASE_URL)
+    if source.get_backend_name() != "sqlite" or target.get_backend_name() != "sqlite":
+        raise SystemExit("replica-sync only copies SQLite files")
+
+    while True:
+        started = time.perf_counter()
+        src, dst = sqlite3.connect(source.database), sqlite3.connect(target.database)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
+        print(f"replica-sync: {source.database} -> {target.database} "
+              f"in {time.perf_counter() - started:.2f}s")
+        if not args.interval:
+            return
+        time.sleep(args.interval)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("recommendations", help="materialize top-N matches per student")
+    p.add_argument("--student", type=int, action="append", help="only these student ids")
+    p.add_argument("--top-n", type=int, default=None, help="rows per student (default: settings)")
+    p.set_defaults(func=cmd_recommendations)
+
+    p = sub.add_parser("import-internships", help="bulk-load internships from CSV / JSONL")
+    p.add_argument("path")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="default: from the file extension")
+    p.add_argument("--upsert", action="store_true", help="update rows matching (company, title)")
+    p.add_argument("--batch-size", type=int, default=1000)
+    p.add_argument("--no-refresh", action="store_true",
+                   help="skip recomputing materialized recommendations")
+    p.set_defaults(func=cmd_import_internships)
+
+    p = sub.add_parser("analytics-rebuild", help="recompute the admin analytics aggregates")
+    p.set_defaults(func=cmd_analytics_rebuild)
+
+    p = sub.add_parser("archive-logs", help="move old application_logs rows to gzip archives")
+    p.add_argument("--older-than-days", type=int, default=settings.LOG_RETENTION_DAYS)
+    p.add_argument("--file-rows", type=int, default=settings.LOG_ARCHIVE_FILE_ROWS)
+    p.set_defaults(func=cmd_archive_logs)
+
+    p = sub.add_parser("replica-sync", help="refresh the local SQLite read replica")
+    p.add_argument("--interval", type=float, default=0, help="repeat every N seconds (0 = once)")
+    p.set_defaults(func=cmd_replica_sync)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,72 @@ class Settings(BaseSettings):
 
     # Using SQLite for local dev
     DATABASE_URL: str = "sqlite:///./internship.db"
+    # async driver URL for get_async_db; derived from DATABASE_URL when unset
+    # (sqlite -> sqlite+aiosqlite, postgresql -> postgresql+asyncpg)
+    ASYNC_DATABASE_URL: str | None = None
+
+    # optional read replica for GET endpoints (get_read_db / get_async_read_db)
+    READ_DATABASE_URL: str | None = None
+    READ_YOUR_WRITES_SECONDS: int = 10     # after a mutation, reads stay on the primary
+
+    # connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = False
+
+    # SQLite pragmas applied to every connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 65_536          # page cache per connection
+    SQLITE_MMAP_SIZE: int = 268_435_456         # bytes
 
     JWT_SECRET_KEY: str = "supersecretkey"  # change in production
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    # bcrypt: existing hashes with a different cost are rehashed on login
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4         # dedicated hashing threads
+    PASSWORD_HASH_MAX_PENDING: int = 64    # running + queued; beyond -> 503
+
+    # deps.get_current_user identity cache (per worker)
+    IDENTITY_CACHE_SIZE: int = 10_000
+    IDENTITY_CACHE_TTL_SECONDS: int = 60
+
+    # /internships/recommendations response cache
+    RECS_CACHE_SIZE: int = 2048          # max entries
+    RECS_CACHE_MAX_ROWS: int = 200_000   # max cached result rows across entries
+    RECS_CACHE_TTL_SECONDS: int = 300
+
+    # student_recommendations: rows materialized per student
+    RECS_PRECOMPUTE_TOP_N: int = 50
+
+    # ApplicationLog writer (app.services.audit_log)
+    AUDIT_LOG_MODE: str = "async"              # "sync": rows go into the request transaction
+    AUDIT_LOG_BATCH_SIZE: int = 500            # rows per bulk insert
+    AUDIT_LOG_FLUSH_SECONDS: float = 0.5       # max delay before a partial batch is written
+    AUDIT_LOG_QUEUE_SIZE: int = 10_000         # queued rows; beyond -> callers wait, then write inline
+    AUDIT_LOG_PUT_TIMEOUT_SECONDS: float = 1.0
+
+    # /admin/logs/stream (Server-Sent Events)
+    LOG_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    LOG_STREAM_CLIENT_BUFFER: int = 1000     # queued events per client; beyond -> client reconnects
+    LOG_STREAM_HISTORY: int = 5000           # recent events kept for Last-Event-ID resume
+    LOG_STREAM_REPLAY_LIMIT: int = 1000      # rows replayed from the database on resume
+    LOG_STREAM_TOKEN_SECONDS: int = 60       # lifetime of the ?token= issued for one connect
+
+    # streamed uploads (app.services.uploads)
+    UPLOAD_CHUNK_BYTES: int = 1_048_576        # written + hashed per threadpool call
+    RESUME_MAX_BYTES: int = 10_485_760         # 10 MiB; larger -> 413
+    TASK_FILE_MAX_BYTES: int = 52_428_800      # 50 MiB
+
+    # application_logs retention (python -m app.cli archive-logs)
+    LOG_RETENTION_DAYS: int = 180          # older rows move to compressed archives
+    LOG_ARCHIVE_FILE_ROWS: int = 20_000    # rows per archive file
+
     model_config = {
         "env_file": ".env"
     }
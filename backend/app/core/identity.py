@@ -0,0 +1,88 @@
+# backend/app/core/identity.py
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Set, Tuple
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """
+    Snapshot of the authenticated user returned by deps.get_current_user.
+    Read-only: routes that modify the user load the ORM row explicitly.
+    """
+    id: int
+    email: str
+    full_name: str
+    role: str
+    student_id: int | None = None
+    mentor_id: int | None = None
+
+
+class IdentityCache:
+    """
+    Bounded LRU of CurrentUser keyed by (user id, token exp).
+    An entry never outlives its token or IDENTITY_CACHE_TTL_SECONDS; the JWT
+    itself is still decoded and verified on every request.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Tuple[int, int], Tuple[float, CurrentUser]]" = OrderedDict()
+        self._by_user: Dict[int, Set[Tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def _drop(self, key) -> None:
+        self._data.pop(key, None)
+        keys = self._by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[key[0]]
+
+    def get(self, user_id: int, exp: int) -> CurrentUser | None:
+        key = (user_id, exp)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, exp: int, user: CurrentUser) -> None:
+        if self.maxsize <= 0:
+            return
+        key = (user.id, exp)
+        expires = min(time.time() + self.ttl, exp)
+        with self._lock:
+            self._data[key] = (expires, user)
+            self._data.move_to_end(key)
+            self._by_user.setdefault(user.id, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._drop(next(iter(self._data)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Call after changing a user row or its student/mentor profile."""
+        with self._lock:
+            for key in list(self._by_user.get(user_id, ())):
+                self._drop(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+identity_cache = IdentityCache(
+    maxsize=settings.IDENTITY_CACHE_SIZE,
+    ttl=settings.IDENTITY_CACHE_TTL_SECONDS,
+)
@@ -1,5 +1,6 @@
 # backend/app/core/paths.py
 
+import time
 from pathlib import Path
 
 # This file is in backend/app/core/paths.py
@@ -18,7 +19,28 @@ UPLOADS_DIR = BASE_DIR / "uploads"
 RESUME_DIR = UPLOADS_DIR / "resumes"
 TASK_FILES_DIR = UPLOADS_DIR / "tasks"
 
-# ensure folders exist
-UPLOADS_DIR.mkdir(exist_ok=True)
-RESUME_DIR.mkdir(exist_ok=True)
-TASK_FILES_DIR.mkdir(exist_ok=True)
+# gzip NDJSON archives of old application_logs rows (not served statically)
+LOG_ARCHIVE_DIR = BASE_DIR / "archive" / "logs"
+
+# NDJSON batches the audit log writer could not insert yet (app.services.audit_log)
+LOG_SPOOL_DIR = BASE_DIR / "archive" / "log-spool"
+
+
+# uploads being received are staged next to their destination under this
+# name (app.services.uploads) and renamed into place once complete
+PARTIAL_UPLOAD_PREFIX = ".upload-"
+PARTIAL_UPLOAD_SUFFIX = ".part"
+PARTIAL_UPLOAD_MAX_AGE_SECONDS = 3600
+
+
+def ensure_upload_dirs() -> None:
+    """Called once at startup (app lifespan); also drops partial uploads left by a crash."""
+    cutoff = time.time() - PARTIAL_UPLOAD_MAX_AGE_SECONDS
+    for folder in (UPLOADS_DIR, RESUME_DIR, TASK_FILES_DIR):
+        folder.mkdir(parents=True, exist_ok=True)
+        for partial in folder.glob(f"{PARTIAL_UPLOAD_PREFIX}*{PARTIAL_UPLOAD_SUFFIX}"):
+            try:
+                if partial.stat().st_mtime < cutoff:  # recent ones may be in flight (other workers)
+                    partial.unlink()
+            except FileNotFoundError:
+                pass
@@ -1,22 +1,74 @@
 # backend/app/core/security.py
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min == max == default: hashes made with any other cost report needs_update
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+# ===== HASHING POOL =====
+# bcrypt is CPU-bound (and releases the GIL), so it gets its own small pool
+# instead of competing with request handlers for the server threadpool.
+# Callers await the pool from the event loop, so queued hashes hold no
+# thread; admission is capped: past PASSWORD_HASH_MAX_PENDING they fail fast.
 
+class PasswordHashingBusy(Exception):
+    """Too many hash/verify calls in flight; callers should answer 503."""
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+
+_hash_pool = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_hash_slots = threading.BoundedSemaphore(
+    max(settings.PASSWORD_HASH_MAX_PENDING, settings.PASSWORD_HASH_WORKERS)
+)
+
+
+async def _run_hashing(fn, *args):
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        future = _hash_pool.submit(fn, *args)
+    except BaseException:
+        _hash_slots.release()
+        raise
+    # the slot is held until the hash finishes, even if the request is cancelled
+    future.add_done_callback(lambda _: _hash_slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hashing(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    (valid, new_hash). new_hash is set when the stored hash needs_update
+    (e.g. BCRYPT_ROUNDS changed) and should replace the stored one.
+    """
+    return await _run_hashing(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
+    return await _run_hashing(pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -0,0 +1,69 @@
+# backend/app/db/bootstrap.py
+"""
+Schema bootstrap, run once per process (app lifespan, CLI, benchmarks).
+
+The database keeps a fingerprint of the declared schema: tables, columns,
+indexes, the migration list and the FTS DDL. When it matches the code,
+startup issues no DDL at all -- no create_all or migrations, only the
+fingerprint SELECT and the (read-only) check for indexes dropped by hand.
+"""
+
+import hashlib
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.db.database import Base  # first: database.py registers the models
+from app.db import models
+from app.db.migrations import MIGRATIONS, report_missing_indexes, run_migrations
+from app.services import search
+
+
+def schema_fingerprint() -> str:
+    parts = []
+    for table in Base.metadata.sorted_tables:
+        parts.append(f"table:{table.name}")
+        parts += [f"{c.name}:{c.type}:{c.nullable}:{c.primary_key}" for c in table.columns]
+        parts += sorted(
+            f"index:{ix.name}:{','.join(c.name for c in ix.columns)}:{ix.unique}"
+            for ix in table.indexes
+        )
+    parts += [f"migration:{version}:{name}" for version, name, _ in MIGRATIONS]
+    parts += [" ".join(ddl.split()) for ddl in search.FTS_DDL]
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+
+def stored_fingerprint(engine: Engine) -> str | None:
+    try:
+        with engine.connect() as conn:
+            return conn.execute(
+                select(models.SchemaState.fingerprint).where(models.SchemaState.id == 1)
+            ).scalar()
+    except (OperationalError, ProgrammingError):  # fresh database: no schema_state yet
+        return None
+
+
+def bootstrap_schema(engine: Engine) -> bool:
+    """
+    Bring the schema up to date; returns True when DDL / migrations ran.
+    The fingerprint is only recorded once no declared index is missing, so a
+    partial schema keeps being checked (and reported) on every start.
+    """
+    expected = schema_fingerprint()
+    if stored_fingerprint(engine) == expected:
+        search.ensure_fts(engine, create=False)
+        report_missing_indexes(engine)
+        return False
+
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    # FTS5 keyword index (falls back to substring search when unavailable)
+    search.ensure_fts(engine)
+
+    if not report_missing_indexes(engine):
+        S = models.SchemaState
+        with engine.begin() as conn:
+            conn.execute(delete(S))
+            conn.execute(insert(S).values(id=1, fingerprint=expected))
+    return True
@@ -1,14 +1,133 @@
-from sqlalchemy import create_engine
+import time
+
+from starlette.requests import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+
+# ===== ENGINE SETUP =====
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(database_url: str) -> dict:
+    """create_engine kwargs for DATABASE_URL (SQLite or Postgres)."""
+    url = make_url(database_url)
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    if not _is_memory_sqlite(url):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        )
+    return options
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record=None) -> None:
+    """
+    WAL lets readers proceed while apply/approve write; busy_timeout waits
+    for the writer lock instead of failing with "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    finally:
+        cursor.close()
+
+
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_database_url(database_url: str) -> str:
+    """Same database, async driver (sqlite -> aiosqlite, postgresql -> asyncpg)."""
+    url = make_url(database_url)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {url.get_backend_name()!r}")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _replica_pragmas(dbapi_connection, connection_record=None) -> None:
+    apply_sqlite_pragmas(dbapi_connection, connection_record)
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA query_only=ON")  # mutations belong on the primary
+    finally:
+        cursor.close()
+
+
+def _make_engines(database_url: str, async_url: str | None = None, replica: bool = False):
+    """(sync engine, async engine) for one database."""
+    async_url = async_url or async_database_url(database_url)
+    sync_engine = create_engine(database_url, **engine_options(database_url))
+    async_engine = create_async_engine(async_url, **engine_options(async_url))
+    pragmas = _replica_pragmas if replica else apply_sqlite_pragmas
+    for target in (sync_engine, async_engine.sync_engine):
+        if target.dialect.name == "sqlite":
+            event.listen(target, "connect", pragmas)
+    return sync_engine, async_engine
+
+
+engine, async_engine = _make_engines(SQLALCHEMY_DATABASE_URL, settings.ASYNC_DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+# ===== READ REPLICA =====
+# GET endpoints read through get_read_db / get_async_read_db. Without
+# READ_DATABASE_URL they fall back to the primary. Sessions carry
+# info["replica"] so callers can pick matching sync / async factories.
+REPLICA_ENABLED = bool(settings.READ_DATABASE_URL)
+
+if REPLICA_ENABLED:
+    read_engine, async_read_engine = _make_engines(settings.READ_DATABASE_URL, replica=True)
+else:
+    read_engine, async_read_engine = engine, async_engine
+
+ReadSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=read_engine, info={"replica": REPLICA_ENABLED}
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    async_read_engine, autoflush=False, expire_on_commit=False, info={"replica": REPLICA_ENABLED}
+)
+
+# read-your-writes: after a successful mutation the client gets a short-lived
+# cookie; while it is valid its reads go to the primary (works across workers)
+READ_YOUR_WRITES_COOKIE = "rw_until"
+
+
+def remember_write(response) -> None:
+    if not REPLICA_ENABLED:
+        return
+    window = settings.READ_YOUR_WRITES_SECONDS
+    response.set_cookie(
+        READ_YOUR_WRITES_COOKIE,
+        f"{time.time() + window:.3f}",
+        max_age=window,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def _reads_from_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
 
 Base = declarative_base()
 
@@ -19,6 +138,37 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    """
+    AsyncSession for hot read paths. Sync helpers (ORM query code shared with
+    the sync routes) can be reused through `await db.run_sync(fn, ...)`.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def read_session_factory(request: Request):
+    """Session factory for this request's reads (primary inside the read-your-writes window)."""
+    return SessionLocal if _reads_from_primary(request) else ReadSessionLocal
+
+
+def get_read_db(request: Request):
+    db = read_session_factory(request)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    factory = AsyncSessionLocal if _reads_from_primary(request) else AsyncReadSessionLocal
+    async with factory() as db:
+        yield db
+
 # ✅ VERY IMPORTANT
+# models must be registered on Base before the schema bootstrap
+# (app.db.bootstrap, run from the app lifespan / CLI)
 from app.db import models
-Base.metadata.create_all(bind=engine)
+from app.services import skill_index  # registers internship index listeners
+from app.services import analytics  # registers analytics aggregate listeners
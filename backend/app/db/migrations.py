@@ -0,0 +1,170 @@
+# backend/app/db/migrations.py
+"""
+Versioned data/schema migrations, applied once per database after
+Base.metadata.create_all (which only creates missing tables); both are
+driven by app.db.bootstrap.
+Applied versions are recorded in schema_migrations.
+"""
+
+from typing import Callable, List, Tuple
+
+from sqlalchemy import and_, delete, func, inspect, insert, select, update
+from sqlalchemy.engine import Connection, Engine
+
+from app.db.database import Base  # first: database.py registers the models
+from app.db import models
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = []
+
+
+def migration(version: int, name: str):
+    def register(fn):
+        MIGRATIONS.append((version, name, fn))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return fn
+    return register
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """Apply pending migrations in order, each in its own transaction."""
+    with engine.begin() as conn:
+        applied = set(conn.execute(select(models.SchemaMigration.version)).scalars())
+
+    done = []
+    for version, name, fn in MIGRATIONS:
+        if version in applied:
+            continue
+        with engine.begin() as conn:
+            fn(conn)
+            conn.execute(insert(models.SchemaMigration).values(version=version, name=name))
+        print(f"migration {version} ({name}) applied")
+        done.append(version)
+    return done
+
+
+def missing_indexes(engine: Engine) -> List[str]:
+    """Indexes declared on the models but absent from the database."""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        missing += [f"{table.name}.{ix.name}" for ix in table.indexes if ix.name not in present]
+    return sorted(missing)
+
+
+def report_missing_indexes(engine: Engine) -> List[str]:
+    missing = missing_indexes(engine)
+    if missing:
+        print(f"WARNING: {len(missing)} missing index(es): {', '.join(missing)}")
+    return missing
+
+
+# ======================= MIGRATIONS ======================= #
+
+@migration(1, "normalized_skills")
+def _normalized_skills(conn: Connection) -> None:
+    """
+    Backfill skills / student_skills / internship_skills from the
+    comma-separated strings, and internship_terms from the indexed fields.
+    """
+    from app.services.skill_index import (
+        bump_catalog_version,
+        write_internship_index,
+        write_student_skills,
+    )
+
+    S, I = models.Student, models.Internship
+    write_student_skills(conn, conn.execute(select(S.id, S.skills)).all())
+    write_internship_index(
+        conn,
+        conn.execute(
+            select(I.id, I.title, I.company, I.industry, I.description, I.required_skills)
+        ).all(),
+    )
+    bump_catalog_version(conn)
+
+
+def _dedupe(conn: Connection, table, keys, keeper_order) -> dict:
+    """
+    Delete duplicate rows per `keys`, keeping the first by `keeper_order`.
+    Returns {deleted id: kept id}.
+    """
+    dup_groups = (
+        select(*keys).group_by(*keys).having(func.count() > 1).subquery()
+    )
+    rows = conn.execute(
+        select(table.c.id, *keys)
+        .join(dup_groups, and_(*[k == dup_groups.c[k.name] for k in keys]))
+        .order_by(*keys, *keeper_order)
+    ).all()
+
+    replaced, kept = {}, {}
+    for row in rows:
+        group = tuple(row[1:])
+        if group in kept:
+            replaced[row.id] = kept[group]
+        else:
+            kept[group] = row.id
+    if replaced:
+        conn.execute(delete(table).where(table.c.id.in_(list(replaced))))
+    return replaced
+
+
+@migration(2, "composite_indexes")
+def _composite_indexes(conn: Connection) -> None:
+    """
+    Lookup indexes plus unique (student_id, internship_id) on applications and
+    (task_id, student_id) on task_submissions. Existing duplicates are
+    collapsed first: approved application / newest submission wins.
+    """
+    A, S, L = (models.Application.__table__, models.TaskSubmission.__table__,
+               models.ApplicationLog.__table__)
+
+    replaced = _dedupe(
+        conn, A, [A.c.student_id, A.c.internship_id],
+        [(A.c.status == "approved").desc(), A.c.id.desc()],
+    )
+    for old_id, new_id in replaced.items():
+        conn.execute(update(L).where(L.c.application_id == old_id).values(application_id=new_id))
+    if replaced:
+        print(f"  applications: merged {len(replaced)} duplicate(s)")
+
+    replaced = _dedupe(conn, S, [S.c.task_id, S.c.student_id], [S.c.id.desc()])
+    if replaced:
+        print(f"  task_submissions: merged {len(replaced)} duplicate(s)")
+
+    for table in (A, S, models.InternshipTask.__table__, L):
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+@migration(3, "analytics_aggregates")
+def _analytics_aggregates(conn: Connection) -> None:
+    """Backfill the analytics_* tables (create_all has created them empty)."""
+    from app.services.analytics import rebuild
+
+    stats = rebuild(conn)
+    print(f"  analytics: {stats['internships']} internship(s), {stats['approved']} approval(s)")
+
+
+@migration(4, "log_filter_indexes")
+def _log_filter_indexes(conn: Connection) -> None:
+    """Per-filter (column, created_at, id) indexes for the /admin/logs keyset pages."""
+    for index in models.ApplicationLog.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+
+@migration(5, "task_updated_at")
+def _task_updated_at(conn: Connection) -> None:
+    """internship_tasks.updated_at (create_all does not add columns to existing tables)."""
+    columns = {c["name"] for c in inspect(conn).get_columns("internship_tasks")}
+    if "updated_at" not in columns:
+        T = models.InternshipTask.__table__
+        # type rendered for this dialect (DATETIME / TIMESTAMP WITH TIME ZONE);
+        # SQLite: ADD COLUMN cannot take a CURRENT_TIMESTAMP default, so backfill
+        column_type = T.c.updated_at.type.compile(dialect=conn.dialect)
+        conn.exec_driver_sql(f"ALTER TABLE internship_tasks ADD COLUMN updated_at {column_type}")
+        conn.execute(update(T).values(updated_at=func.now()))
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Text,
     Date,
     DateTime,
+    Index,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -124,6 +125,89 @@ class Internship(Base):
     )
 
 
+# ===================== SKILL VOCABULARY ===================== #
+class Skill(Base):
+    """Canonical lowercase skill names shared by students and internships."""
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)
+
+
+class StudentSkill(Base):
+    __tablename__ = "student_skills"
+
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_student_skills_skill", "skill_id", "student_id"),
+    )
+
+
+class InternshipSkill(Base):
+    __tablename__ = "internship_skills"
+
+    internship_id = Column(Integer, ForeignKey("internships.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_internship_skills_skill", "skill_id", "internship_id"),
+    )
+
+
+# ===================== INTERNSHIP TERM INDEX ===================== #
+class InternshipTerm(Base):
+    """
+    Inverted index of the recommendation search text: one row per
+    lowercase whitespace-separated word of an internship's searchable text.
+    """
+    __tablename__ = "internship_terms"
+
+    id = Column(Integer, primary_key=True, index=True)
+    internship_id = Column(
+        Integer, ForeignKey("internships.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    token = Column(String, nullable=False, index=True)
+
+
+# ===================== CATALOG VERSION ===================== #
+class CatalogVersion(Base):
+    """Single row, bumped whenever an internship is created / edited / deleted."""
+    __tablename__ = "catalog_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+# ===================== PRECOMPUTED RECOMMENDATIONS ===================== #
+class StudentRecommendation(Base):
+    """Top-N internship matches per student, written by app.cli recommendations."""
+    __tablename__ = "student_recommendations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
+    internship_id = Column(Integer, ForeignKey("internships.id", ondelete="CASCADE"), nullable=False)
+    rank = Column(Integer, nullable=False)  # 1 = best
+    match = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_student_recommendations_student_rank", "student_id", "rank"),
+        Index("ix_student_recommendations_internship", "internship_id"),
+    )
+
+
+class StudentRecommendationRun(Base):
+    """When / against which catalog + skills a student's rows were computed."""
+    __tablename__ = "student_recommendation_runs"
+
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    catalog_version = Column(Integer, nullable=False, index=True)
+    skills_fingerprint = Column(String, nullable=False)
+    total = Column(Integer, nullable=False, default=0)  # eligible internships (may exceed stored rows)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 # ===================== APPLICATION ===================== #
 class Application(Base):
     __tablename__ = "applications"
@@ -153,6 +237,12 @@ class Application(Base):
     # admin notes / comments
     remarks_admin = Column(Text, default="")
 
+    __table_args__ = (
+        # one application per student and internship; also serves student lookups
+        Index("uq_applications_student_internship", "student_id", "internship_id", unique=True),
+        Index("ix_applications_internship_status", "internship_id", "status"),
+    )
+
     student = relationship("Student", back_populates="applications")
     internship = relationship("Internship", back_populates="applications")
 
@@ -181,6 +271,12 @@ class InternshipTask(Base):
     description = Column(Text, default="")
     due_date = Column(Date, nullable=False)
     order_index = Column(Integer, default=0)
+    # bumped on every change (/progress/tasks?since=)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_internship_tasks_internship_due", "internship_id", "due_date"),
+    )
 
     internship = relationship("Internship", back_populates="tasks")
     submissions = relationship(
@@ -203,6 +299,10 @@ class TaskSubmission(Base):
     status = Column(String, default="on_time")  # on_time / late
     feedback = Column(Text, default="")
 
+    __table_args__ = (
+        Index("uq_task_submissions_task_student", "task_id", "student_id", unique=True),
+    )
+
     task = relationship("InternshipTask", back_populates="submissions")
     student = relationship("Student")
 
@@ -221,3 +321,78 @@ class ApplicationLog(Base):
     message = Column(Text, default="")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # keyset order is (created_at, id) desc; each filter has its own index
+    __table_args__ = (
+        Index("ix_application_logs_created", "created_at", "id"),
+        Index("ix_application_logs_event_created", "event", "created_at", "id"),
+        Index("ix_application_logs_student_created", "student_id", "created_at", "id"),
+        Index("ix_application_logs_internship_created", "internship_id", "created_at", "id"),
+    )
+
+
+class LogArchive(Base):
+    """One gzip NDJSON file of application_logs rows moved out by the retention job."""
+    __tablename__ = "log_archives"
+
+    id = Column(Integer, primary_key=True, index=True)
+    file_name = Column(String, unique=True, nullable=False)
+    rows = Column(Integer, nullable=False)
+    first_created = Column(DateTime(timezone=True), nullable=False)
+    last_created = Column(DateTime(timezone=True), nullable=False, index=True)
+    first_id = Column(Integer, nullable=False)
+    last_id = Column(Integer, nullable=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+# ===================== ANALYTICS AGGREGATES ===================== #
+# Maintained in the writing transaction by app.services.analytics (ORM
+# listeners + explicit calls from bulk Core paths); rebuilt by
+# `python -m app.cli analytics-rebuild`.
+class InternshipStatusCount(Base):
+    """Applications per internship and status."""
+    __tablename__ = "analytics_internship_status"
+
+    internship_id = Column(Integer, ForeignKey("internships.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class SubmissionWeek(Base):
+    """On-time / late task submissions per internship and week (Monday)."""
+    __tablename__ = "analytics_submission_weeks"
+
+    week_start = Column(Date, primary_key=True)
+    internship_id = Column(Integer, ForeignKey("internships.id", ondelete="CASCADE"), primary_key=True)
+    on_time = Column(Integer, nullable=False, default=0)
+    late = Column(Integer, nullable=False, default=0)
+
+
+class ApprovalTimeStat(Base):
+    """Time from applied_at to approved_at of the currently approved applications."""
+    __tablename__ = "analytics_approval_times"
+
+    internship_id = Column(Integer, ForeignKey("internships.id", ondelete="CASCADE"), primary_key=True)
+    approved = Column(Integer, nullable=False, default=0)
+    total_seconds = Column(Integer, nullable=False, default=0)
+    within_day = Column(Integer, nullable=False, default=0)
+    within_week = Column(Integer, nullable=False, default=0)
+
+
+# ===================== SCHEMA MIGRATIONS ===================== #
+class SchemaMigration(Base):
+    """Versions applied by app.db.migrations."""
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class SchemaState(Base):
+    """Single row: schema fingerprint the database was last bootstrapped with."""
+    __tablename__ = "schema_state"
+
+    id = Column(Integer, primary_key=True)
+    fingerprint = Column(String, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -5,3 +5,13 @@ from pydantic import BaseModel
 class Token(BaseModel):
     access_token: str
     token_type: str
+
+
+class InternshipCreate(BaseModel):
+    """POST /admin/internships body and one row of an internship import."""
+    title: str
+    company: str
+    location: str | None = None
+    skills: str | None = None
+    industry: str | None = None
+    description: str | None = None
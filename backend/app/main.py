@@ -1,27 +1,88 @@
 # backend/app/main.py
 
 import os
+import time
+from contextlib import asynccontextmanager
+from importlib import import_module
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse
 
-from app.db.database import Base, engine
-from app.api.routes import (
-    auth, students, internships, applications,
-    progress, mentor, admin, chatbot
+# ==== Startup timing: settings / engine are measured here, at import ====
+_t0 = time.perf_counter()
+from app.core.config import settings  # noqa: F401  (timed phase)
+_t_settings = time.perf_counter()
+from app.db.database import engine, SessionLocal, remember_write
+_t_engine = time.perf_counter()
+
+from app.core.paths import FRONTEND_DIR, UPLOADS_DIR, ensure_upload_dirs
+
+startup_timings = {  # ms per phase
+    "settings": round((_t_settings - _t0) * 1000, 1),
+    "engine": round((_t_engine - _t_settings) * 1000, 1),
+}
+
+# imported by include_routers() at import time, in this order
+ROUTERS = (
+    "auth", "students", "internships", "applications",
+    "progress", "mentor", "admin", "logs", "chatbot",
 )
 
-# ==== Paths ====
-BASE_DIR      = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-FRONTEND_DIR  = os.path.join(BASE_DIR, "frontend")
-UPLOADS_DIR   = os.path.join(BASE_DIR, "uploads")
 
-os.makedirs(UPLOADS_DIR, exist_ok=True)
-Base.metadata.create_all(bind=engine)
+# ==== Startup stages ====
+def bootstrap() -> None:
+    """Upload folders + schema check / DDL + recommendation index backfill."""
+    from app.db.bootstrap import bootstrap_schema
+    from app.services.skill_index import ensure_index
+
+    started = time.perf_counter()
+    ensure_upload_dirs()
+    startup_timings["schema_changed"] = bootstrap_schema(engine)
+    # backfill the recommendation index for internships created before it existed
+    with SessionLocal() as db:
+        ensure_index(db)
+    startup_timings["schema"] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def include_routers(app: FastAPI) -> None:
+    started = time.perf_counter()
+    for name in ROUTERS:
+        app.include_router(import_module(f"app.api.routes.{name}").router)
+    startup_timings["routers"] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def startup() -> None:
+    """Schema / bootstrap work before serving (lifespan); safe to call more than once."""
+    if "schema" not in startup_timings:
+        bootstrap()
+
+    phases = ("settings", "engine", "schema", "routers")
+    startup_timings["total"] = round(sum(startup_timings[p] for p in phases), 1)
+    print(
+        "startup: "
+        + " | ".join(f"{p} {startup_timings[p]}ms" for p in (*phases, "total"))
+        + (" (schema updated)" if startup_timings["schema_changed"] else " (schema current)")
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from app.services.audit_log import audit_log
+    from app.services.log_events import log_broadcaster
+
+    startup()
+    audit_log.start()
+    try:
+        yield
+    finally:
+        audit_log.close()  # queued log rows are written (and published) before exit
+        log_broadcaster.close()  # ends open /admin/logs/stream responses
+
 
 # ==== App ====
-app = FastAPI(title="Internship Portal API")
+app = FastAPI(title="Internship Portal API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,9 +92,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# ==== Read-your-writes (only active with READ_DATABASE_URL) ====
+@app.middleware("http")
+async def read_your_writes(request, call_next):
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        remember_write(response)
+    return response
+
 # ==== Static Serving (fixed) ====
+# uploads/ is created by the lifespan, so it need not exist at import
 app.mount("/static",  StaticFiles(directory=os.path.join(FRONTEND_DIR, "assets")), name="static")
-app.mount("/uploads", StaticFiles(directory=UPLOADS_DIR), name="uploads")
+app.mount("/uploads", StaticFiles(directory=UPLOADS_DIR, check_dir=False), name="uploads")
+
+
+# declared before the /{page} catch-all, which would otherwise shadow it
+@app.get("/health")
+def health():
+    return {"status": "ok", "startup_ms": startup_timings}
+
 
 # ==== Serve HTML Pages ====
 @app.get("/", response_class=HTMLResponse)
@@ -46,15 +124,6 @@ def serve_page(page: str):
     return FileResponse(file) if os.path.exists(file) else HTMLResponse("404", status_code=404)
 
 # ==== API Routes ====
-app.include_router(auth.router)
-app.include_router(students.router)
-app.include_router(internships.router)
-app.include_router(applications.router)
-app.include_router(progress.router)
-app.include_router(mentor.router)
-app.include_router(admin.router)
-app.include_router(chatbot.router)
-
-@app.get("/health")
-def health():
-    return {"status": "ok"}
+# at import, so the app is complete without a lifespan (OpenAPI, mounted
+# sub-apps, tests); after the pages above, as before
+include_routers(app)
@@ -0,0 +1,414 @@
+# backend/app/services/analytics.py
+"""
+Admin analytics aggregates (analytics_* tables), kept current in the same
+transaction as the write that changes them:
+
+  - applications per internship and status  (apply / approve / reject / cancel)
+  - on-time vs late submissions per week     (task submit)
+  - time to approval per internship          (approve, and leaving "approved")
+
+ORM writes are covered by the mapper listeners below; Core bulk statements
+(bulk_decision) call record_decisions themselves. rebuild() recomputes
+everything from the source tables (migration 3, `python -m app.cli
+analytics-rebuild`).
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, case, delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db import models
+
+DAY = 86400
+WEEK = 7 * DAY
+SUBMISSION_STATUSES = ("on_time", "late")
+
+
+# ================= COUNTER UPSERTS =================
+def _add(connection, model, keys: Tuple[str, ...], rows: List[dict]) -> None:
+    """row[key...] identifies the counter row, the other fields are added to it."""
+    merged: Dict[tuple, dict] = {}
+    for row in rows:
+        key = tuple(row[k] for k in keys)
+        if key not in merged:
+            merged[key] = dict(row)
+            continue
+        for c, v in row.items():
+            if c not in keys:
+                merged[key][c] += v
+    rows = [r for r in merged.values() if any(v for k, v in r.items() if k not in keys)]
+    if not rows:
+        return
+    table = model.__table__
+    counters = [k for k in rows[0] if k not in keys]
+    _upsert(connection, table, keys, counters, rows)
+
+    # a counter row back at zero is removed, as rebuild() would never create it
+    emptied = [{f"_{k}": r[k] for k in keys} for r in rows if any(r[c] < 0 for c in counters)]
+    if emptied:
+        connection.execute(
+            delete(table).where(
+                *(table.c[k] == bindparam(f"_{k}") for k in keys),
+                *(table.c[c] == 0 for c in counters),
+            ),
+            emptied,
+        )
+
+
+def _upsert(connection, table, keys: Tuple[str, ...], counters: List[str], rows: List[dict]) -> None:
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        stmt = (sqlite_insert if dialect == "sqlite" else pg_insert)(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={c: table.c[c] + stmt.excluded[c] for c in counters},
+        )
+        connection.execute(stmt, rows)
+        return
+
+    for row in rows:
+        matched = connection.execute(
+            update(table)
+            .where(*(table.c[k] == row[k] for k in keys))
+            .values({c: table.c[c] + row[c] for c in counters})
+        ).rowcount
+        if not matched:
+            connection.execute(insert(table).values(**row))
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Naive UTC (SQLite hands back naive values, Postgres aware ones)."""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def week_start(value: datetime) -> date:
+    day = _utc(value).date()
+    return day - timedelta(days=day.weekday())
+
+
+# ================= ROW DELTAS =================
+def _status_row(internship_id, status, n: int) -> dict:
+    return {"internship_id": internship_id, "status": status, "count": n}
+
+
+def _approval_row(internship_id, applied_at, approved_at, sign: int) -> Optional[dict]:
+    if internship_id is None or applied_at is None or approved_at is None:
+        return None
+    seconds = max(0, int((_utc(approved_at) - _utc(applied_at)).total_seconds()))
+    return {
+        "internship_id": internship_id,
+        "approved": sign,
+        "total_seconds": sign * seconds,
+        "within_day": sign * (seconds <= DAY),
+        "within_week": sign * (seconds <= WEEK),
+    }
+
+
+def _submission_row(internship_id, submitted_at, status, sign: int) -> Optional[dict]:
+    if internship_id is None or submitted_at is None or status not in SUBMISSION_STATUSES:
+        return None
+    return {
+        "week_start": week_start(submitted_at),
+        "internship_id": internship_id,
+        "on_time": sign * (status == "on_time"),
+        "late": sign * (status == "late"),
+    }
+
+
+def _apply(connection, status_rows=(), approval_rows=(), submission_rows=()) -> None:
+    _add(connection, models.InternshipStatusCount, ("internship_id", "status"),
+         [r for r in status_rows if r["internship_id"] is not None and r["status"]])
+    _add(connection, models.ApprovalTimeStat, ("internship_id",), [r for r in approval_rows if r])
+    _add(connection, models.SubmissionWeek, ("week_start", "internship_id"),
+         [r for r in submission_rows if r])
+
+
+def record_decisions(connection, rows: Iterable, new_status: str, old_status: str = "pending") -> None:
+    """
+    Bulk status change done with Core; rows carry internship_id, applied_at
+    and (for approvals) approved_at of the updated applications.
+    """
+    rows = list(rows)
+    per_internship: Dict[int, int] = defaultdict(int)
+    for r in rows:
+        per_internship[r.internship_id] += 1
+    status_rows = []
+    for internship_id, n in per_internship.items():
+        status_rows += [_status_row(internship_id, old_status, -n), _status_row(internship_id, new_status, n)]
+
+    approval_rows = []
+    if new_status == "approved":
+        approval_rows = [_approval_row(r.internship_id, r.applied_at, r.approved_at, 1) for r in rows]
+    _apply(connection, status_rows, approval_rows)
+
+
+# ================= KEEP AGGREGATES IN SYNC WITH ORM WRITES =================
+def _track_old_value(attribute) -> None:
+    # active_history: the previous value is loaded before it is replaced, so
+    # after_update always sees what to subtract
+    event.listen(attribute, "set", lambda target, value, oldvalue, initiator: None, active_history=True)
+
+
+for _attr in (models.Application.status, models.Application.approved_at,
+              models.TaskSubmission.status, models.TaskSubmission.submitted_at):
+    _track_old_value(_attr)
+
+
+def _current(connection, target, attr: str):
+    """Attribute value after the flush; columns filled by the server are read back."""
+    state = inspect(target)
+    if attr not in state.unloaded:
+        return getattr(target, attr)
+    table = type(target).__table__
+    return connection.scalar(select(table.c[attr]).where(table.c.id == target.id))
+
+
+def _before(target, attr: str, current):
+    history = inspect(target).attrs[attr].history
+    return history.deleted[0] if history.deleted else current
+
+
+def _deleted_values(target, attrs) -> dict:
+    # the row is gone, so only what was loaded can be subtracted
+    loaded = inspect(target).dict
+    return {a: loaded.get(a) for a in attrs}
+
+
+def _application_values(connection, target, old: bool = False):
+    values = {}
+    for attr in ("internship_id", "status", "applied_at", "approved_at"):
+        value = _current(connection, target, attr)
+        values[attr] = _before(target, attr, value) if old else value
+    return values
+
+
+def _application_rows(values: dict, sign: int):
+    status_row = _status_row(values["internship_id"], values["status"], sign)
+    approval_row = None
+    if values["status"] == "approved":
+        approval_row = _approval_row(values["internship_id"], values["applied_at"], values["approved_at"], sign)
+    return status_row, approval_row
+
+
+@event.listens_for(models.Application, "after_insert")
+def _application_inserted(mapper, connection, target):
+    status_row, approval_row = _application_rows(_application_values(connection, target), 1)
+    _apply(connection, [status_row], [approval_row])
+
+
+@event.listens_for(models.Application, "after_update")
+def _application_updated(mapper, connection, target):
+    state = inspect(target)
+    if not any(state.attrs[a].history.has_changes() for a in ("internship_id", "status", "approved_at")):
+        return
+    old_status, old_approval = _application_rows(_application_values(connection, target, old=True), -1)
+    new_status, new_approval = _application_rows(_application_values(connection, target), 1)
+    _apply(connection, [old_status, new_status], [old_approval, new_approval])
+
+
+@event.listens_for(models.Application, "after_delete")
+def _application_deleted(mapper, connection, target):
+    values = _deleted_values(target, ("internship_id", "status", "applied_at", "approved_at"))
+    status_row, approval_row = _application_rows(values, -1)
+    _apply(connection, [status_row], [approval_row])
+
+
+def _task_internship(connection, task_id) -> Optional[int]:
+    return connection.scalar(
+        select(models.InternshipTask.internship_id).where(models.InternshipTask.id == task_id)
+    )
+
+
+def _submission_values(connection, target, old: bool = False):
+    values = {}
+    for attr in ("task_id", "status", "submitted_at"):
+        value = _current(connection, target, attr)
+        values[attr] = _before(target, attr, value) if old else value
+    return values
+
+
+def _submission_delta(connection, values: dict, sign: int):
+    return _submission_row(
+        _task_internship(connection, values["task_id"]), values["submitted_at"], values["status"], sign
+    )
+
+
+@event.listens_for(models.TaskSubmission, "after_insert")
+def _submission_inserted(mapper, connection, target):
+    row = _submission_delta(connection, _submission_values(connection, target), 1)
+    _apply(connection, submission_rows=[row])
+
+
+@event.listens_for(models.TaskSubmission, "after_update")
+def _submission_updated(mapper, connection, target):
+    state = inspect(target)
+    if not any(state.attrs[a].history.has_changes() for a in ("task_id", "status", "submitted_at")):
+        return
+    old = _submission_delta(connection, _submission_values(connection, target, old=True), -1)
+    new = _submission_delta(connection, _submission_values(connection, target), 1)
+    _apply(connection, submission_rows=[old, new])
+
+
+@event.listens_for(models.TaskSubmission, "after_delete")
+def _submission_deleted(mapper, connection, target):
+    values = _deleted_values(target, ("task_id", "status", "submitted_at"))
+    _apply(connection, submission_rows=[_submission_delta(connection, values, -1)])
+
+
+# ================= BACKFILL =================
+def rebuild(connection) -> dict:
+    """Recompute every aggregate from applications / task_submissions."""
+    for model in (models.InternshipStatusCount, models.SubmissionWeek, models.ApprovalTimeStat):
+        connection.execute(delete(model))
+
+    A = models.Application
+    connection.execute(
+        insert(models.InternshipStatusCount).from_select(
+            ["internship_id", "status", "count"],
+            select(A.internship_id, A.status, func.count())
+            .where(A.internship_id.is_not(None), A.status.is_not(None))
+            .group_by(A.internship_id, A.status),
+        )
+    )
+
+    approvals: Dict[int, dict] = {}
+    approved = connection.execution_options(yield_per=2000).execute(
+        select(A.internship_id, A.applied_at, A.approved_at).where(A.status == "approved")
+    )
+    for r in approved:
+        row = _approval_row(r.internship_id, r.applied_at, r.approved_at, 1)
+        if row:
+            total = approvals.setdefault(r.internship_id, dict.fromkeys(row, 0))
+            for k in ("approved", "total_seconds", "within_day", "within_week"):
+                total[k] += row[k]
+            total["internship_id"] = r.internship_id
+    _add(connection, models.ApprovalTimeStat, ("internship_id",), list(approvals.values()))
+
+    weeks: Dict[tuple, dict] = {}
+    S, T = models.TaskSubmission, models.InternshipTask
+    submitted = connection.execution_options(yield_per=2000).execute(
+        select(T.internship_id, S.submitted_at, S.status).join(T, T.id == S.task_id)
+    )
+    for r in submitted:
+        row = _submission_row(r.internship_id, r.submitted_at, r.status, 1)
+        if row:
+            total = weeks.setdefault((row["week_start"], r.internship_id), {**row, "on_time": 0, "late": 0})
+            total["on_time"] += row["on_time"]
+            total["late"] += row["late"]
+    _add(connection, models.SubmissionWeek, ("week_start", "internship_id"), list(weeks.values()))
+
+    return {
+        "internships": connection.scalar(
+            select(func.count(func.distinct(models.InternshipStatusCount.internship_id)))
+        ),
+        "approved": sum(a["approved"] for a in approvals.values()),
+        "submission_weeks": len({week for week, _ in weeks}),
+    }
+
+
+# ================= READ SIDE (/admin/analytics) =================
+def _hours(seconds: int, n: int) -> Optional[float]:
+    return round(seconds / n / 3600, 1) if n else None
+
+
+def summary(db: Session, internship_id: Optional[int] = None, weeks: int = 12, limit: int = 20) -> dict:
+    """Dashboard payload; reads only the aggregate tables."""
+    C, W, P = models.InternshipStatusCount, models.SubmissionWeek, models.ApprovalTimeStat
+    I = models.Internship
+
+    def scoped(stmt, model):
+        return stmt.where(model.internship_id == internship_id) if internship_id is not None else stmt
+
+    totals = {"pending": 0, "approved": 0, "rejected": 0}
+    for status, n in db.execute(scoped(select(C.status, func.sum(C.count)), C).group_by(C.status)):
+        totals[status] = n or 0
+
+    per_status = {s: func.sum(case((C.status == s, C.count), else_=0)) for s in ("pending", "approved", "rejected")}
+    total = func.sum(C.count)
+    busiest = db.execute(
+        scoped(
+            select(C.internship_id, I.title, I.company, total.label("total"),
+                   *(col.label(s) for s, col in per_status.items()))
+            .join(I, I.id == C.internship_id),
+            C,
+        )
+        .group_by(C.internship_id, I.title, I.company)
+        .having(total > 0)
+        .order_by(total.desc(), C.internship_id)
+        .limit(limit)
+    ).all()
+
+    since = week_start(datetime.utcnow()) - timedelta(weeks=max(weeks, 1) - 1)
+    week_rows = db.execute(
+        scoped(
+            select(W.week_start, func.sum(W.on_time), func.sum(W.late)).where(W.week_start >= since), W
+        )
+        .group_by(W.week_start)
+        .order_by(W.week_start)
+    ).all()
+
+    approval = db.execute(
+        scoped(select(func.sum(P.approved), func.sum(P.total_seconds),
+                      func.sum(P.within_day), func.sum(P.within_week)), P)
+    ).one()
+    approved_n, seconds = approval[0] or 0, approval[1] or 0
+
+    slowest = db.execute(
+        scoped(
+            select(P.internship_id, I.title, P.approved, P.total_seconds)
+            .join(I, I.id == P.internship_id)
+            .where(P.approved > 0),
+            P,
+        )
+        .order_by((P.total_seconds / P.approved).desc(), P.internship_id)
+        .limit(limit)
+    ).all()
+
+    return {
+        "applications": {
+            "totals": {**totals, "total": sum(totals.values())},
+            "internships": [
+                {
+                    "internship_id": r.internship_id,
+                    "title": r.title,
+                    "company": r.company,
+                    "total": r.total,
+                    "pending": r.pending,
+                    "approved": r.approved,
+                    "rejected": r.rejected,
+                }
+                for r in busiest
+            ],
+        },
+        "submissions": [
+            {
+                "week_start": week.isoformat(),
+                "on_time": on_time,
+                "late": late,
+                "on_time_pct": round(100 * on_time / (on_time + late)) if on_time + late else None,
+            }
+            for week, on_time, late in week_rows
+        ],
+        "time_to_approval": {
+            "approved": approved_n,
+            "avg_hours": _hours(seconds, approved_n),
+            "within_day": approval[2] or 0,
+            "within_week": approval[3] or 0,
+            "slowest": [
+                {
+                    "internship_id": r.internship_id,
+                    "title": r.title,
+                    "approved": r.approved,
+                    "avg_hours": _hours(r.total_seconds, r.approved),
+                }
+                for r in slowest
+            ],
+        },
+    }
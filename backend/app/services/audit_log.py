@@ -0,0 +1,335 @@
+# backend/app/services/audit_log.py
+"""
+ApplicationLog writer.
+
+Routes call record(db, event=..., ...) instead of adding ApplicationLog rows
+to their session. In "async" mode (default) the rows are held on the session
+and handed to a background writer when the request transaction commits
+(dropped on rollback); the writer inserts them in batches, one executemany
+per AUDIT_LOG_BATCH_SIZE rows or AUDIT_LOG_FLUSH_SECONDS, whichever comes
+first. In "sync" mode (tests) rows are added to the session as before.
+
+The queue is bounded: when it is full, committing requests wait up to
+AUDIT_LOG_PUT_TIMEOUT_SECONDS and then write their rows themselves, so audit
+rows are delayed, never dropped. A batch the writer still cannot insert
+after three attempts is spooled to LOG_SPOOL_DIR as NDJSON and written by the
+next successful flush (or the next writer start, after a restart); a file
+that keeps failing while other writes succeed is moved aside. The app
+lifespan calls close(), which drains the queue. Written rows are published to
+log_broadcaster (live tail).
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.paths import LOG_SPOOL_DIR
+from app.db.database import engine
+from app.db import models
+from app.services import log_store
+from app.services.log_events import log_broadcaster
+
+# Session.info keys
+_PENDING = "audit_log_rows"         # async mode: rows to queue on commit
+_ADDED = "audit_log_added"          # sync mode: ApplicationLog objects not flushed yet
+_FLUSHED = "audit_log_flushed"      # sync mode: flushed rows to publish on commit
+
+# application_id is left unset by the routes: a student can cancel (delete) any
+# application, and application_logs.application_id has no ON DELETE action
+FIELDS = ("application_id", "student_id", "internship_id", "event", "message", "created_at")
+
+# spool files: "<time_ns>-<pid>.ndjson", renamed to "....ndjson.replaying" by the
+# worker writing them back (a claim left by a crashed worker is released after
+# SPOOL_CLAIM_MAX_AGE_SECONDS)
+SPOOL_SUFFIX = ".ndjson"
+SPOOL_CLAIM_SUFFIX = ".replaying"
+SPOOL_CLAIM_MAX_AGE_SECONDS = 600
+# a file whose rows fail this many times while the database takes other writes
+# is moved to <spool>/dead (kept for inspection, no longer replayed)
+SPOOL_MAX_FAILURES = 3
+SPOOL_DEAD_DIR = "dead"
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogSink:
+    attempts = 3
+    retry_delay = 0.2  # seconds, times the attempt number
+
+    def __init__(
+        self,
+        write: Callable[[List[dict]], None],
+        batch_size: int,
+        flush_seconds: float,
+        max_queued: int,
+        put_timeout: float,
+        spool_dir: Path = LOG_SPOOL_DIR,
+    ):
+        self._write = write
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.put_timeout = put_timeout
+        self.spool_dir = spool_dir
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=max_queued)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._spool_pending = True  # files may be left by an earlier run
+        self._replay_failures: Dict[str, int] = {}
+        # failed: rows that could not be spooled either (the only ones lost)
+        self._stats = {
+            "written": 0, "batches": 0, "overflow_writes": 0,
+            "spooled": 0, "replayed": 0, "dead_lettered": 0, "failed": 0,
+        }
+
+    # ---------- producer side ----------
+    def submit(self, rows: List[dict]) -> None:
+        if self._closed:
+            self._write_now(rows)
+            return
+        self.start()
+        for n, row in enumerate(rows):
+            try:
+                self._queue.put(row, timeout=self.put_timeout)
+            except queue.Full:  # writer is behind: backpressure, then write inline
+                self._stats["overflow_writes"] += 1
+                self._write_now(rows[n:])
+                return
+
+    def _write_now(self, rows: List[dict]) -> None:
+        self._write(rows)
+        self._stats["written"] += len(rows)
+
+    # ---------- writer thread ----------
+    def start(self) -> None:
+        """Start the writer (app lifespan; also on first use)."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            self._closed = False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        self._replay_spool(database_up=False)
+        stop = False
+        while not stop:
+            batch: List[dict] = []
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    row = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if row is None:  # close() sentinel
+                    self._queue.task_done()
+                    stop = True
+                    break
+                batch.append(row)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_seconds
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: List[dict]) -> None:
+        try:
+            self._write_retrying(batch)
+        except Exception:
+            logger.exception("audit log: %d rows not written after %d attempts, spooling", len(batch), self.attempts)
+            self._spool(batch)
+        else:
+            self._stats["written"] += len(batch)
+            self._stats["batches"] += 1
+            if self._spool_pending:  # the database is back
+                self._replay_spool(database_up=True)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write_retrying(self, batch: List[dict]) -> None:
+        for attempt in range(1, self.attempts + 1):
+            try:
+                self._write(batch)
+                return
+            except Exception:
+                if attempt == self.attempts:
+                    raise
+                time.sleep(self.retry_delay * attempt)
+
+    # ---------- spool (batches that failed every attempt) ----------
+    def _spool(self, batch: List[dict]) -> None:
+        """One NDJSON file per batch, written to a temp name and renamed."""
+        path = self.spool_dir / f"{time.time_ns()}-{os.getpid()}{SPOOL_SUFFIX}"
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                for row in batch:
+                    f.write(json.dumps(row, default=datetime.isoformat, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except OSError:
+            self._stats["failed"] += len(batch)
+            logger.exception("audit log: could not spool %d rows, they are lost", len(batch))
+            tmp.unlink(missing_ok=True)
+            return
+        self._stats["spooled"] += len(batch)
+        self._spool_pending = True
+
+    def _release_stale_claims(self) -> None:
+        cutoff = time.time() - SPOOL_CLAIM_MAX_AGE_SECONDS
+        for claimed in self.spool_dir.glob(f"*{SPOOL_SUFFIX}{SPOOL_CLAIM_SUFFIX}"):
+            try:
+                if claimed.stat().st_mtime < cutoff:
+                    os.replace(claimed, claimed.with_suffix(""))
+            except FileNotFoundError:
+                pass
+
+    def _replay_spool(self, database_up: bool) -> None:
+        """
+        Write spooled batches back, oldest first. A failure stops the pass
+        while the database may be down (nothing written yet); once it takes
+        writes, a failing file is skipped and, after SPOOL_MAX_FAILURES such
+        passes, dead-lettered, so it cannot hold back the files after it.
+        """
+        self._spool_pending = False
+        self._release_stale_claims()
+        for path in sorted(self.spool_dir.glob(f"*{SPOOL_SUFFIX}")):
+            claimed = path.with_name(path.name + SPOOL_CLAIM_SUFFIX)
+            try:
+                os.replace(path, claimed)  # other workers share the directory
+                os.utime(claimed)
+            except FileNotFoundError:
+                continue
+            with open(claimed, encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f]
+            for row in rows:
+                row["created_at"] = datetime.fromisoformat(row["created_at"])
+            try:
+                self._write(rows)
+            except Exception:
+                self._replay_failed(path, claimed, counted=database_up)
+                if not database_up:
+                    return
+                continue
+            claimed.unlink()
+            self._replay_failures.pop(path.name, None)
+            self._stats["written"] += len(rows)
+            self._stats["replayed"] += len(rows)
+            database_up = True
+
+    def _replay_failed(self, path: Path, claimed: Path, counted: bool) -> None:
+        failures = self._replay_failures.get(path.name, 0) + counted
+        if failures >= SPOOL_MAX_FAILURES:
+            dead = self.spool_dir / SPOOL_DEAD_DIR
+            dead.mkdir(exist_ok=True)
+            os.replace(claimed, dead / path.name)
+            self._replay_failures.pop(path.name, None)
+            self._stats["dead_lettered"] += 1
+            logger.error("audit log: %s failed %d replays, moved to %s", path.name, failures, dead, exc_info=True)
+            return
+        os.replace(claimed, path)
+        self._replay_failures[path.name] = failures
+        self._spool_pending = True
+        logger.warning("audit log: spool replay of %s failed, retrying later", path.name, exc_info=True)
+
+    # ---------- control ----------
+    def flush(self) -> None:
+        """Block until everything queued so far is written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Drain the queue and stop the writer; later rows are written inline."""
+        self._closed = True
+        thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+            self._thread = None
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "queued": self._queue.qsize()}
+
+
+def _insert_rows(rows: List[dict]) -> None:
+    L = models.ApplicationLog
+    with engine.begin() as conn:
+        ids = conn.execute(
+            insert(L).returning(L.id, sort_by_parameter_order=True), rows
+        ).scalars().all()
+        written = log_store.items(conn, [{**row, "id": id_} for row, id_ in zip(rows, ids)])
+    log_broadcaster.publish(written)
+
+
+audit_log = AuditLogSink(
+    _insert_rows,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_seconds=settings.AUDIT_LOG_FLUSH_SECONDS,
+    max_queued=settings.AUDIT_LOG_QUEUE_SIZE,
+    put_timeout=settings.AUDIT_LOG_PUT_TIMEOUT_SECONDS,
+)
+
+
+# ================= ROUTE API =================
+def _row(fields: dict) -> dict:
+    row = dict.fromkeys(FIELDS)
+    row.update(fields)
+    row["message"] = row["message"] or ""
+    row["created_at"] = row["created_at"] or datetime.utcnow()  # event time, not write time
+    return row
+
+
+def record(db: Session, **fields) -> None:
+    """One ApplicationLog row, written once (and only if) db commits."""
+    record_many(db, [fields])
+
+
+def record_many(db: Session, rows: List[dict]) -> None:
+    rows = [_row(r) for r in rows]
+    if settings.AUDIT_LOG_MODE == "sync":
+        logs = [models.ApplicationLog(**r) for r in rows]
+        db.add_all(logs)
+        db.info.setdefault(_ADDED, []).extend(logs)
+        return
+    db.info.setdefault(_PENDING, []).extend(rows)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_added(session, flush_context):
+    # sync mode: ids exist after the flush; published once the commit succeeds
+    logs = session.info.pop(_ADDED, None)
+    if logs:
+        session.info.setdefault(_FLUSHED, []).extend(
+            {f: getattr(log, f) for f in ("id",) + FIELDS} for log in logs
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_pending(session):
+    rows = session.info.pop(_PENDING, None)
+    if rows:
+        audit_log.submit(rows)
+    flushed = session.info.pop(_FLUSHED, None)
+    if flushed:
+        with engine.connect() as conn:  # names for the live tail, as in the async writer
+            log_broadcaster.publish(log_store.items(conn, flushed))
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session):
+    for key in (_PENDING, _ADDED, _FLUSHED):
+        session.info.pop(key, None)
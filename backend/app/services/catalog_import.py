@@ -0,0 +1,177 @@
+# backend/app/services/catalog_import.py
+"""
+Bulk internship import from CSV / JSONL (admin endpoint + `python -m app.cli
+import-internships`).
+
+The input is read one record at a time and validated with InternshipCreate;
+valid rows are written in batches (one executemany per batch, one commit per
+batch). Core statements bypass the ORM listeners, so each batch maintains
+internship_skills / internship_terms and bumps the catalog version itself.
+"""
+
+import csv
+import json
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import bindparam, insert, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.db.schemas import InternshipCreate
+from app.services.skill_index import bump_catalog_version, write_internship_index
+
+FORMATS = ("csv", "jsonl")
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+# (company, title) pairs per upsert lookup: 1000 bound parameters, like the
+# 1000-id chunks elsewhere (SQLite's bound-parameter limit)
+_KEY_CHUNK = 500
+
+_COLUMNS = ("title", "company", "location", "industry", "required_skills", "description")
+
+
+def detect_format(filename: str | None, explicit: str | None = None) -> str:
+    fmt = (explicit or (filename or "").rsplit(".", 1)[-1]).lower()
+    fmt = "jsonl" if fmt in ("ndjson", "json") else fmt
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported import format {fmt!r} (csv or jsonl)")
+    return fmt
+
+
+def iter_records(lines: Iterable[str], fmt: str) -> Iterator[Tuple[int, object]]:
+    """(line number, dict or the parse error) per record; never loads the whole input."""
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError as e:
+            yield line_no, e
+
+
+def _row(data: InternshipCreate) -> Dict[str, str]:
+    return {
+        "title": data.title.strip(),
+        "company": data.company.strip(),
+        "location": data.location or "",
+        "industry": data.industry or "",
+        "required_skills": data.skills or "",
+        "description": data.description or "",
+    }
+
+
+def _write_batch(db: Session, rows: List[Dict[str, str]], upsert: bool) -> Tuple[List[int], List[int]]:
+    """Insert (or upsert by company + title) one batch; returns (inserted ids, updated ids)."""
+    I = models.Internship
+    conn = db.connection()
+
+    existing: Dict[Tuple[str, str], int] = {}
+    if upsert:  # keys are unique within the file (import_internships reports repeats)
+        keys = [(r["company"], r["title"]) for r in rows]
+        for n in range(0, len(keys), _KEY_CHUNK):  # two bound parameters per key
+            existing.update(
+                ((company, title), id_)
+                for id_, company, title in conn.execute(
+                    select(I.id, I.company, I.title).where(
+                        tuple_(I.company, I.title).in_(keys[n:n + _KEY_CHUNK])
+                    )
+                )
+            )
+
+    new_rows = [r for r in rows if (r["company"], r["title"]) not in existing]
+    changed = [{"_id": existing[(r["company"], r["title"])], **r} for r in rows
+               if (r["company"], r["title"]) in existing]
+
+    indexed = []
+    inserted: List[int] = []
+    if new_rows:
+        result = conn.execute(
+            insert(I).returning(I.id, *(getattr(I, c) for c in _COLUMNS)), new_rows
+        ).all()
+        indexed += result
+        inserted = [r.id for r in result]
+
+    updated: List[int] = []
+    if changed:
+        conn.execute(
+            update(I.__table__)
+            .where(I.__table__.c.id == bindparam("_id"))
+            .values({c: bindparam(c) for c in _COLUMNS}),
+            changed,
+        )
+        updated = [r["_id"] for r in changed]
+        indexed += conn.execute(
+            select(I.id, *(getattr(I, c) for c in _COLUMNS)).where(I.id.in_(updated))
+        ).all()
+
+    write_internship_index(conn, indexed)
+    bump_catalog_version(conn)
+    db.commit()
+    return inserted, updated
+
+
+def import_internships(
+    db: Session,
+    lines: Iterable[str],
+    fmt: str,
+    upsert: bool = False,
+    batch_size: int = BATCH_SIZE,
+) -> dict:
+    """
+    Import every valid record; invalid ones are skipped and reported with
+    their line number (the first MAX_REPORTED_ERRORS are listed). With
+    upsert, a later row repeating the company + title of an earlier one is
+    reported the same way instead of silently replacing it.
+    """
+    report = {"inserted": 0, "updated": 0, "error_count": 0, "errors": [], "ids": []}
+
+    def error(line_no: int, message: str) -> None:
+        report["error_count"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append({"line": line_no, "error": message})
+
+    def flush(batch):
+        inserted, updated = _write_batch(db, batch, upsert)
+        report["inserted"] += len(inserted)
+        report["updated"] += len(updated)
+        report["ids"] += inserted + updated
+
+    seen: Dict[Tuple[str, str], int] = {}  # upsert key -> first line
+    batch: List[Dict[str, str]] = []
+    for line_no, record in iter_records(lines, fmt):
+        if isinstance(record, Exception):
+            error(line_no, f"invalid JSON: {record}")
+            continue
+        if not isinstance(record, dict):
+            error(line_no, "expected an object")
+            continue
+        try:
+            row = _row(InternshipCreate.model_validate(record))
+        except ValidationError as e:
+            error(line_no, "; ".join(
+                f"{'.'.join(map(str, err['loc'])) or 'row'}: {err['msg']}" for err in e.errors()
+            ))
+            continue
+        if not row["title"] or not row["company"]:
+            error(line_no, "title and company are required")
+            continue
+        if upsert:
+            first = seen.setdefault((row["company"], row["title"]), line_no)
+            if first != line_no:
+                error(line_no, f"duplicate of line {first} (same company and title)")
+                continue
+
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    return report
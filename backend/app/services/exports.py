@@ -0,0 +1,155 @@
+# backend/app/services/exports.py
+"""
+Streaming CSV / NDJSON exports for the admin (partner applicant lists,
+task submissions).
+
+Rows are read with yield_per (server-side cursor on Postgres, lazy cursor on
+SQLite) and encoded one partition at a time, so memory stays flat whatever
+the row count. The generators open their own session: they run after the
+endpoint has returned, from StreamingResponse's threadpool.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Callable, Iterator, List, Sequence
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.db import models
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+YIELD_PER = 1000
+
+APPLICATION_STATUSES = ("pending", "approved", "rejected")
+SUBMISSION_STATUSES = ("on_time", "late")
+
+
+# ================= FILTERS (shared with the admin listings) =================
+def application_filters(internship_id: int | None = None, status: str | None = None, q: str = "") -> List:
+    """
+    Same semantics as /admin/internships/{id}/applicants: unknown statuses
+    mean "all", q matches student name or email. Needs the Student + User join.
+    """
+    A, U = models.Application, models.User
+    filters = []
+    if internship_id is not None:
+        filters.append(A.internship_id == internship_id)
+    if q and q.strip():
+        pattern = f"%{q.strip()}%"
+        filters.append(or_(U.full_name.ilike(pattern), U.email.ilike(pattern)))
+    if status in APPLICATION_STATUSES:
+        filters.append(A.status == status)
+    return filters
+
+
+# ================= QUERIES =================
+APPLICATION_COLUMNS = (
+    "application_id", "status", "applied_at", "approved_at", "student_id", "student_name",
+    "email", "internship_id", "internship_title", "company", "resume_url",
+)
+
+
+def applications_query(internship_id: int | None = None, status: str | None = None, q: str = ""):
+    A, S, U, I = models.Application, models.Student, models.User, models.Internship
+    return (
+        select(
+            A.id.label("application_id"), A.status, A.applied_at, A.approved_at,
+            S.id.label("student_id"), U.full_name.label("student_name"), U.email,
+            I.id.label("internship_id"), I.title.label("internship_title"), I.company,
+            A.resume_url,
+        )
+        .join(S, A.student_id == S.id)
+        .join(U, S.user_id == U.id)
+        .join(I, A.internship_id == I.id)
+        .where(*application_filters(internship_id, status, q))
+        .order_by(A.id)
+    )
+
+
+SUBMISSION_COLUMNS = (
+    "submission_id", "task_id", "task_title", "due_date", "internship_id", "student_id",
+    "student_name", "email", "status", "submitted_at", "file_path", "feedback",
+)
+
+
+def submissions_query(
+    internship_id: int | None = None,
+    task_id: int | None = None,
+    status: str | None = None,
+    q: str = "",
+):
+    Sub, T, S, U = models.TaskSubmission, models.InternshipTask, models.Student, models.User
+    stmt = (
+        select(
+            Sub.id.label("submission_id"), T.id.label("task_id"), T.title.label("task_title"),
+            T.due_date, T.internship_id, S.id.label("student_id"),
+            U.full_name.label("student_name"), U.email, Sub.status, Sub.submitted_at,
+            Sub.file_path, Sub.feedback,
+        )
+        .join(T, Sub.task_id == T.id)
+        .join(S, Sub.student_id == S.id)
+        .join(U, S.user_id == U.id)
+        .order_by(Sub.id)
+    )
+    if internship_id is not None:
+        stmt = stmt.where(T.internship_id == internship_id)
+    if task_id is not None:
+        stmt = stmt.where(T.id == task_id)
+    if status in SUBMISSION_STATUSES:
+        stmt = stmt.where(Sub.status == status)
+    if q and q.strip():
+        pattern = f"%{q.strip()}%"
+        stmt = stmt.where(or_(U.full_name.ilike(pattern), U.email.ilike(pattern)))
+    return stmt
+
+
+# ================= ENCODING =================
+def _value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+# spreadsheets evaluate text cells starting with these as formulas (CSV injection)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    value = _value(value)
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value  # shown as text; NDJSON keeps the raw value
+    return value
+
+
+def _csv_chunks(partitions, columns: Sequence[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in partitions:
+        writer.writerows([[_csv_cell(v) for v in row] for row in rows])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _ndjson_chunks(partitions, columns: Sequence[str]) -> Iterator[str]:
+    for rows in partitions:
+        yield "".join(
+            json.dumps(dict(zip(columns, map(_value, row))), ensure_ascii=False) + "\n"
+            for row in rows
+        )
+
+
+def stream_export(session_factory: Callable[[], Session], stmt, columns: Sequence[str], fmt: str) -> Iterator[str]:
+    """Encoded chunks of `stmt` (one per yield_per partition)."""
+    encode = _csv_chunks if fmt == "csv" else _ndjson_chunks
+    with session_factory() as db:
+        result = db.execute(stmt.execution_options(yield_per=YIELD_PER))
+        yield from encode(result.partitions(), columns)
@@ -0,0 +1,110 @@
+# backend/app/services/log_events.py
+"""
+In-process pub/sub for new ApplicationLog rows (/admin/logs/stream).
+
+app.services.audit_log publishes every row once it is committed, as a
+log_store item (the /admin/logs shape, names included; its id is the SSE
+event id). Each connected client gets a bounded asyncio queue;
+a client that falls further behind than LOG_STREAM_CLIENT_BUFFER events is
+told to reconnect, and resumes from Last-Event-ID. Recent events are kept in
+a ring buffer so resumes normally need no query.
+
+Per worker process: with several workers each one streams the rows written
+by its own requests (plus resumes, which read the database).
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+
+class Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[dict]]" = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def offer(self, events: List[dict]) -> None:
+        """Thread-safe; the events are queued on the subscriber's loop."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, events)
+        except RuntimeError:  # loop closed: the client is gone
+            pass
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self._close)
+
+    def _close(self) -> None:
+        self.overflowed = True
+        if self.queue.empty():
+            self.queue.put_nowait(None)  # wakes the waiting stream
+
+    def _put(self, events: List[dict]) -> None:
+        for event in events:
+            if self.overflowed:
+                return
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.overflowed = True  # the stream ends; the client resumes by id
+
+
+class LogBroadcaster:
+    def __init__(self, history: int, client_buffer: int):
+        self.client_buffer = client_buffer
+        self._recent: Deque[dict] = deque(maxlen=history)
+        self._subscribers: Set[Subscriber] = set()
+        self._lock = threading.Lock()
+
+    def publish(self, events: List[dict]) -> None:
+        """Committed log rows (dicts with "id"), from any thread."""
+        if not events:
+            return
+        events = sorted(events, key=lambda e: e["id"])
+        with self._lock:
+            self._recent.extend(events)
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            sub.offer(events)
+
+    def subscribe(self, after_id: Optional[int]) -> Tuple[Subscriber, Optional[List[dict]]]:
+        """
+        Register a client (call from its event loop). Returns the backlog after
+        `after_id` from the ring buffer, or None when the ring no longer
+        reaches back that far (the caller replays from the database).
+        """
+        sub = Subscriber(asyncio.get_running_loop(), self.client_buffer)
+        with self._lock:
+            self._subscribers.add(sub)  # same lock as publish: no gap, no duplicate
+            if after_id is None:
+                return sub, []
+            if not self._recent or self._recent[0]["id"] > after_id + 1:
+                return sub, None
+            return sub, [e for e in self._recent if e["id"] > after_id]
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def close(self) -> None:
+        """End every open stream (app shutdown); clients reconnect elsewhere / later."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            try:
+                sub.close()
+            except RuntimeError:  # loop already closed
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"subscribers": len(self._subscribers), "recent": len(self._recent)}
+
+
+log_broadcaster = LogBroadcaster(
+    history=settings.LOG_STREAM_HISTORY,
+    client_buffer=settings.LOG_STREAM_CLIENT_BUFFER,
+)
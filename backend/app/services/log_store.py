@@ -0,0 +1,292 @@
+# backend/app/services/log_store.py
+"""
+application_logs: keyset pages for /admin/logs and the retention job.
+
+Pages are ordered by (created_at, id) descending and continue from an opaque
+cursor. Rows older than LOG_RETENTION_DAYS are moved by `python -m app.cli
+archive-logs` into gzip NDJSON files under LOG_ARCHIVE_DIR (one log_archives
+row per file), so the hot table stays small; those files are read back
+with the same filters and cursor when a page asks for archived rows.
+"""
+
+import base64
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import String, delete, insert, literal, select, tuple_, type_coerce
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.paths import LOG_ARCHIVE_DIR
+from app.db import models
+
+ROW_FIELDS = ("id", "application_id", "student_id", "internship_id", "event", "message", "created_at")
+
+
+@dataclass(frozen=True)
+class LogFilters:
+    events: Sequence[str] = ()
+    student_id: Optional[int] = None
+    internship_id: Optional[int] = None
+    since: Optional[datetime] = None   # inclusive
+    until: Optional[datetime] = None   # exclusive
+
+
+# ================= CURSOR =================
+# created_at travels as the stored value: on SQLite, CURRENT_TIMESTAMP rows
+# ("... 12:00:00") and ORM-written rows ("... 12:00:00.000000") compare as
+# text, so re-binding a parsed datetime would skip or repeat rows.
+def encode_cursor(created_at: str, id_: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{id_}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """ValueError when the cursor was not produced by encode_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, id_ = raw.rsplit("|", 1)
+        return created_at, int(id_)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+def _utc(value) -> Optional[datetime]:
+    """datetime / ISO string -> naive UTC datetime (archive-side comparisons)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _stored(value) -> str:
+    """
+    since / until bound as text in the stored format (see CURSOR): a bound
+    datetime renders as "... 12:00:00.000000", which sorts after a
+    CURRENT_TIMESTAMP row of the same second ("... 12:00:00").
+    """
+    value = _utc(value)
+    return value.isoformat(sep=" ", timespec="microseconds" if value.microsecond else "seconds")
+
+
+# ================= HOT TABLE =================
+def _hot_columns():
+    L = models.ApplicationLog
+    return [getattr(L, f) for f in ROW_FIELDS[:-1]] + [
+        type_coerce(L.created_at, String).label("created_at")  # stored value, see CURSOR
+    ]
+
+
+def hot_page(db: Session, filters: LogFilters, cursor: Optional[Tuple[str, int]], limit: int) -> List[dict]:
+    L = models.ApplicationLog
+    stmt = select(*_hot_columns()).order_by(L.created_at.desc(), L.id.desc()).limit(limit)
+    if filters.events:
+        stmt = stmt.where(L.event.in_(list(filters.events)))
+    if filters.student_id is not None:
+        stmt = stmt.where(L.student_id == filters.student_id)
+    if filters.internship_id is not None:
+        stmt = stmt.where(L.internship_id == filters.internship_id)
+    if filters.since is not None:
+        stmt = stmt.where(L.created_at >= literal(_stored(filters.since), String))
+    if filters.until is not None:
+        stmt = stmt.where(L.created_at < literal(_stored(filters.until), String))
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(L.created_at, L.id) < tuple_(literal(cursor[0], String), literal(cursor[1]))
+        )
+    return [{**r._mapping, "created_at": str(r.created_at), "archived": False} for r in db.execute(stmt)]
+
+
+# ================= ARCHIVES =================
+@lru_cache(maxsize=8)
+def _archive_rows(file_name: str) -> Tuple[dict, ...]:
+    """Rows of one (immutable) archive file, newest first."""
+    with gzip.open(LOG_ARCHIVE_DIR / file_name, "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    for row in rows:
+        row["_key"] = (_utc(row["created_at"]), row["id"])
+    rows.sort(key=lambda r: r["_key"], reverse=True)
+    return tuple(rows)
+
+
+def _matches(row: dict, filters: LogFilters, since, until) -> bool:
+    return (
+        (not filters.events or row["event"] in filters.events)
+        and (filters.student_id is None or row["student_id"] == filters.student_id)
+        and (filters.internship_id is None or row["internship_id"] == filters.internship_id)
+        and (since is None or row["_key"][0] >= since)
+        and (until is None or row["_key"][0] < until)
+    )
+
+
+def archive_page(db: Session, filters: LogFilters, cursor: Optional[Tuple[str, int]], limit: int) -> List[dict]:
+    A = models.LogArchive
+    since, until = _utc(filters.since), _utc(filters.until)
+    after = (_utc(cursor[0]), cursor[1]) if cursor else None
+
+    files = select(A.file_name, A.first_created, A.first_id).order_by(A.last_created.desc(), A.last_id.desc())
+    if since is not None:
+        files = files.where(A.last_created >= since)
+    if until is not None:
+        files = files.where(A.first_created < until)
+
+    page: List[dict] = []
+    for file_name, first_created, first_id in db.execute(files):
+        if after is not None and (_utc(first_created), first_id) >= after:
+            continue  # the whole file is at or past the cursor
+        for row in _archive_rows(file_name):
+            if after is not None and row["_key"] >= after:
+                continue
+            if _matches(row, filters, since, until):
+                page.append({f: row[f] for f in ROW_FIELDS} | {"archived": True})
+                if len(page) >= limit:
+                    return page
+    return page
+
+
+# ================= ITEMS =================
+def _names(db, rows: List[dict]) -> Tuple[Dict[int, str], Dict[int, tuple]]:
+    student_ids = {r["student_id"] for r in rows if r["student_id"] is not None}
+    internship_ids = {r["internship_id"] for r in rows if r["internship_id"] is not None}
+    students = dict(db.execute(
+        select(models.Student.id, models.User.full_name)
+        .join(models.User, models.Student.user_id == models.User.id)
+        .where(models.Student.id.in_(student_ids))
+    ).all()) if student_ids else {}
+    internships = {
+        id_: (title, company)
+        for id_, title, company in db.execute(
+            select(models.Internship.id, models.Internship.title, models.Internship.company)
+            .where(models.Internship.id.in_(internship_ids))
+        )
+    } if internship_ids else {}
+    return students, internships
+
+
+def items(db, rows: List[dict]) -> List[dict]:
+    """
+    API shape of log rows, with student / internship names: the same for
+    /admin/logs pages and the live tail (db: Session or Connection).
+    """
+    students, internships = _names(db, rows)
+    result = []
+    for r in rows:
+        title, company = internships.get(r["internship_id"], (None, None))
+        result.append({
+            "id": r["id"],
+            "event": r["event"],
+            "message": r["message"],
+            "time": _utc(r["created_at"]).isoformat(),
+            "application_id": r["application_id"],
+            "student_id": r["student_id"],
+            "student_name": students.get(r["student_id"]),
+            "internship_id": r["internship_id"],
+            "internship_title": title,
+            "company": company,
+            "archived": r.get("archived", False),
+        })
+    return result
+
+
+# ================= PAGE =================
+def page(
+    db: Session,
+    filters: LogFilters,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    include_archive: bool = False,
+) -> dict:
+    """
+    One page, newest first. Archived rows are all older than the hot table,
+    so with include_archive the page simply continues into the archives.
+    """
+    position = decode_cursor(cursor) if cursor else None
+    rows = hot_page(db, filters, position, limit + 1)
+    if include_archive and len(rows) <= limit:
+        if rows:
+            position = (rows[-1]["created_at"], rows[-1]["id"])
+        rows += archive_page(db, filters, position, limit + 1 - len(rows))
+
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "items": items(db, rows),
+        "next_cursor": encode_cursor(str(rows[-1]["created_at"]), rows[-1]["id"]) if more else None,
+    }
+
+
+# ================= LIVE TAIL RESUME =================
+def items_after(db: Session, after_id: int, limit: int) -> List[dict]:
+    """Hot rows with id > after_id as items, oldest first (Last-Event-ID resume)."""
+    L = models.ApplicationLog
+    stmt = select(*(getattr(L, f) for f in ROW_FIELDS)).where(L.id > after_id).order_by(L.id).limit(limit)
+    return items(db, [dict(r._mapping) for r in db.execute(stmt)])
+
+
+# ================= RETENTION JOB =================
+def _write_archive(rows: List[dict]) -> str:
+    """gzip NDJSON, written to a temp name and renamed (never a partial file)."""
+    LOG_ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    file_name = f"application_logs_{rows[0]['id']}-{rows[-1]['id']}.ndjson.gz"
+    tmp = LOG_ARCHIVE_DIR / (file_name + ".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, LOG_ARCHIVE_DIR / file_name)
+    return file_name
+
+
+def archive_logs(
+    engine: Engine,
+    older_than_days: int = settings.LOG_RETENTION_DAYS,
+    file_rows: int = settings.LOG_ARCHIVE_FILE_ROWS,
+) -> dict:
+    """
+    Move rows older than the cutoff, oldest first, one archive file per
+    `file_rows` rows. Each file is on disk before its rows are deleted (in
+    the same transaction that records it in log_archives); file names follow
+    from the row ids, so a rerun after a crash rewrites the same file.
+    """
+    L = models.ApplicationLog
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    stats = {"files": 0, "rows": 0, "cutoff": cutoff.isoformat()}
+
+    while True:
+        with engine.begin() as conn:
+            rows = [
+                {**r._mapping, "created_at": str(r.created_at)}
+                for r in conn.execute(
+                    select(*_hot_columns())
+                    .where(L.created_at < cutoff)
+                    .order_by(L.created_at, L.id)
+                    .limit(file_rows)
+                )
+            ]
+            if not rows:
+                return stats
+
+            file_name = _write_archive(rows)
+            conn.execute(insert(models.LogArchive).values(
+                file_name=file_name,
+                rows=len(rows),
+                first_created=_utc(rows[0]["created_at"]),
+                last_created=_utc(rows[-1]["created_at"]),
+                first_id=rows[0]["id"],
+                last_id=rows[-1]["id"],
+            ))
+            ids = [r["id"] for r in rows]
+            for n in range(0, len(ids), 500):
+                conn.execute(delete(L).where(L.id.in_(ids[n:n + 500])))
+
+        stats["files"] += 1
+        stats["rows"] += len(rows)
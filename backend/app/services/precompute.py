@@ -0,0 +1,188 @@
+# backend/app/services/precompute.py
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy import delete, func, insert, select, union, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import models
+from app.db.database import SessionLocal
+from app.services.rec_cache import skills_fingerprint
+from app.services.scoring import ScoringEngine, get_engine
+
+# bound on the dense students x internships block scored at once,
+# and on the IN (...) list size per chunk
+_MAX_CELLS = 2_000_000
+_MAX_CHUNK = 1000
+
+
+def _chunk_size(engine: ScoringEngine) -> int:
+    return max(1, min(_MAX_CHUNK, _MAX_CELLS // max(len(engine), 1)))
+
+
+def _skill_sets(db: Session, student_ids: List[int]) -> Dict[int, Set[str]]:
+    """student id -> skill names, read from the normalized student_skills table."""
+    sets: Dict[int, Set[str]] = {sid: set() for sid in student_ids}
+    rows = (
+        db.query(models.StudentSkill.student_id, models.Skill.name)
+        .join(models.Skill, models.Skill.id == models.StudentSkill.skill_id)
+        .filter(models.StudentSkill.student_id.in_(student_ids))
+    )
+    for sid, name in rows:
+        sets[sid].add(name)
+    return sets
+
+
+def _write_chunk(db: Session, engine: ScoringEngine, ids: List[int], top_n: int) -> None:
+    by_student = _skill_sets(db, ids)
+    skill_sets = [by_student[sid] for sid in ids]
+    scores = engine.score_batch(skill_sets)
+
+    rec_rows, run_rows = [], []
+    now = datetime.now(timezone.utc)
+    for student_id, skills, (match, eligible) in zip(ids, skill_sets, scores):
+        items, _ = engine.top_k(match, eligible, top_n)
+        rec_rows += [
+            {"student_id": student_id, "internship_id": it["id"], "rank": n, "match": it["match"]}
+            for n, it in enumerate(items, start=1)
+        ]
+        run_rows.append({
+            "student_id": student_id,
+            "catalog_version": engine.version,
+            "skills_fingerprint": skills_fingerprint(skills),
+            "total": int(eligible.sum()),
+            "computed_at": now,
+        })
+
+    R, Run = models.StudentRecommendation, models.StudentRecommendationRun
+    db.execute(delete(R).where(R.student_id.in_(ids)))
+    db.execute(delete(Run).where(Run.student_id.in_(ids)))
+    if rec_rows:
+        db.execute(insert(R), rec_rows)
+    db.execute(insert(Run), run_rows)
+    db.commit()
+
+
+# ================= FULL / PARTIAL RECOMPUTE =================
+def recompute_students(
+    db: Session,
+    student_ids: Iterable[int] | None = None,
+    top_n: int | None = None,
+) -> int:
+    """
+    Materialize the top-N matches of the given students (all when None).
+    Uses the same ScoringEngine as /internships/recommendations.
+    """
+    top_n = top_n or settings.RECS_PRECOMPUTE_TOP_N
+    engine = get_engine(db)
+
+    size = _chunk_size(engine)
+    if student_ids is not None:
+        ids = sorted(set(student_ids))
+        for n in range(0, len(ids), size):
+            _write_chunk(db, engine, ids[n:n + size], top_n)
+        return len(ids)
+
+    # keyset chunks: every chunk commits, so no cursor is held across writes
+    S = models.Student
+    done, last_id = 0, 0
+    while True:
+        chunk = [
+            sid for (sid,) in db.query(S.id).filter(S.id > last_id).order_by(S.id).limit(size)
+        ]
+        if not chunk:
+            return done
+        _write_chunk(db, engine, chunk, top_n)
+        done += len(chunk)
+        last_id = chunk[-1]
+
+
+def refresh_students(student_ids: List[int]) -> None:
+    """
+    Background job after a profile skill change. Until it has run the stored
+    rows carry the old skills fingerprint, so reads score live (never stale).
+    """
+    with SessionLocal() as db:
+        recompute_students(db, student_ids)
+
+
+# ================= INCREMENTAL =================
+def students_affected_by(db: Session, internship_ids: Iterable[int]) -> Set[int]:
+    """
+    Students whose top-N can change when these internships change:
+    those sharing a skill with them (indexed join on student_skills /
+    internship_skills) and those that currently list them. Lists are
+    padded with match-0 internships in catalog order, so while the catalog
+    (before or after the change) fits in a list, every student is affected.
+    """
+    SS, IS = models.StudentSkill, models.InternshipSkill
+    internship_ids = list(internship_ids)
+
+    catalog = db.execute(select(func.count(models.Internship.id))).scalar_one()
+    if catalog <= settings.RECS_PRECOMPUTE_TOP_N + len(internship_ids):
+        return set(db.execute(select(models.Student.id)).scalars())
+
+    affected: Set[int] = set()
+    for n in range(0, len(internship_ids), _MAX_CHUNK):  # bulk imports: bound-parameter limit
+        chunk = internship_ids[n:n + _MAX_CHUNK]
+        sharing = (
+            select(SS.student_id)
+            .join(IS, IS.skill_id == SS.skill_id)
+            .where(IS.internship_id.in_(chunk))
+        )
+        listing = select(models.StudentRecommendation.student_id).where(
+            models.StudentRecommendation.internship_id.in_(chunk)
+        )
+        affected.update(db.execute(union(sharing, listing)).scalars())
+    return affected
+
+
+def refresh_after_catalog_change(internship_ids: List[int], from_version: int, to_version: int) -> None:
+    """
+    Background job after an admin internship write (from_version -> to_version).
+    Recomputes only affected students; everyone else's rows are still exact,
+    so their run is moved forward to the new version without rescoring
+    (recomputed runs already carry a newer version and are not touched).
+    """
+    with SessionLocal() as db:
+        recompute_students(db, students_affected_by(db, internship_ids))
+
+        Run = models.StudentRecommendationRun
+        db.execute(
+            update(Run)
+            .where(Run.catalog_version == from_version)
+            .values(catalog_version=to_version)
+        )
+        db.commit()
+
+
+# ================= READ PATH =================
+def precomputed_for(db: Session, student_id: int, user_skills: Set[str], version: int):
+    """
+    Stored (ranked) rows for a student, or None when missing / stale.
+    Returns (items, total) where total is the full eligible count.
+    """
+    run = db.get(models.StudentRecommendationRun, student_id)
+    if (
+        run is None
+        or run.catalog_version != version
+        or run.skills_fingerprint != skills_fingerprint(user_skills)
+    ):
+        return None
+
+    R, I = models.StudentRecommendation, models.Internship
+    rows = (
+        db.query(R.match, I.id, I.title, I.company, I.location, I.required_skills)
+        .join(I, I.id == R.internship_id)
+        .filter(R.student_id == student_id)
+        .order_by(R.rank)
+        .all()
+    )
+    items = [
+        {"id": r.id, "title": r.title, "company": r.company, "location": r.location,
+         "skills": r.required_skills, "match": r.match}
+        for r in rows
+    ]
+    return items, run.total
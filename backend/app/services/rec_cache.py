@@ -0,0 +1,112 @@
+# backend/app/services/rec_cache.py
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Set
+
+from app.core.config import settings
+
+
+def skills_fingerprint(skills: Set[str]) -> str:
+    return hashlib.sha1(",".join(sorted(skills)).encode()).hexdigest()
+
+
+class RecommendationCache:
+    """
+    LRU + TTL cache for /internships/recommendations responses.
+
+    Keys start with (skills fingerprint, catalog version, ...), so a profile
+    skill change simply looks up a different key; entries of the old skill
+    set are still valid for anyone with those skills and age out by LRU/TTL.
+    Entries from an older catalog version are dropped as soon as a newer
+    version is seen.
+    Memory is bounded by entry count and by total cached result rows.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, max_rows: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._rows = 0
+        self._version: int | None = None
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    @staticmethod
+    def _size(value: Any) -> int:
+        if isinstance(value, dict):
+            value = value.get("items", [])
+        return max(len(value), 1)
+
+    def _drop(self, key) -> None:
+        _, _, size = self._data.pop(key)
+        self._rows -= size
+
+    def _sync_version(self, version: int) -> None:
+        if self._version is not None and version > self._version:
+            self.invalidations += len(self._data)
+            self._data.clear()
+            self._rows = 0
+        if self._version is None or version > self._version:
+            self._version = version
+
+    def get(self, fingerprint: str, version: int, *rest: Hashable):
+        key = (fingerprint, version, *rest)
+        with self._lock:
+            self._sync_version(version)
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, fingerprint: str, version: int, *rest: Hashable, value: Any) -> None:
+        key = (fingerprint, version, *rest)
+        size = self._size(value)
+        if size > self.max_rows:
+            return
+        with self._lock:
+            self._sync_version(version)
+            if version < self._version:
+                return  # computed against a catalog that is already stale
+            if key in self._data:
+                self._drop(key)
+            self._data[key] = (time.monotonic() + self.ttl, value, size)
+            self._rows += size
+            while len(self._data) > self.maxsize or self._rows > self.max_rows:
+                self._drop(next(iter(self._data)))
+                self.evictions += 1
+
+    def invalidate_catalog(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+            self._rows = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "rows": self._rows,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "catalog_version": self._version,
+            }
+
+
+recommendation_cache = RecommendationCache(
+    maxsize=settings.RECS_CACHE_SIZE,
+    ttl=settings.RECS_CACHE_TTL_SECONDS,
+    max_rows=settings.RECS_CACHE_MAX_ROWS,
+)
@@ -0,0 +1,259 @@
+# backend/app/services/scoring.py
+
+import threading
+from typing import Iterable, List, Sequence, Set
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.services.skill_index import get_catalog_version
+
+
+class ScoringEngine:
+    """
+    In-memory view of the internship catalog used by the recommender.
+
+      S : internships x skills  (binary, from internship_skills)
+      M : internships x terms   (binary, from internship_terms)
+
+    Both are kept column-major, so a column is the posting list of one skill
+    or term: a request only touches the postings of the student's skills and
+    of the terms matching its keywords, never the whole catalog matrix.
+    Internships outside those postings score 0.
+
+    Shared skills are counted here rather than with a SQL join + GROUP BY
+    over student_skills / internship_skills (S is loaded from those tables):
+    the join returns one row per overlapping internship, which on the
+    2k-internship benchmark catalog is ~1.3k rows / ~4 ms per request against
+    ~0.6 ms for slicing the postings, and ~670k rows / 1.2 s in SQLite alone
+    for a 500-student precompute chunk. The indexed join is used where its
+    result is small: precompute.students_affected_by().
+
+    Scores follow the original per-row formula exactly:
+      text_score  = min(text_hits * 10, 40)
+      skill_score = int(len(overlap) / len(required) * 60)
+      match       = min(text_score + skill_score, 100)
+    """
+
+    def __init__(
+        self,
+        rows: Sequence[tuple],
+        skill_postings: Iterable[tuple],
+        term_postings: Iterable[tuple],
+        version: int = 0,
+    ):
+        self.version = version
+
+        # rows: (id, title, company, location, required_skills) ordered by id
+        self.ids = np.array([r[0] for r in rows], dtype=np.int64)
+        self.meta = [
+            {"id": r[0], "title": r[1], "company": r[2], "location": r[3], "skills": r[4]}
+            for r in rows
+        ]
+        position = {r[0]: n for n, r in enumerate(rows)}
+
+        self.skill_vocab: dict[str, int] = {}
+        term_vocab: dict[str, int] = {}
+        s_rows, s_cols, m_rows, m_cols = [], [], [], []
+
+        # (internship_id, skill name) / (internship_id, term)
+        for internship_id, name in skill_postings:
+            row = position.get(internship_id)
+            if row is not None:
+                s_rows.append(row)
+                s_cols.append(self.skill_vocab.setdefault(name, len(self.skill_vocab)))
+        for internship_id, token in term_postings:
+            row = position.get(internship_id)
+            if row is not None:
+                m_rows.append(row)
+                m_cols.append(term_vocab.setdefault(token, len(term_vocab)))
+
+        n = len(rows)
+        self.S = self._binary(s_rows, s_cols, (n, len(self.skill_vocab))).tocsc()
+        self.M = self._binary(m_rows, m_cols, (n, len(term_vocab))).tocsc()
+        self.required = np.asarray(self.S.getnnz(axis=1), dtype=np.int64)
+        self.terms = np.array(list(term_vocab), dtype=str)
+
+    @staticmethod
+    def _binary(rows, cols, shape) -> sparse.csr_matrix:
+        m = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=shape
+        )
+        m.data[:] = 1  # duplicate postings collapse to one
+        return m
+
+    @classmethod
+    def from_db(cls, db: Session) -> "ScoringEngine":
+        version = get_catalog_version(db)
+        I = models.Internship
+        rows = (
+            db.query(I.id, I.title, I.company, I.location, I.required_skills)
+            .order_by(I.id)
+            .all()
+        )
+        skill_postings = (
+            db.query(models.InternshipSkill.internship_id, models.Skill.name)
+            .join(models.Skill, models.Skill.id == models.InternshipSkill.skill_id)
+            .all()
+        )
+        T = models.InternshipTerm
+        term_postings = db.query(T.internship_id, T.token).all()
+        return cls(rows, skill_postings, term_postings, version)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # ---------------- vector helpers ----------------
+    def skill_matrix(self, skill_sets: Sequence[Set[str]]) -> sparse.csr_matrix:
+        """students x skills; skills unknown to the catalog can never overlap and are dropped."""
+        rows, cols = [], []
+        for r, skills in enumerate(skill_sets):
+            for s in skills:
+                c = self.skill_vocab.get(s)
+                if c is not None:
+                    rows.append(r)
+                    cols.append(c)
+        return self._binary(rows, cols, (len(skill_sets), len(self.skill_vocab)))
+
+    def overlap(self, skill_sets: Sequence[Set[str]]) -> sparse.csr_matrix:
+        """students x internships shared-skill counts, from the postings of those skills only."""
+        X = self.skill_matrix(skill_sets)
+        cols = np.unique(X.indices)
+        return (X[:, cols] @ self.S[:, cols].T).tocsr()
+
+    def text_hits(self, keyword_tokens: List[str]) -> np.ndarray:
+        """Per internship: how many keyword tokens occur in its text (duplicates count twice)."""
+        hits = np.zeros(len(self), dtype=np.int64)
+        if not keyword_tokens or not len(self.terms):
+            return hits
+
+        for token in set(keyword_tokens):
+            cols = np.flatnonzero(np.char.find(self.terms, token) >= 0)  # terms containing token
+            if len(cols):
+                hits[np.unique(self.M[:, cols].indices)] += keyword_tokens.count(token)
+        return hits
+
+    # ---------------- scoring ----------------
+    def score(self, user_skills: Set[str], keyword_tokens: List[str], hits: np.ndarray | None = None):
+        """
+        Score one student against every internship.
+        Returns (match, eligible) arrays aligned with self.ids.
+        """
+        return self.score_batch([user_skills], keyword_tokens, hits)[0]
+
+    def score_batch(
+        self,
+        skill_sets: Sequence[Set[str]],
+        keyword_tokens: List[str] | None = None,
+        hits: np.ndarray | None = None,
+    ):
+        """
+        Score many students with one sparse product over their skills' postings.
+        `hits` overrides the substring keyword matcher (e.g. FTS5 results).
+        Returns a list of (match, eligible) arrays, one per student.
+        """
+        keyword_tokens = keyword_tokens or []
+        overlap = self.overlap(skill_sets)
+
+        if hits is None:
+            hits = self.text_hits(keyword_tokens)
+        text_score = np.minimum(hits * 10, 40)
+
+        results = []
+        for r in range(len(skill_sets)):
+            rows = overlap.indices[overlap.indptr[r]:overlap.indptr[r + 1]]
+            shared = overlap.data[overlap.indptr[r]:overlap.indptr[r + 1]]
+            match = text_score.copy()
+            match[rows] += (shared / self.required[rows] * 60).astype(np.int64)
+            np.minimum(match, 100, out=match)
+            if keyword_tokens:
+                eligible = hits > 0  # a search drops unrelated internships
+                eligible[rows] = True
+            else:
+                eligible = np.ones(len(self), dtype=bool)  # no overlap -> listed with match 0
+            results.append((match, eligible))
+        return results
+
+    def rank(self, match: np.ndarray, eligible: np.ndarray, tiebreak: np.ndarray | None = None) -> List[dict]:
+        """
+        Eligible internships, best match first. Ties are ordered by `tiebreak`
+        (ascending, e.g. bm25) and then catalog order.
+        """
+        idx = np.flatnonzero(eligible)
+        if tiebreak is None:
+            idx = idx[np.argsort(-match[idx], kind="stable")]
+        else:
+            idx = idx[np.lexsort((tiebreak[idx], -match[idx]))]
+        return [{**self.meta[i], "match": int(match[i])} for i in idx]
+
+    def top_k(
+        self,
+        match: np.ndarray,
+        eligible: np.ndarray,
+        limit: int,
+        after: tuple | None = None,
+        tiebreak: np.ndarray | None = None,
+    ):
+        """
+        One page of `rank()` without sorting the whole catalog:
+        O(n) partition + O(k log k) sort of the page.
+
+        `after` is the (match, tiebreak, id) key of the last item already served.
+        Returns (items, key of the last item or None when there is no next page).
+        """
+        idx = np.flatnonzero(eligible)
+        keys = np.empty(len(idx), dtype=[("m", np.int64), ("t", np.float64), ("id", np.int64)])
+        keys["m"] = -match[idx]
+        keys["t"] = tiebreak[idx] if tiebreak is not None else 0.0
+        keys["id"] = self.ids[idx]
+
+        if after is not None:
+            m, t, last_id = -after[0], after[1], after[2]
+            later = (keys["m"] > m) | (
+                (keys["m"] == m) & ((keys["t"] > t) | ((keys["t"] == t) & (keys["id"] > last_id)))
+            )
+            idx, keys = idx[later], keys[later]
+
+        if len(idx) > limit:
+            part = np.argpartition(keys, limit - 1, order=("m", "t", "id"))[:limit]
+            idx, keys = idx[part], keys[part]
+            has_more = True
+        else:
+            has_more = False
+
+        order = np.argsort(keys, order=("m", "t", "id"))
+        idx, keys = idx[order], keys[order]
+
+        items = [{**self.meta[i], "match": int(match[i])} for i in idx]
+        last = (int(-keys["m"][-1]), float(keys["t"][-1]), int(keys["id"][-1])) if has_more else None
+        return items, last
+
+
+# ================= PROCESS-WIDE ENGINE =================
+_engine: ScoringEngine | None = None
+_lock = threading.Lock()
+
+
+def peek_engine(version: int) -> ScoringEngine | None:
+    """
+    The cached engine if it is at least at `version` (no DB access). A newer
+    engine is fine for a lagging read replica and avoids rebuild flip-flops.
+    """
+    engine = _engine
+    return engine if engine is not None and engine.version >= version else None
+
+
+def get_engine(db: Session) -> ScoringEngine:
+    """Return the cached engine, rebuilding it when the catalog version moved."""
+    global _engine
+    version = get_catalog_version(db)
+    engine = peek_engine(version)
+    if engine is not None:
+        return engine
+
+    with _lock:
+        if _engine is None or _engine.version < version:
+            _engine = ScoringEngine.from_db(db)
+        return _engine
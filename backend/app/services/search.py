@@ -0,0 +1,132 @@
+# backend/app/services/search.py
+
+from typing import List, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+FTS_TABLE = "internships_fts"
+FTS_COLUMNS = "title, company, industry, description, required_skills"
+
+# None = not checked yet, False = no FTS5 (or not SQLite) -> substring fallback
+_available: bool | None = None
+
+FTS_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {FTS_COLUMNS}, content='internships', content_rowid='id'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON internships BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.title, new.company, new.industry, new.description, new.required_skills);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON internships BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.title, old.company, old.industry, old.description, old.required_skills);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON internships BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.title, old.company, old.industry, old.description, old.required_skills);
+        INSERT INTO {FTS_TABLE}(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.title, new.company, new.industry, new.description, new.required_skills);
+    END
+    """,
+]
+
+
+# ================= SETUP =================
+def ensure_fts(engine, create: bool = True) -> bool:
+    """
+    Create the FTS5 index + sync triggers (SQLite only).
+    Returns False when the SQLite build has no FTS5; keyword search then
+    falls back to substring matching in ScoringEngine.
+    With create=False (schema known to be current) only checks for the table.
+    """
+    global _available
+    if engine.dialect.name != "sqlite":
+        _available = False
+        return _available
+
+    if not create:
+        with engine.connect() as conn:
+            _available = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:n"),
+                {"n": FTS_TABLE},
+            ).first() is not None
+        return _available
+
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:n"),
+                {"n": FTS_TABLE},
+            ).first()
+            for ddl in FTS_DDL:
+                conn.execute(text(ddl))
+            if not exists:
+                conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        _available = True
+    except OperationalError as e:
+        print("FTS5 unavailable, using substring keyword search →", e)
+        _available = False
+    return _available
+
+
+def fts_available() -> bool:
+    return bool(_available)
+
+
+def fts_token(token: str) -> bool:
+    """
+    True when FTS5 sees `token` unchanged. The unicode61 tokenizer drops
+    punctuation ("c++" -> "c", "node.js" -> "node" "js"), which would widen
+    the search, so such tokens keep the substring matcher.
+    """
+    return token.isalnum()
+
+
+def _fts_query(token: str) -> str:
+    # quoted + prefix: "py" matches python (token is alphanumeric, see fts_token)
+    return '"' + token + '"*'
+
+
+# ================= KEYWORD HITS =================
+def keyword_hits(db: Session, ids: np.ndarray, keyword_tokens: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per internship (aligned with the sorted `ids`): number of keyword tokens
+    matched (duplicates count twice) and the summed bm25 rank (lower = better).
+    Only tokens passing fts_token() are looked up; the caller matches the rest.
+    """
+    hits = np.zeros(len(ids), dtype=np.int64)
+    rank = np.zeros(len(ids), dtype=np.float64)
+    if not len(ids):
+        return hits, rank
+
+    for token in set(filter(fts_token, keyword_tokens)):
+        weight = keyword_tokens.count(token)
+        rows = db.execute(
+            text(
+                f"SELECT rowid, bm25({FTS_TABLE}) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH :q"
+            ),
+            {"q": _fts_query(token)},
+        ).all()
+        if not rows:
+            continue
+
+        rowids = np.array([r[0] for r in rows], dtype=np.int64)
+        scores = np.array([r[1] for r in rows], dtype=np.float64)
+        pos = np.searchsorted(ids, rowids)
+        known = (pos < len(ids)) & (ids[np.minimum(pos, len(ids) - 1)] == rowids)
+        hits[pos[known]] += weight
+        rank[pos[known]] += scores[known] * weight
+
+    return hits, rank
@@ -0,0 +1,197 @@
+# backend/app/services/skill_index.py
+
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy import delete, event, inspect, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db import models
+
+# columns that feed the recommendation text blob / skill set
+INDEXED_FIELDS = ("title", "company", "industry", "description", "required_skills")
+
+
+# ================= NORMALIZE SKILL STRINGS =================
+def normalize_skills(skills_str: str | None) -> Set[str]:
+    if not skills_str:
+        return set()
+    return {s.strip().lower() for s in skills_str.split(",") if s.strip()}
+
+
+# ================= KEYWORD TOKENIZER =================
+def tokenize_keywords(keywords: str) -> List[str]:
+    if not keywords:
+        return []
+    return [t.lower() for t in keywords.split() if t.strip()]
+
+
+# ================= SEARCHABLE TEXT =================
+def text_blob(internship) -> str:
+    return " ".join([getattr(internship, f) or "" for f in INDEXED_FIELDS]).lower()
+
+
+def text_terms(internship) -> Set[str]:
+    """
+    Keyword tokens never contain whitespace, so `token in text_blob` is true
+    exactly when the token is a substring of one of these terms.
+    """
+    return set(text_blob(internship).split())
+
+
+# ================= SKILL VOCABULARY =================
+def _chunks(items: Iterable, size: int = 1000):
+    """Keep IN (...) lists below SQLite's bound-parameter limit on bulk rebuilds."""
+    items = list(items)
+    for n in range(0, len(items), size):
+        yield items[n:n + size]
+
+
+def _insert_ignore(connection, table):
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        return sqlite_insert(table).on_conflict_do_nothing()
+    if dialect == "postgresql":
+        return pg_insert(table).on_conflict_do_nothing()
+    return insert(table)
+
+
+def skill_ids(connection, names: Iterable[str]) -> Dict[str, int]:
+    """name -> skills.id, adding unknown names to the vocabulary."""
+    names = set(names)
+    if not names:
+        return {}
+    Skill = models.Skill
+    found: Dict[str, int] = {}
+    for chunk in _chunks(names):
+        found.update(connection.execute(select(Skill.name, Skill.id).where(Skill.name.in_(chunk))).all())
+    missing = names - found.keys()
+    if missing:
+        connection.execute(_insert_ignore(connection, Skill), [{"name": n} for n in missing])
+        for chunk in _chunks(missing):
+            found.update(
+                connection.execute(select(Skill.name, Skill.id).where(Skill.name.in_(chunk))).all()
+            )
+    return found
+
+
+def _write_links(connection, table, owner_col: str, owners: Dict[int, Set[str]]) -> None:
+    """Replace the skill links of each owner (student / internship)."""
+    if not owners:
+        return
+    connection.execute(delete(table).where(getattr(table.c, owner_col).in_(list(owners))))
+    ids = skill_ids(connection, set().union(*owners.values()))
+    rows = [
+        {owner_col: owner, "skill_id": ids[name]}
+        for owner, names in owners.items()
+        for name in names
+    ]
+    if rows:
+        connection.execute(insert(table), rows)
+
+
+def write_student_skills(connection, students: Iterable) -> None:
+    for chunk in _chunks(students):
+        _write_links(
+            connection,
+            models.StudentSkill.__table__,
+            "student_id",
+            {s.id: normalize_skills(s.skills) for s in chunk},
+        )
+
+
+def write_internship_index(connection, internships: Iterable) -> None:
+    for chunk in _chunks(internships):
+        _write_internship_chunk(connection, chunk)
+
+
+def _write_internship_chunk(connection, internships: List) -> None:
+    _write_links(
+        connection,
+        models.InternshipSkill.__table__,
+        "internship_id",
+        {i.id: normalize_skills(i.required_skills) for i in internships},
+    )
+
+    ids = [i.id for i in internships]
+    connection.execute(
+        delete(models.InternshipTerm).where(models.InternshipTerm.internship_id.in_(ids))
+    )
+    rows = [
+        {"internship_id": i.id, "token": t}
+        for i in internships
+        for t in text_terms(i)
+    ]
+    if rows:
+        connection.execute(insert(models.InternshipTerm), rows)
+
+
+def bump_catalog_version(connection) -> None:
+    connection.execute(
+        update(models.CatalogVersion).values(version=models.CatalogVersion.version + 1)
+    )
+
+
+# ================= KEEP INDEX IN SYNC WITH ORM WRITES =================
+@event.listens_for(models.Internship, "after_insert")
+def _after_insert(mapper, connection, target):
+    write_internship_index(connection, [target])
+    bump_catalog_version(connection)
+
+
+@event.listens_for(models.Internship, "after_update")
+def _after_update(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[f].history.has_changes() for f in INDEXED_FIELDS + ("location",)):
+        write_internship_index(connection, [target])
+        bump_catalog_version(connection)
+
+
+@event.listens_for(models.Internship, "after_delete")
+def _after_delete(mapper, connection, target):
+    for table in (models.InternshipTerm, models.InternshipSkill):
+        connection.execute(delete(table).where(table.internship_id == target.id))
+    bump_catalog_version(connection)
+
+
+@event.listens_for(models.Student, "after_insert")
+def _student_after_insert(mapper, connection, target):
+    write_student_skills(connection, [target])
+
+
+@event.listens_for(models.Student, "after_update")
+def _student_after_update(mapper, connection, target):
+    if inspect(target).attrs.skills.history.has_changes():
+        write_student_skills(connection, [target])
+
+
+def get_catalog_version(db: Session) -> int:
+    version = db.query(models.CatalogVersion.version).filter_by(id=1).scalar()
+    return version or 0
+
+
+# ================= BACKFILL =================
+def rebuild_index(db: Session) -> int:
+    """Re-index every internship (used for backfill of rows created before the index)."""
+    internships = db.query(models.Internship).all()
+    db.execute(delete(models.InternshipTerm))
+    db.execute(delete(models.InternshipSkill))
+    write_internship_index(db.connection(), internships)
+    bump_catalog_version(db.connection())
+    db.commit()
+    return len(internships)
+
+
+def ensure_index(db: Session) -> None:
+    if not db.get(models.CatalogVersion, 1):
+        db.add(models.CatalogVersion(id=1, version=0))
+        db.commit()
+
+    unindexed = (
+        db.query(models.Internship.id)
+        .filter(~models.Internship.id.in_(select(models.InternshipTerm.internship_id)))
+        .first()
+    )
+    if unindexed:
+        rebuild_index(db)
@@ -0,0 +1,230 @@
+# backend/app/services/uploads.py
+"""
+Streaming file uploads (resumes, task deliverables).
+
+The multipart body is parsed as it arrives instead of through UploadFile
+(which reads the whole request before the endpoint runs): the "file" part is
+cut into UPLOAD_CHUNK_BYTES chunks that are written and SHA-256 hashed in the
+threadpool, into a temporary file next to the destination. The size limit is
+checked against Content-Length before anything is read and again while
+streaming, so an oversized upload is refused early. save_as() renames the
+finished file into place (same directory: atomic), so /uploads never serves
+a partial file. Memory per upload is about one chunk, whatever the size.
+"""
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.requests import ClientDisconnect, Request
+
+from app.core.config import settings
+from app.core.paths import PARTIAL_UPLOAD_PREFIX, PARTIAL_UPLOAD_SUFFIX
+
+FIELD = "file"
+MULTIPART_OVERHEAD = 64 * 1024  # boundaries, part headers, small extra fields
+
+# routes that call receive_file() declare no File(...) parameter, so the
+# request body is documented here instead
+OPENAPI_FILE_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": [FIELD],
+                    "properties": {FIELD: {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+class UploadError(ValueError):
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class StagedUpload:
+    filename: str               # client file name, without any directory part
+    content_type: Optional[str]
+    size: int
+    sha256: str
+    temp_path: Path
+
+    def save_as(self, path: Path) -> Path:
+        """Atomic rename into place (path must be in the staging directory)."""
+        os.replace(self.temp_path, path)
+        return path
+
+    def discard(self) -> None:
+        self.temp_path.unlink(missing_ok=True)
+
+
+class _Sink:
+    """Temporary file + running hash; its methods run in the threadpool."""
+
+    def __init__(self, dest_dir: Path):
+        fd, name = tempfile.mkstemp(dir=dest_dir, prefix=PARTIAL_UPLOAD_PREFIX, suffix=PARTIAL_UPLOAD_SUFFIX)
+        self.path = Path(name)
+        self.file = os.fdopen(fd, "wb")
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+        self.hash.update(data)
+        self.size += len(data)
+
+    def finish(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+    def discard(self) -> None:
+        self.file.close()
+        self.path.unlink(missing_ok=True)
+
+
+class _FilePart:
+    """python-multipart callbacks: collects the bytes of the first "file" part."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.buffer = bytearray()
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self.size = 0
+        self.receiving = False
+        self.done = False
+        self._headers: Dict[bytes, bytes] = {}
+        self._field = b""
+        self._value = b""
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self._part_begin,
+            "on_header_field": self._header_field,
+            "on_header_value": self._header_value,
+            "on_header_end": self._header_end,
+            "on_headers_finished": self._headers_finished,
+            "on_part_data": self._part_data,
+            "on_part_end": self._part_end,
+        }
+
+    def _part_begin(self) -> None:
+        self._headers = {}
+
+    def _header_field(self, data: bytes, start: int, end: int) -> None:
+        self._field += data[start:end]
+
+    def _header_value(self, data: bytes, start: int, end: int) -> None:
+        self._value += data[start:end]
+
+    def _header_end(self) -> None:
+        self._headers[self._field.lower()] = self._value
+        self._field, self._value = b"", b""
+
+    def _headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename", b"").decode("utf-8", "replace")
+        if name == FIELD and filename and not self.done:
+            self.receiving = True
+            self.filename = Path(filename.replace("\\", "/")).name or "upload"
+            content_type = self._headers.get(b"content-type")
+            self.content_type = content_type.decode("latin-1") if content_type else None
+
+    def _part_data(self, data: bytes, start: int, end: int) -> None:
+        if not self.receiving:
+            return
+        self.size += end - start
+        if self.size > self.max_bytes:
+            raise UploadError(_too_large(self.max_bytes), 413)
+        self.buffer += data[start:end]
+
+    def _part_end(self) -> None:
+        if self.receiving:
+            self.receiving = False
+            self.done = True
+
+
+def _too_large(max_bytes: int) -> str:
+    return f"File too large (max {max_bytes // 1_048_576} MB)"
+
+
+async def receive_file(request: Request, dest_dir: Path, max_bytes: int) -> StagedUpload:
+    """
+    Stream the multipart "file" field of `request` into a temporary file in
+    dest_dir. UploadError (status_code 400 / 413) when the body is not a
+    multipart upload, has no file, or exceeds max_bytes; nothing is left on
+    disk in that case.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or not params.get(b"boundary"):
+        raise UploadError("Expected a multipart/form-data upload")
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > max_bytes + MULTIPART_OVERHEAD:
+        raise UploadError(_too_large(max_bytes), 413)  # before reading a byte
+
+    part = _FilePart(max_bytes)
+    parser = MultipartParser(params[b"boundary"], part.callbacks())
+    try:
+        sink = await _stream(request, parser, part, dest_dir, max_bytes)
+    except MultipartParseError as e:
+        raise UploadError(f"Malformed multipart body: {e}") from e
+    except ClientDisconnect as e:
+        raise UploadError("Upload interrupted") from e
+
+    return StagedUpload(
+        filename=part.filename,
+        content_type=part.content_type,
+        size=sink.size,
+        sha256=sink.hash.hexdigest(),
+        temp_path=sink.path,
+    )
+
+
+async def _stream(request: Request, parser: MultipartParser, part: _FilePart, dest_dir: Path, max_bytes: int) -> _Sink:
+    """Body -> parser -> fixed-size chunks -> temporary file; removed again on any error."""
+    chunk_bytes = settings.UPLOAD_CHUNK_BYTES
+    sink: Optional[_Sink] = None
+    received = 0
+    try:
+        async for data in request.stream():
+            received += len(data)
+            if received > max_bytes + MULTIPART_OVERHEAD:  # chunked bodies / large extra fields
+                raise UploadError(_too_large(max_bytes), 413)
+            parser.write(data)
+            while len(part.buffer) >= chunk_bytes:
+                if sink is None:
+                    sink = await run_in_threadpool(_Sink, dest_dir)
+                chunk = bytes(part.buffer[:chunk_bytes])
+                del part.buffer[:chunk_bytes]
+                await run_in_threadpool(sink.write, chunk)
+        parser.finalize()
+
+        if not part.done:
+            raise UploadError(f"No file uploaded (form field {FIELD!r})")
+        if sink is None:
+            sink = await run_in_threadpool(_Sink, dest_dir)
+        if part.buffer:
+            chunk = bytes(part.buffer)
+            part.buffer.clear()
+            await run_in_threadpool(sink.write, chunk)
+        await run_in_threadpool(sink.finish)
+        return sink
+    except BaseException:  # includes cancellation (client gone, shutdown)
+        if sink is not None:
+            sink.discard()
+        raise
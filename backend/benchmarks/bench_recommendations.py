@@ -0,0 +1,249 @@
+# backend/benchmarks/bench_recommendations.py
+"""
+Recommendation engine benchmark. Run from backend/:
+
+    python -m benchmarks.bench_recommendations \\
+        --internships 1000 10000 --students 10000 --requests 300 --out bench.json
+
+For every (internships, students) size a fresh SQLite file is seeded with the
+synthetic generator (or reused with --reuse) and these scenarios are timed:
+
+  inprocess_live         get_recommendations(skills=...) -> scoring engine
+  inprocess_keywords     same + keyword search (FTS5 / substring fallback)
+  inprocess_precomputed  student's own profile served from student_recommendations
+  asgi_live / asgi_page  full HTTP stack through the ASGI app (httpx)
+
+In-process scenarios clear the response cache before every request so the
+matcher itself is measured; ASGI scenarios run with the cache as deployed.
+Results (p50/p95/p99 ms, throughput) are written as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+KEYWORDS = ["data", "backend intern", "python", "cloud api", "design", "ml research", "dash"]
+
+
+def _summary(samples_ms, wall_s):
+    a = np.asarray(samples_ms)
+    return {
+        "requests": len(a),
+        "p50_ms": round(float(np.percentile(a, 50)), 3),
+        "p95_ms": round(float(np.percentile(a, 95)), 3),
+        "p99_ms": round(float(np.percentile(a, 99)), 3),
+        "mean_ms": round(float(a.mean()), 3),
+        "max_ms": round(float(a.max()), 3),
+        "throughput_rps": round(len(a) / wall_s, 1) if wall_s else None,
+    }
+
+
+def _time_calls(fn, args_list):
+    samples = []
+    started = time.perf_counter()
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return _summary(samples, time.perf_counter() - started)
+
+
+# ================= IN-PROCESS =================
+def bench_inprocess(n_requests, rng, limit):
+    from app.api.routes.internships import get_recommendations
+    from app.core.identity import CurrentUser
+    from app.db import models
+    from app.db.database import AsyncSessionLocal, SessionLocal
+    from app.services.rec_cache import recommendation_cache
+
+    with SessionLocal() as db:
+        students = db.query(
+            models.Student.id, models.Student.skills, models.User.id.label("user_id"),
+            models.User.email, models.User.full_name,
+        ).join(models.User, models.User.id == models.Student.user_id).all()
+    picks = [rng.choice(students) for _ in range(n_requests)]
+
+    loop = asyncio.new_event_loop()
+
+    def call(db, student, keywords, own_profile):
+        recommendation_cache.invalidate_catalog()
+        user = CurrentUser(student.user_id, student.email, student.full_name, "student", student.id)
+        return loop.run_until_complete(get_recommendations(
+            keywords=keywords,
+            skills="" if own_profile else (student.skills or ","),
+            limit=limit,
+            cursor=None,
+            db=db,
+            user=user,
+        ))
+
+    results = {}
+    db = AsyncSessionLocal()
+    try:
+        call(db, picks[0], "", False)  # warm-up: builds the scoring engine
+        results["inprocess_live"] = _time_calls(call, [(db, s, "", False) for s in picks])
+        results["inprocess_keywords"] = _time_calls(
+            call, [(db, s, rng.choice(KEYWORDS), False) for s in picks]
+        )
+        results["inprocess_precomputed"] = _time_calls(call, [(db, s, "", True) for s in picks])
+    finally:
+        loop.run_until_complete(db.close())
+        loop.close()
+    return results
+
+
+# ================= ASGI =================
+async def _asgi_run(app, paths_tokens, concurrency):
+    import httpx
+
+    samples = []
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(path, token):
+            async with sem:
+                t0 = time.perf_counter()
+                r = await client.get(path, headers={"Authorization": f"Bearer {token}"})
+                samples.append((time.perf_counter() - t0) * 1000)
+                r.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(p, t) for p, t in paths_tokens))
+        wall = time.perf_counter() - started
+    return _summary(samples, wall)
+
+
+def bench_asgi(n_requests, rng, concurrency, limit):
+    from urllib.parse import quote
+
+    from app.core.security import create_access_token
+    from app.db import models
+    from app.db.database import SessionLocal
+    from app.main import app, startup
+
+    startup()  # ASGITransport does not run the lifespan
+
+    with SessionLocal() as db:
+        students = db.query(models.Student.user_id, models.Student.skills).all()
+    picks = [rng.choice(students) for _ in range(n_requests)]
+
+    def token(uid):
+        return create_access_token({"sub": str(uid), "role": "student"})
+
+    live = [
+        (f"/internships/recommendations?skills={quote(s.skills or ',')}", token(s.user_id))
+        for s in picks
+    ]
+    page = [
+        (f"/internships/recommendations?limit={limit}&keywords={quote(rng.choice(KEYWORDS))}",
+         token(s.user_id))
+        for s in picks
+    ]
+
+    return {
+        "asgi_live": asyncio.run(_asgi_run(app, live, concurrency)),
+        "asgi_page": asyncio.run(_asgi_run(app, page, concurrency)),
+    }
+
+
+# ================= DRIVER =================
+def run_size(args, internships, students):
+    """Runs in a fresh interpreter per size (settings/engine bind DATABASE_URL at import)."""
+    db_path = Path(args.workdir) / f"bench_{internships}x{students}.db"
+    if db_path.exists() and not args.reuse:
+        db_path.unlink()
+    seeded = db_path.exists()
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+    from app.main import bootstrap
+
+    bootstrap()  # schema, migrations, FTS
+    from app.db.database import SessionLocal
+    from app.services import search
+    from app.services.precompute import recompute_students
+
+    from benchmarks.synthetic import generate
+
+    timings = {}
+    if not seeded:
+        t0 = time.perf_counter()
+        generate(internships, students, vocab_size=args.vocab, zipf=args.zipf, seed=args.seed)
+        timings["seed_s"] = round(time.perf_counter() - t0, 2)
+        t0 = time.perf_counter()
+        with SessionLocal() as db:
+            recompute_students(db)
+        timings["precompute_s"] = round(time.perf_counter() - t0, 2)
+
+    rng = random.Random(args.seed)
+    result = {
+        "internships": internships,
+        "students": students,
+        "fts5": search.fts_available(),
+        "setup": timings,
+        "scenarios": bench_inprocess(args.requests, rng, args.limit),
+    }
+    if not args.no_asgi:
+        result["scenarios"].update(bench_asgi(args.requests, rng, args.concurrency, args.limit))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_recommendations")
+    parser.add_argument("--internships", type=int, nargs="+", default=[1000])
+    parser.add_argument("--students", type=int, nargs="+", default=[10000])
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--limit", type=int, default=20, help="page size for paged scenarios")
+    parser.add_argument("--concurrency", type=int, default=8, help="in-flight ASGI requests")
+    parser.add_argument("--vocab", type=int, default=500, help="distinct skills")
+    parser.add_argument("--zipf", type=float, default=1.1, help="skill popularity exponent")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", default=".bench", help="where benchmark databases live")
+    parser.add_argument("--reuse", action="store_true", help="reuse an already seeded database")
+    parser.add_argument("--no-asgi", action="store_true")
+    parser.add_argument("--out", help="write JSON here (default: stdout)")
+    parser.add_argument("--_one", nargs=2, type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args._one:
+        print(json.dumps(run_size(args, *args._one)))
+        return
+
+    import subprocess
+
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    passthrough = list(argv if argv is not None else sys.argv[1:])
+    runs = []
+    for i in args.internships:
+        for s in args.students:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_recommendations", *passthrough,
+                 "--_one", str(i), str(s)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            runs.append(json.loads(out.strip().splitlines()[-1]))
+
+    report = {
+        "benchmark": "recommendations",
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {k: v for k, v in vars(args).items() if not k.startswith("_")},
+        "runs": runs,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# backend/benchmarks/synthetic.py
+"""
+Synthetic catalog generator for the recommendation benchmarks.
+
+Skills follow a Zipf-like popularity curve (a few very common skills such as
+python / sql, a long tail of rare ones), which is what real postings look like
+and what makes the inverted index / sparse matrices behave realistically.
+
+Must be imported after DATABASE_URL points at the benchmark database.
+"""
+
+import random
+from typing import List
+
+from sqlalchemy import insert, text
+
+COMMON_SKILLS = [
+    "python", "sql", "javascript", "react", "java", "excel", "git", "docker",
+    "aws", "machine learning", "html", "css", "node", "c++", "figma", "linux",
+    "data analysis", "communication", "typescript", "go", "kubernetes", "django",
+    "fastapi", "pandas", "tableau", "power bi", "rust", "swift", "kotlin", "llm",
+]
+TITLE_WORDS = [
+    "backend", "frontend", "full stack", "data", "ml", "cloud", "mobile", "qa",
+    "devops", "product", "design", "analytics", "security", "research", "platform",
+]
+ROLES = ["intern", "engineering intern", "analyst intern", "developer intern", "trainee"]
+COMPANIES = [f"{a}{b}" for a in ("Acme", "Globex", "Initech", "Umbrella", "Hooli", "Vandelay")
+             for b in ("", " Labs", " Tech", " Systems", " AI")]
+INDUSTRIES = ["software", "finance", "healthcare", "education", "retail", "ai", "logistics"]
+CITIES = ["bangalore", "mangalore", "pune", "hyderabad", "remote", "chennai", "delhi"]
+FILLER = ("build maintain ship test review deploy scale improve analyze design "
+          "customer internal pipeline dashboard service api model team product").split()
+
+
+def skill_vocabulary(size: int) -> List[str]:
+    return COMMON_SKILLS[:size] + [f"skill-{k}" for k in range(max(0, size - len(COMMON_SKILLS)))]
+
+
+class SkillSampler:
+    """Draws distinct skills with Zipf(s) popularity."""
+
+    def __init__(self, vocab: List[str], s: float, rng: random.Random):
+        self.vocab = vocab
+        self.weights = [1 / (k + 1) ** s for k in range(len(vocab))]
+        self.rng = rng
+
+    def sample(self, lo: int, hi: int) -> List[str]:
+        k = self.rng.randint(lo, hi)
+        picked = set(self.rng.choices(self.vocab, weights=self.weights, k=k * 2))
+        return list(picked)[:k]
+
+
+def _batched(rows, size=5000):
+    for n in range(0, len(rows), size):
+        yield rows[n:n + size]
+
+
+def generate(
+    internships: int,
+    students: int,
+    vocab_size: int = 500,
+    zipf: float = 1.1,
+    seed: int = 42,
+) -> None:
+    """Fill the (empty) configured database; indexes are rebuilt afterwards."""
+    from app.core.security import pwd_context
+    from app.db import models
+    from app.db.database import SessionLocal, engine
+    from app.services.skill_index import rebuild_index, write_student_skills
+
+    rng = random.Random(seed)
+    sampler = SkillSampler(skill_vocabulary(vocab_size), zipf, rng)
+    password = pwd_context.hash("benchmark")  # one hash, reused
+
+    internship_rows = []
+    for _ in range(internships):
+        title = f"{rng.choice(TITLE_WORDS)} {rng.choice(ROLES)}".title()
+        internship_rows.append({
+            "title": title,
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(CITIES),
+            "industry": rng.choice(INDUSTRIES),
+            "required_skills": ", ".join(sampler.sample(2, 8)),
+            "description": " ".join(rng.choices(FILLER, k=rng.randint(8, 30))),
+        })
+
+    user_rows = [
+        {"email": f"student{n}@bench.local", "hashed_password": password,
+         "full_name": f"Student {n}", "role": "student"}
+        for n in range(students)
+    ]
+
+    with engine.begin() as conn:
+        for chunk in _batched(internship_rows):
+            conn.execute(insert(models.Internship), chunk)
+        for chunk in _batched(user_rows):
+            conn.execute(insert(models.User), chunk)
+        user_ids = conn.execute(
+            text("SELECT id FROM users WHERE role = 'student' ORDER BY id")
+        ).scalars().all()
+        student_rows = [
+            {"user_id": uid, "skills": ",".join(sampler.sample(1, 10))}
+            for uid in user_ids
+        ]
+        for chunk in _batched(student_rows):
+            conn.execute(insert(models.Student), chunk)
+
+    # bulk core inserts bypass the ORM listeners (the FTS triggers still fire)
+    # -> rebuild the derived skill / term tables once
+    with SessionLocal() as db:
+        rebuild_index(db)
+        S = models.Student
+        write_student_skills(db.connection(), db.execute(S.__table__.select()).all())
+        db.commit()
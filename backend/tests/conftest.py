@@ -0,0 +1,84 @@
+# backend/tests/conftest.py
+"""
+One application + temporary SQLite database for the whole test session.
+Settings bind DATABASE_URL when app.core.config is imported, so the
+environment is set before anything from `app` is loaded.
+"""
+
+import itertools
+import os
+import tempfile
+
+_DATA_DIR = tempfile.mkdtemp(prefix="internship-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DATA_DIR}/test.db"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["AUDIT_LOG_MODE"] = "sync"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.db.database import SessionLocal
+from app.db import models
+from app.main import app
+
+_emails = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def db(client):  # the lifespan creates the schema
+    with SessionLocal() as session:
+        yield session
+
+
+def register(client, role: str = "student") -> dict:
+    """New user of `role`; returns its Authorization header."""
+    email = f"{role}{next(_emails)}@example.com"
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "secret", "full_name": f"{role.title()} {email}", "role": role},
+    )
+    assert r.status_code == 200, r.text
+    return {"Authorization": "Bearer " + r.json()["access_token"]}
+
+
+@pytest.fixture
+def student(client):
+    return register(client, "student")
+
+
+@pytest.fixture
+def admin(client):
+    return register(client, "admin")
+
+
+def add_internships(db, specs, company: str = "Acme") -> list:
+    """specs: (title, required_skills) pairs; returns the new ids in order."""
+    rows = [models.Internship(title=t, company=company, required_skills=s) for t, s in specs]
+    db.add_all(rows)
+    db.commit()
+    return [r.id for r in rows]
+
+
+def add_student(db, full_name: str, resume_url: str | None = None) -> models.Student:
+    email = f"student{next(_emails)}@example.com"
+    user = models.User(email=email, hashed_password="-", full_name=full_name, role="student")
+    student = models.Student(user=user, skills="", resume_url=resume_url)
+    db.add(student)
+    db.commit()
+    return student
+
+
+def add_application(db, student, internship_id: int, status: str = "pending", **fields) -> models.Application:
+    app = models.Application(
+        student_id=student.id, internship_id=internship_id, status=status,
+        progress_status="pending", resume_url=student.resume_url, **fields,
+    )
+    db.add(app)
+    db.commit()
+    return app
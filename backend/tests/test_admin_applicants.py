@@ -0,0 +1,125 @@
+# backend/tests/test_admin_applicants.py
+
+import pytest
+
+from app.db.database import SessionLocal
+from app.db import models
+from conftest import add_application, add_internships, add_student
+
+STATUSES = ("pending", "approved", "rejected")
+
+
+@pytest.fixture(scope="module")
+def internship(client):
+    with SessionLocal() as db:
+        listed, other = add_internships(db, [("Applicants", "python"), ("Elsewhere", "")], company="Keyset Co")
+        for n in range(8):
+            student = add_student(db, f"Applicant {n}", resume_url=f"/uploads/resumes/cv{n}.pdf")
+            add_application(db, student, listed, STATUSES[n % 3])
+        add_application(db, add_student(db, "Zed Unique"), listed, "approved")
+        add_application(db, add_student(db, "Not Listed"), other)
+        return listed
+
+
+def _get(client, admin, internship, **params):
+    r = client.get(f"/admin/internships/{internship}/applicants", params=params, headers=admin)
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def _pages(client, admin, internship, limit, **params):
+    items, cursor, totals = [], None, set()
+    while True:
+        page = _get(client, admin, internship, limit=limit, **params, **({"cursor": cursor} if cursor else {}))
+        assert len(page["items"]) <= limit
+        items += page["items"]
+        totals.add(page["total"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items, totals
+
+
+@pytest.mark.parametrize("limit", [1, 4, 50])
+@pytest.mark.parametrize("status", [None, "approved", "all"])
+def test_keyset_pages_match_the_full_list(client, admin, internship, limit, status):
+    params = {"status": status} if status else {}
+    full = _get(client, admin, internship, **params)
+    items, totals = _pages(client, admin, internship, limit, **params)
+
+    assert items == full
+    assert totals == {len(full)}
+    assert [it["id"] for it in full] == sorted((it["id"] for it in full), reverse=True)
+    if status == "approved":
+        assert {it["status"] for it in full} == {"approved"}
+
+
+def test_counts_and_search(client, admin, internship):
+    page = _get(client, admin, internship, limit=2)
+    assert page["counts"] == {"pending": 3, "approved": 4, "rejected": 2}
+    assert page["total"] == 9
+    assert "Not Listed" not in [it["name"] for it in _get(client, admin, internship)]
+
+    found = _get(client, admin, internship, q="zed uni", limit=5)
+    assert [it["name"] for it in found["items"]] == ["Zed Unique"]
+    assert found["total"] == 1 and found["next_cursor"] is None
+
+
+def test_resume_is_the_application_snapshot(client, admin, internship, db):
+    student = db.query(models.Student).join(models.User).filter(models.User.full_name == "Applicant 0").one()
+    student.resume_url = "/uploads/resumes/newer.pdf"
+    db.commit()
+
+    row = next(it for it in _get(client, admin, internship) if it["name"] == "Applicant 0")
+    assert row["resume_url"] == "/uploads/resumes/cv0.pdf"
+
+
+def test_admins_only(client, student, internship):
+    r = client.get(f"/admin/internships/{internship}/applicants", headers=student)
+    assert r.status_code == 403
+
+
+def _events(db, internship):
+    return sorted(
+        (log.student_id, log.event, log.message)
+        for log in db.query(models.ApplicationLog).filter_by(internship_id=internship)
+    )
+
+
+def test_bulk_decision_changes_only_pending_applications(client, admin, db):
+    internship, = add_internships(db, [("Bulk Role", "")], company="Bulk Co")
+    apps = [add_application(db, add_student(db, f"Bulk {status}"), internship, status)
+            for status in ("pending", "pending", "approved", "rejected", "pending")]
+    p1, p2, approved, rejected, untouched = apps
+    ids = [p1.id, approved.id, p2.id, rejected.id, p1.id, 10 ** 9]
+
+    r = client.post("/admin/applications/bulk-decision", headers=admin,
+                    json={"application_ids": ids, "decision": "approve", "remarks": "welcome"})
+    assert r.status_code == 200, r.text
+    assert r.json() == {
+        "decision": "approved",
+        "updated": [p1.id, p2.id],
+        "already_decided": [{"id": approved.id, "status": "approved"},
+                            {"id": rejected.id, "status": "rejected"}],
+        "missing": [10 ** 9],
+    }
+
+    db.expire_all()
+    assert [(a.status, a.progress_status) for a in apps] == [
+        ("approved", "active"), ("approved", "active"), ("approved", "pending"),
+        ("rejected", "pending"), ("pending", "pending"),
+    ]
+    assert p1.approved_at is not None and p1.remarks_admin == "welcome"
+    assert approved.approved_at is None and untouched.approved_at is None
+    assert _events(db, internship) == sorted(
+        (a.student_id, "APPROVED", "Admin approved application: welcome") for a in (p1, p2)
+    )
+
+    # a second decision on the same rows changes (and logs) only what is still pending
+    r = client.post("/admin/applications/bulk-decision", headers=admin,
+                    json={"application_ids": [p1.id, untouched.id], "decision": "reject"})
+    assert (r.json()["updated"], r.json()["already_decided"]) == (
+        [untouched.id], [{"id": p1.id, "status": "approved"}])
+    db.expire_all()
+    assert (untouched.status, untouched.progress_status) == ("rejected", "ended")
+    assert [e for e in _events(db, internship) if e[1] == "REJECTED"] == [
+        (untouched.student_id, "REJECTED", "Admin rejected application")]
@@ -0,0 +1,59 @@
+# backend/tests/test_analytics.py
+
+from sqlalchemy import select
+
+from app.db import models
+from app.db.database import engine
+from app.services import analytics
+from conftest import add_internships, register
+
+AGGREGATES = (models.InternshipStatusCount, models.ApprovalTimeStat, models.SubmissionWeek)
+
+
+def _snapshot(conn) -> dict:
+    return {
+        model.__tablename__: sorted(tuple(r) for r in conn.execute(select(model.__table__)))
+        for model in AGGREGATES
+    }
+
+
+def _applicant(client, db):
+    """A student who can apply: (auth header, students.id)."""
+    headers = register(client, "student")
+    client.get("/students/me/profile", headers=headers)  # creates the profile
+    student = db.query(models.Student).order_by(models.Student.id.desc()).first()
+    student.resume_url = "/uploads/resumes/cv.pdf"
+    db.commit()
+    return headers, student.id
+
+
+def test_incremental_aggregates_match_a_rebuild(client, admin, db):
+    first, second = add_internships(db, [("Counted", ""), ("Counted Too", "")], company="Stats Co")
+    s1, s2, s3, s4 = (_applicant(client, db) for _ in range(4))
+    for headers, _ in (s1, s2, s3, s4):
+        assert client.post(f"/applications/apply/{first}", headers=headers).status_code == 200
+    assert client.post(f"/applications/apply/{second}", headers=s1[0]).status_code == 200
+
+    def app_id(student, internship):
+        return db.query(models.Application.id).filter_by(student_id=student[1], internship_id=internship).scalar()
+
+    assert client.patch(f"/admin/applications/{app_id(s1, first)}/approve", headers=admin).status_code == 200
+    assert client.patch(f"/admin/applications/{app_id(s2, first)}/reject", headers=admin).status_code == 200
+    r = client.post("/admin/applications/bulk-decision", headers=admin, json={
+        "application_ids": [app_id(s3, first), app_id(s1, second)], "decision": "approve"})
+    assert len(r.json()["updated"]) == 2
+
+    # cancelling approved / rejected applications takes their counters back to zero
+    for headers, internship in ((s1, first), (s1, second), (s2, first)):
+        assert client.delete(f"/applications/cancel/{internship}", headers=headers[0]).status_code == 200
+
+    with engine.connect() as conn:
+        incremental = _snapshot(conn)
+        analytics.rebuild(conn)
+        rebuilt = _snapshot(conn)
+        conn.rollback()
+    assert incremental == rebuilt
+
+    status = {(r[0], r[1]): r[2] for r in incremental["analytics_internship_status"] if r[0] in (first, second)}
+    assert status == {(first, "approved"): 1, (first, "pending"): 1}
+    assert [r[:2] for r in incremental["analytics_approval_times"] if r[0] in (first, second)] == [(first, 1)]
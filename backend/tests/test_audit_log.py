@@ -0,0 +1,113 @@
+# backend/tests/test_audit_log.py
+
+import threading
+from datetime import datetime
+
+from app.services.audit_log import AuditLogSink
+
+
+class FakeWrite:
+    def __init__(self):
+        self.rows = []
+        self.threads = set()
+        self.down = False
+
+    def __call__(self, rows):
+        if self.down or any(r["event"] == "BAD" for r in rows):
+            raise RuntimeError("database is down")
+        self.rows += rows
+        self.threads.add(threading.current_thread().name)
+
+
+def _sink(write, spool_dir, batch_size=10):
+    sink = AuditLogSink(write, batch_size=batch_size, flush_seconds=0.01,
+                        max_queued=100, put_timeout=1, spool_dir=spool_dir)
+    sink.retry_delay = 0
+    return sink
+
+
+def _rows(*events):
+    return [{"application_id": None, "student_id": 1, "internship_id": 2, "event": e,
+             "message": "", "created_at": datetime(2026, 1, 1, 12, 0, n)} for n, e in enumerate(events)]
+
+
+def test_flush_writes_everything_queued(tmp_path):
+    write = FakeWrite()
+    sink = _sink(write, tmp_path)
+    sink.submit(_rows(*(f"E{n}" for n in range(25))))
+    sink.flush()
+    assert [r["event"] for r in write.rows] == [f"E{n}" for n in range(25)]
+    assert sink.stats()["written"] == 25 and sink.stats()["queued"] == 0
+    assert write.threads == {"audit-log-writer"}
+    sink.close()
+
+
+def test_close_drains_then_writes_inline(tmp_path):
+    write = FakeWrite()
+    sink = _sink(write, tmp_path)
+    sink.submit(_rows("A", "B"))
+    sink.close()
+    assert [r["event"] for r in write.rows] == ["A", "B"]
+
+    sink.submit(_rows("C"))  # after close: on the caller's thread, before returning
+    assert [r["event"] for r in write.rows] == ["A", "B", "C"]
+    assert threading.current_thread().name in write.threads
+
+
+def test_failed_batch_is_spooled_and_replayed(tmp_path):
+    write = FakeWrite()
+    sink = _sink(write, tmp_path)
+    sink.start()
+    write.down = True
+    sink.submit(_rows("A", "B", "C"))
+    sink.flush()
+    assert write.rows == []
+    assert sink.stats()["spooled"] == 3 and sink.stats()["failed"] == 0
+    assert len(list(tmp_path.glob("*.ndjson"))) == 1
+
+    write.down = False
+    sink.submit(_rows("D"))  # the next successful flush writes the spool back
+    sink.flush()
+    assert [r["event"] for r in write.rows] == ["D", "A", "B", "C"]
+    assert write.rows[1] == _rows("A")[0]  # created_at is a datetime again
+    assert sink.stats()["replayed"] == 3
+    assert list(tmp_path.iterdir()) == []
+    sink.close()
+
+
+def test_spool_left_by_an_earlier_run_is_written_on_start(tmp_path):
+    write = FakeWrite()
+    crashed = _sink(write, tmp_path)
+    write.down = True
+    crashed.submit(_rows("A"))
+    crashed.flush()
+    crashed.close()
+
+    write.down = False
+    restarted = _sink(write, tmp_path)
+    restarted.start()
+    restarted.flush()
+    restarted.close()
+    assert [r["event"] for r in write.rows] == ["A"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_a_batch_that_keeps_failing_does_not_block_the_spool(tmp_path):
+    write = FakeWrite()
+    sink = _sink(write, tmp_path)
+    write.down = True
+    for events in (("BAD",), ("A",)):  # two spool files, the bad one first
+        sink.submit(_rows(*events))
+        sink.flush()
+
+    write.down = False
+    for event in ("B", "C", "D"):
+        sink.submit(_rows(event))
+        sink.flush()
+    sink.close()
+
+    assert [r["event"] for r in write.rows] == ["B", "A", "C", "D"]
+    assert sink.stats()["dead_lettered"] == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["dead"]
+    dead, = (tmp_path / "dead").iterdir()
+    assert '"BAD"' in dead.read_text()
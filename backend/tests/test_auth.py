@@ -0,0 +1,84 @@
+# backend/tests/test_auth.py
+
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from app.core import security
+from app.db import models
+
+_emails = itertools.count(1)
+
+
+def _register(client, password="secret"):
+    return client.post("/auth/register", json={
+        "email": f"auth{next(_emails)}@example.com", "password": password,
+        "full_name": "Auth Test", "role": "student",
+    })
+
+
+def test_register_then_login(client):
+    email = f"auth{next(_emails)}@example.com"
+    body = {"email": email, "password": "pw", "full_name": "A", "role": "student"}
+    assert client.post("/auth/register", json=body).status_code == 200
+    assert client.post("/auth/register", json=body).status_code == 400
+
+    r = client.post("/auth/login", json={"email": email, "password": "pw"})
+    assert r.status_code == 200 and r.json()["role"] == "student"
+    assert client.post("/auth/login", json={"email": email, "password": "nope"}).status_code == 401
+
+
+def test_login_rehashes_an_outdated_cost(client, db):
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("pw")
+    user = models.User(email=f"auth{next(_emails)}@example.com", hashed_password=old_hash,
+                       full_name="Old", role="student")
+    db.add(user)
+    db.commit()
+
+    assert client.post("/auth/login", json={"email": user.email, "password": "pw"}).status_code == 200
+    db.refresh(user)
+    assert user.hashed_password != old_hash
+    assert not security.pwd_context.needs_update(user.hashed_password)
+
+
+def test_hashing_over_the_limit_answers_503(client, monkeypatch):
+    release, started = threading.Event(), threading.Semaphore(0)
+    real_hash = security.pwd_context.hash
+
+    def slow_hash(password):
+        started.release()
+        release.wait(10)
+        return real_hash(password)
+
+    monkeypatch.setattr(security, "_hash_slots", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(security.pwd_context, "hash", slow_hash)
+
+    with ThreadPoolExecutor(2) as pool:
+        held = [pool.submit(_register, client) for _ in range(2)]
+        try:
+            for _ in range(2):
+                assert started.acquire(timeout=10)
+
+            r = _register(client)
+            assert r.status_code == 503
+            assert r.headers["Retry-After"] == "1"
+        finally:
+            release.set()
+        assert [f.result().status_code for f in held] == [200, 200]
+
+    assert _register(client).status_code == 200  # slots were given back
+
+
+def test_cached_identity_opens_no_session(client, monkeypatch):
+    from app.api import deps
+
+    headers = {"Authorization": "Bearer " + _register(client).json()["access_token"]}
+    opened = []
+    real_factory = deps.AsyncSessionLocal
+    monkeypatch.setattr(deps, "AsyncSessionLocal", lambda: opened.append(1) or real_factory())
+
+    assert client.get("/students/me/profile", headers=headers).status_code == 200  # miss -> loads
+    assert client.get("/students/me/profile", headers=headers).status_code == 200  # cached
+    assert len(opened) == 1
@@ -0,0 +1,21 @@
+# backend/tests/test_bootstrap.py
+
+from app.db import models
+from app.db.bootstrap import bootstrap_schema
+from app.db.database import engine
+
+
+def test_unchanged_schema_still_reports_dropped_indexes(client, capsys):
+    assert bootstrap_schema(engine) is False  # fingerprint matches: no DDL
+    assert "missing index" not in capsys.readouterr().out
+
+    index = next(ix for ix in models.ApplicationLog.__table__.indexes
+                 if ix.name == "ix_application_logs_event_created")
+    with engine.begin() as conn:
+        index.drop(conn)
+    try:
+        assert bootstrap_schema(engine) is False
+        assert "application_logs.ix_application_logs_event_created" in capsys.readouterr().out
+    finally:
+        with engine.begin() as conn:
+            index.create(conn)
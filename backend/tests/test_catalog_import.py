@@ -0,0 +1,60 @@
+# backend/tests/test_catalog_import.py
+
+import json
+
+from app.db import models
+from app.services import catalog_import
+from app.services.catalog_import import import_internships
+
+HEADER = "title,company,location,industry,required_skills,description\n"
+
+
+def _csv(*rows):
+    return [HEADER, *(",".join(r) + "\n" for r in rows)]
+
+
+def test_invalid_rows_are_reported_and_skipped(db):
+    lines = ['{"title": "Jsonl A", "company": "Import Co"}\n', "not json\n", "[1]\n",
+             '{"title": "", "company": "Import Co"}\n']
+    report = import_internships(db, lines, "jsonl")
+    assert report["inserted"] == 1
+    assert [e["line"] for e in report["errors"]] == [2, 3, 4]
+    assert report["error_count"] == 3
+
+
+def test_upsert_reports_duplicates_within_the_file(db):
+    lines = _csv(
+        ("Dup Role", "Upsert Co", "Pune", "", "python", "first"),
+        ("Other Role", "Upsert Co", "", "", "", ""),
+        ("Dup Role", "Upsert Co", "Delhi", "", "java", "second"),
+    )
+    report = import_internships(db, lines, "csv", upsert=True, batch_size=1)
+    assert report["inserted"] == 2
+    assert report["errors"] == [{"line": 4, "error": "duplicate of line 2 (same company and title)"}]
+
+    row = db.query(models.Internship).filter_by(company="Upsert Co", title="Dup Role").one()
+    assert (row.location, row.description) == ("Pune", "first")
+
+
+def test_upsert_updates_existing_rows(db):
+    import_internships(db, [json.dumps({"title": "Kept", "company": "Again Co", "location": "A"})], "jsonl")
+    report = import_internships(
+        db, [json.dumps({"title": "Kept", "company": "Again Co", "location": "B", "skills": "sql"})],
+        "jsonl", upsert=True,
+    )
+    assert (report["inserted"], report["updated"], report["error_count"]) == (0, 1, 0)
+    row = db.query(models.Internship).filter_by(company="Again Co").one()
+    db.refresh(row)
+    assert (row.location, row.required_skills) == ("B", "sql")
+    assert [s.skill_id for s in db.query(models.InternshipSkill).filter_by(internship_id=row.id)]
+
+
+def test_upsert_lookup_is_chunked(db, monkeypatch):
+    titles = [f"Chunked {n}" for n in range(5)]
+    import_internships(db, _csv(*((t, "Chunk Co", "A", "", "", "") for t in titles[:3])), "csv")
+
+    monkeypatch.setattr(catalog_import, "_KEY_CHUNK", 2)  # one batch, three lookups
+    report = import_internships(db, _csv(*((t, "Chunk Co", "B", "", "", "") for t in titles)), "csv", upsert=True)
+    assert (report["inserted"], report["updated"]) == (2, 3)
+    rows = db.query(models.Internship.location).filter_by(company="Chunk Co").all()
+    assert sorted(r.location for r in rows) == ["B"] * 5
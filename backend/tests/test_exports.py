@@ -0,0 +1,26 @@
+# backend/tests/test_exports.py
+
+import csv
+import io
+import json
+
+from conftest import add_application, add_internships, add_student
+
+
+def test_csv_cells_cannot_start_a_formula(client, admin, db):
+    internship, = add_internships(db, [("=HYPERLINK(\"http://x\")", "")], company="+Export Co")
+    for name in ("=1+1", "@SUM(A1)", "-2", "Plain Name"):
+        add_application(db, add_student(db, name), internship)
+
+    r = client.get("/admin/export/applications", params={"internship_id": internship}, headers=admin)
+    assert r.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert sorted(row["student_name"] for row in rows) == ["'-2", "'=1+1", "'@SUM(A1)", "Plain Name"]
+    assert {row["company"] for row in rows} == {"'+Export Co"}
+    assert {row["internship_title"] for row in rows} == {"'=HYPERLINK(\"http://x\")"}
+    assert all(row["internship_id"] == str(internship) for row in rows)
+
+    r = client.get("/admin/export/applications",
+                   params={"internship_id": internship, "format": "ndjson"}, headers=admin)
+    names = sorted(json.loads(line)["student_name"] for line in r.text.splitlines())
+    assert names == ["-2", "=1+1", "@SUM(A1)", "Plain Name"]  # NDJSON keeps raw values
@@ -0,0 +1,142 @@
+# backend/tests/test_logs.py
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import text
+
+from app.api import deps
+from app.api.routes import logs
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.services import audit_log
+from app.services.log_events import LogBroadcaster
+from conftest import add_internships, add_student
+
+
+@pytest.fixture
+def log_row(db):
+    internship, = add_internships(db, [("Logged <b>Role</b>", "")], company="Log Co")
+    student = add_student(db, "<img src=x onerror=alert(1)>")
+    audit_log.record(db, student_id=student.id, internship_id=internship,
+                     event="APPLIED", message="<script>alert(1)</script>")
+    db.commit()
+    return student.id
+
+
+def _first_event(after_id):
+    async def first():
+        stream = logs._tail(after_id, set())
+        try:
+            async for chunk in stream:
+                if chunk.startswith("id: "):
+                    return json.loads(chunk.split("data: ", 1)[1])
+        finally:
+            await stream.aclose()
+
+    return asyncio.run(first())
+
+
+def test_live_events_carry_the_page_fields(client, admin, log_row):
+    page = client.get("/admin/logs", params={"student_id": log_row}, headers=admin).json()
+    item, = page["items"]
+    assert item["student_name"] == "<img src=x onerror=alert(1)>"
+    assert (item["internship_title"], item["company"]) == ("Logged <b>Role</b>", "Log Co")
+
+    assert _first_event(item["id"] - 1) == item  # from the broadcaster's ring buffer
+
+
+def test_replayed_events_carry_the_page_fields(client, admin, log_row, monkeypatch):
+    item, = client.get("/admin/logs", params={"student_id": log_row}, headers=admin).json()["items"]
+    # a broadcaster without history: the resume is replayed from the database
+    monkeypatch.setattr(logs, "log_broadcaster", LogBroadcaster(history=0, client_buffer=10))
+    assert _first_event(item["id"] - 1) == item
+
+
+@pytest.fixture(scope="module")
+def timed_rows(client):
+    # stored the way both writers store them: CURRENT_TIMESTAMP (server
+    # default) has no fraction, ORM-written rows always have six digits
+    stamps = ["2025-03-01 11:59:59.999999", "2025-03-01 12:00:00", "2025-03-01 12:00:00.000000",
+              "2025-03-01 12:00:00.250000", "2025-03-01 12:00:01", "2025-03-01 12:00:00"]
+    with SessionLocal() as db:
+        for n, stamp in enumerate(stamps):
+            db.execute(text("INSERT INTO application_logs (event, message, created_at) "
+                            "VALUES ('TIMED', :m, :t)"), {"m": f"row {n}", "t": stamp})
+        db.commit()
+    return stamps
+
+
+def _messages(client, admin, **params):
+    r = client.get("/admin/logs", params={"event": "TIMED", "limit": 500, **params}, headers=admin)
+    assert r.status_code == 200, r.text
+    return sorted(it["message"] for it in r.json()["items"])
+
+
+def test_since_until_include_rows_at_the_boundary(client, admin, timed_rows):
+    assert _messages(client, admin, since="2025-03-01T12:00:00") == ["row 1", "row 2", "row 3", "row 4", "row 5"]
+    assert _messages(client, admin, until="2025-03-01T12:00:00") == ["row 0"]
+    assert _messages(client, admin, since="2025-03-01T12:00:00", until="2025-03-01T12:00:00.250000") \
+        == ["row 1", "row 2", "row 5"]
+    assert _messages(client, admin, since="2025-03-01T13:00:00+01:00", until="2025-03-01T12:00:01Z") \
+        == ["row 1", "row 2", "row 3", "row 5"]
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4])
+def test_log_pages_concatenate_to_the_full_list(client, admin, timed_rows, limit):
+    full = client.get("/admin/logs", params={"event": "TIMED", "limit": 500}, headers=admin).json()["items"]
+    assert len(full) == len(timed_rows)
+
+    items, cursor = [], None
+    while True:
+        params = {"event": "TIMED", "limit": limit, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/admin/logs", params=params, headers=admin).json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert items == full
+    assert [it["time"] for it in full] == sorted((it["time"] for it in full), reverse=True)
+
+
+def test_invalid_log_cursor_is_rejected(client, admin):
+    assert client.get("/admin/logs", params={"cursor": "???"}, headers=admin).status_code == 400
+
+
+def test_stream_accepts_only_short_lived_tokens_in_the_url(client, admin, student, monkeypatch):
+    login_token = admin["Authorization"].removeprefix("Bearer ")
+    assert client.get("/admin/logs/stream", params={"token": login_token}).status_code == 401
+    assert client.post("/admin/logs/stream-token", headers=student).status_code == 403
+
+    r = client.post("/admin/logs/stream-token", headers=admin)
+    assert r.status_code == 200 and r.json()["expires_in"] == 60
+    stream_token = r.json()["token"]
+    user = asyncio.run(deps.require_admin_stream(header_token=None, token=stream_token))
+    assert user.role == "admin"
+    # not a login token: rejected everywhere else
+    assert client.get("/admin/logs", headers={"Authorization": "Bearer " + stream_token}).status_code == 401
+
+    monkeypatch.setattr(settings, "LOG_STREAM_TOKEN_SECONDS", -1)
+    expired = client.post("/admin/logs/stream-token", headers=admin).json()["token"]
+    assert client.get("/admin/logs/stream", params={"token": expired}).status_code == 401
+
+
+def test_cancelled_applications_leave_no_dangling_log_references(client, admin, student, db):
+    internship, = add_internships(db, [("Cancelled Role", "")], company="Log Co")
+    client.get("/students/me/profile", headers=student)  # creates the profile
+    db.execute(text("UPDATE students SET resume_url = '/uploads/resumes/cv.pdf' "
+                    "WHERE id = (SELECT MAX(id) FROM students)"))
+    db.commit()
+
+    assert client.post(f"/applications/apply/{internship}", headers=student).status_code == 200
+    app_id = db.execute(text("SELECT id FROM applications WHERE internship_id = :i"),
+                        {"i": internship}).scalar_one()
+    assert client.patch(f"/admin/applications/{app_id}/approve", headers=admin).status_code == 200
+    assert client.delete(f"/applications/cancel/{internship}", headers=student).status_code == 200
+
+    events = db.execute(text("SELECT event FROM application_logs WHERE internship_id = :i ORDER BY id"),
+                        {"i": internship}).scalars().all()
+    assert events == ["APPLIED", "APPROVED", "CANCELLED"]
+    # what a database enforcing foreign keys would have refused
+    assert db.execute(text("PRAGMA foreign_key_check(application_logs)")).all() == []
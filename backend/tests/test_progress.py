@@ -0,0 +1,70 @@
+# backend/tests/test_progress.py
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.db import models
+from conftest import add_application, add_internships
+
+
+@pytest.fixture
+def board(client, student, db):
+    """The student's profile, one approved and one pending internship."""
+    client.get("/students/me/profile", headers=student)  # creates the profile
+    profile = db.query(models.Student).order_by(models.Student.id.desc()).first()
+    approved, pending = add_internships(db, [("Board Role", ""), ("Pending Role", "")], company="Board Co")
+    add_application(db, profile, approved, status="approved", approved_at=datetime(2020, 1, 1))
+    add_application(db, profile, pending)
+    return profile, approved, pending
+
+
+def _task(db, internship_id, title, due_date, updated_at="2020-01-01 00:00:00"):
+    task = models.InternshipTask(internship_id=internship_id, title=title, due_date=due_date)
+    db.add(task)
+    db.commit()
+    # stored the way CURRENT_TIMESTAMP stores it (second precision text)
+    db.execute(text("UPDATE internship_tasks SET updated_at = :t WHERE id = :id"),
+               {"t": updated_at, "id": task.id})
+    db.commit()
+    return task.id
+
+
+def test_board_lists_tasks_of_approved_internships(client, student, db, board):
+    profile, approved, pending = board
+    today = date.today()
+    overdue = _task(db, approved, "Overdue", today - timedelta(days=2))
+    done = _task(db, approved, "Done", today - timedelta(days=1))
+    upcoming = _task(db, approved, "Upcoming", today + timedelta(days=3))
+    _task(db, pending, "Not visible", today)
+    db.add(models.TaskSubmission(task_id=done, student_id=profile.id, file_path="/tmp/x/done.pdf",
+                                 submitted_at=datetime(2020, 1, 1), status="on_time"))
+    db.commit()
+
+    tasks = client.get("/progress/tasks", headers=student).json()
+    assert [(t["task_id"], t["status"], t["status_label"]) for t in tasks] == [
+        (overdue, "not_submitted", "Not submitted (Overdue)"),
+        (done, "on_time", "Submitted (On time)"),
+        (upcoming, "not_submitted", "Pending"),
+    ]
+    assert {t["internship_title"] for t in tasks} == {"Board Role"}
+    assert tasks[1]["file_url"] == "/uploads/tasks/done.pdf"
+
+
+def test_since_keeps_tasks_changed_in_the_same_second(client, student, db, board):
+    profile, approved, _ = board
+    later = date.today() + timedelta(days=10)
+    same_second = _task(db, approved, "Same second", later, updated_at="2026-03-01 12:00:00")
+    _task(db, approved, "Second before", later, updated_at="2026-03-01 11:59:59")
+    submitted = _task(db, approved, "Submitted", later)
+    db.add(models.TaskSubmission(task_id=submitted, student_id=profile.id, file_path="/tmp/x/s.pdf",
+                                 submitted_at=datetime(2026, 3, 2), status="on_time"))
+    db.commit()
+
+    for since in ("2026-03-01T12:00:00.500", "2026-03-01T12:00:00.500Z", "2026-03-01T14:00:00.5+02:00"):
+        tasks = client.get("/progress/tasks", params={"since": since}, headers=student).json()
+        assert [t["task_id"] for t in tasks] == [same_second, submitted], since
+
+    tasks = client.get("/progress/tasks", params={"since": "2026-03-03T00:00:00"}, headers=student).json()
+    assert tasks == []
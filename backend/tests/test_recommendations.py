@@ -0,0 +1,70 @@
+# backend/tests/test_recommendations.py
+
+import pytest
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db import models
+from conftest import add_internships
+
+SPECS = [(f"Role {n}", ", ".join(s for s, k in (("python", 2), ("sql", 3), ("css", 5)) if n % k == 0))
+         for n in range(1, 31)]
+
+
+@pytest.fixture(scope="module")
+def catalog(client):
+    with SessionLocal() as db:
+        return add_internships(db, SPECS, company="Paging Co")
+
+
+def _pages(client, headers, limit, **params):
+    items, cursor = [], None
+    while True:
+        query = {**params, "limit": limit, **({"cursor": cursor} if cursor else {})}
+        r = client.get("/internships/recommendations", params=query, headers=headers)
+        assert r.status_code == 200, r.text
+        page = r.json()
+        assert len(page["items"]) <= limit
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+
+@pytest.mark.parametrize("params", [
+    {"skills": "python, sql"},
+    {"skills": "css", "keywords": "role"},
+    {"skills": "python", "keywords": "paging c++"},
+])
+@pytest.mark.parametrize("limit", [1, 7, 100])
+def test_pages_concatenate_to_the_full_ranking(client, student, catalog, params, limit):
+    full = client.get("/internships/recommendations", params=params, headers=student).json()
+    assert full, "expected some recommendations"
+    assert _pages(client, student, limit, **params) == full
+
+
+def test_ranking_is_best_match_first(client, student, catalog):
+    full = client.get("/internships/recommendations", params={"skills": "python"}, headers=student).json()
+    keys = [(-it["match"], it["id"]) for it in full]
+    assert keys == sorted(keys)
+
+
+def test_precomputed_pages_match_live_scoring(client, student, catalog, monkeypatch):
+    # a small stored top-N forces later pages to fall back to live scoring
+    monkeypatch.setattr(settings, "RECS_PRECOMPUTE_TOP_N", 5)
+    r = client.put("/students/me/profile", json={"skills": "sql, css"}, headers=student)
+    assert r.status_code == 200, r.text
+    with SessionLocal() as db:
+        student_id = db.query(models.User).filter_by(email=r.json()["email"]).one().student.id
+        assert db.query(models.StudentRecommendation).filter_by(student_id=student_id).count() == 5
+
+    live = client.get("/internships/recommendations", params={"skills": "sql, css"}, headers=student).json()
+    assert _pages(client, student, 4) == live
+    assert _pages(client, student, 5) == live
+
+
+def test_invalid_cursor_is_rejected(client, student, catalog):
+    r = client.get(
+        "/internships/recommendations", params={"limit": 5, "cursor": "not-a-cursor"}, headers=student
+    )
+    assert r.status_code == 400
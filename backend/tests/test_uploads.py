@@ -0,0 +1,70 @@
+# backend/tests/test_uploads.py
+
+import hashlib
+
+import pytest
+
+from app.api.routes import students
+from app.core.config import settings
+
+BOUNDARY = "test-boundary"
+
+
+@pytest.fixture
+def resume_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(students, "RESUME_DIR", tmp_path)
+    monkeypatch.setattr(settings, "RESUME_MAX_BYTES", 4096)
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_BYTES", 512)  # several chunks per upload
+    return tmp_path
+
+
+def _multipart(data: bytes, field: str = "file") -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="cv.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode() + data + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def _chunked(body: bytes, size: int = 700):
+    for n in range(0, len(body), size):  # no Content-Length: only the streaming checks apply
+        yield body[n:n + size]
+
+
+def _post(client, headers, body, content_type=f"multipart/form-data; boundary={BOUNDARY}"):
+    return client.post("/students/me/resume", content=body,
+                       headers={**headers, "Content-Type": content_type})
+
+
+def test_resume_is_stored_with_its_hash(client, student, resume_dir):
+    data = bytes(range(256)) * 12  # 3072 bytes: six chunks
+    r = _post(client, student, _chunked(_multipart(data)))
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["size"] == len(data)
+    assert body["sha256"] == hashlib.sha256(data).hexdigest()
+
+    saved, = resume_dir.iterdir()
+    assert saved.read_bytes() == data
+    assert body["resume_url"] == f"/uploads/resumes/{saved.name}"
+
+
+def test_too_large_by_content_length(client, student, resume_dir):
+    r = _post(client, student, _multipart(b"x" * (settings.RESUME_MAX_BYTES + 70_000)))
+    assert r.status_code == 413
+    assert list(resume_dir.iterdir()) == []
+
+
+def test_too_large_while_streaming(client, student, resume_dir):
+    r = _post(client, student, _chunked(_multipart(b"x" * (settings.RESUME_MAX_BYTES + 1))))
+    assert r.status_code == 413
+    assert list(resume_dir.iterdir()) == []  # no .upload-*.part left behind
+
+
+def test_not_a_file_upload(client, student, resume_dir):
+    r = _post(client, student, b'{"file": "cv.pdf"}', content_type="application/json")
+    assert r.status_code == 400
+    r = _post(client, student, _multipart(b"data", field="resume"))
+    assert r.status_code == 400
+    assert "No file uploaded" in r.json()["detail"]
+    assert list(resume_dir.iterdir()) == []
@@ -69,35 +69,64 @@ function selectInternship(id) {
 }
 
 // ================= LOAD APPLICATIONS ==================
-async function loadApplicants(id){
-    const tbody=document.getElementById("internApps");
-    tbody.innerHTML=`<tr><td colspan=4>Loading...</td></tr>`;
-
-    const res=await apiRequest(`/admin/internships/${id}/applications`);
-
-    tbody.innerHTML="";
-    res.forEach(s=>{
-        tbody.innerHTML+=`
-        <tr>
-            <td>${s.student}</td>
-            <td><a href="${s.resume_url}" target="_blank">View Resume</a></td>
-            <td>${s.status}</td>
+const PAGE_SIZE = 50;
+let nextCursor = null;
+
+async function loadApplications(append = false) {
+  const tbody = document.getElementById("appsBody");
+  if (!selectedInternshipId) return;
+
+  if (!append) {
+    nextCursor = null;
+    tbody.innerHTML =
+      '<tr><td colspan="5" style="color:var(--text-muted);">Loading...</td></tr>';
+  }
+
+  const params = new URLSearchParams({ limit: PAGE_SIZE });
+  if (currentFilter !== "all") params.set("status", currentFilter);
+  if (append && nextCursor) params.set("cursor", nextCursor);
+
+  try {
+    const page = await apiRequest(
+      `/admin/internships/${selectedInternshipId}/applications?${params}`
+    );
+    if (!append) tbody.innerHTML = "";
+    document.getElementById("appsMore")?.remove();
+
+    if (!page.items.length && !append) {
+      tbody.innerHTML =
+        '<tr><td colspan="5" style="color:var(--text-muted);">No applications found</td></tr>';
+      return;
+    }
+
+    page.items.forEach((a) => {
+      const row = document.createElement("tr");
+      row.innerHTML = `
+            <td>${a.student}</td>
+            <td>${a.email}</td>
+            <td>${a.resume_url ? `<a href="${a.resume_url}" target="_blank">View Resume</a>` : "-"}</td>
+            <td>${a.status}</td>
             <td>
-                <button onclick="approve(${s.id})" class="btn btn-success">Approve</button>
-                <button onclick="reject(${s.id})" class="btn btn-danger">Reject</button>
+                <button class="btn btn-success" data-approve="${a.id}">Approve</button>
+                <button class="btn btn-danger" data-reject="${a.id}">Reject</button>
             </td>
-        </tr>`;
-    })
-}
-
-async function approve(id){
-    await apiRequest(`/admin/applications/${id}/approve`, { method:"PATCH" });
-    loadInternships();
-}
+        `;
+      tbody.appendChild(row);
+    });
 
-async function reject(id){
-    await apiRequest(`/admin/applications/${id}/reject`, { method:"PATCH" });
-    loadInternships();
+    nextCursor = page.next_cursor;
+    if (nextCursor) {
+      const more = document.createElement("tr");
+      more.id = "appsMore";
+      more.innerHTML = `<td colspan="5"><button class="btn">Load more (${page.total} total)</button></td>`;
+      more.querySelector("button").onclick = () => loadApplications(true);
+      tbody.appendChild(more);
+    }
+    bindStatusActions();
+  } catch (err) {
+    tbody.innerHTML =
+      '<tr><td colspan="5" style="color:red;">Failed to load applications</td></tr>';
+  }
 }
 
 
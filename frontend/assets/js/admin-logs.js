@@ -1,59 +1,116 @@
 // frontend/assets/js/admin-logs.js
 import { apiRequest } from "./api.js";
 
+const PAGE_SIZE = 50;
+let nextCursor = null;
+
+let liveSource = null;
+
 document.addEventListener("DOMContentLoaded", () => {
-  loadLogs();
+  document.getElementById("logsMore")?.addEventListener("click", () => loadLogs(true));
+  document.getElementById("logsEvent")?.addEventListener("change", () => {
+    lastEventId = null; // the table is reloaded, the tail starts from now
+    loadLogs(false);
+    startLiveTail();
+  });
+  loadLogs(false);
+  startLiveTail();
 });
 
-async function loadLogs() {
+// new rows arrive over SSE (/admin/logs/stream) instead of re-polling the table.
+// The URL carries a short-lived stream token (never the login token), so a
+// fresh one is fetched for every connect and the browser's own reconnect,
+// which would reuse an expired token, is replaced by ours with last_event_id.
+const RECONNECT_MS = 3000;
+let lastEventId = null;
+let reconnectTimer = null;
+let connectCount = 0;
+
+async function startLiveTail() {
+  if (liveSource) liveSource.close();
+  liveSource = null;
+  clearTimeout(reconnectTimer);
+  const attempt = ++connectCount;
+  const event = document.getElementById("logsEvent")?.value;
+
+  let token;
+  try {
+    ({ token } = await apiRequest("/admin/logs/stream-token", { method: "POST" }));
+  } catch (err) {
+    console.error(err);
+    if (attempt === connectCount) reconnectTimer = setTimeout(startLiveTail, RECONNECT_MS);
+    return;
+  }
+  if (attempt !== connectCount) return; // a newer connect (filter change) took over
+
+  const params = new URLSearchParams({ token });
+  if (event) params.append("event", event);
+  if (lastEventId) params.set("last_event_id", lastEventId);
+
+  const source = new EventSource(`/admin/logs/stream?${params}`);
+  liveSource = source;
+  source.addEventListener("log", (e) => {
+    lastEventId = e.lastEventId;
+    prependLog(JSON.parse(e.data));
+  });
+  source.addEventListener("gap", () => loadLogs(false));
+  source.onerror = () => {
+    source.close();
+    if (liveSource === source) reconnectTimer = setTimeout(startLiveTail, RECONNECT_MS);
+  };
+}
+
+function prependLog(log) {
+  document.getElementById("logsBody").prepend(logRow(log));
+}
+
+// page items and live events have the same fields (log_store.items);
+// every value is set as text, never parsed as HTML
+function logRow(log) {
+  const row = document.createElement("tr");
+  const cells = [
+    new Date(log.time + "Z").toLocaleString(),
+    log.event,
+    log.student_name ?? "–",
+    log.internship_title ? `${log.internship_title} – ${log.company}` : "–",
+    log.message ?? "",
+  ];
+  for (const text of cells) {
+    const cell = document.createElement("td");
+    cell.textContent = text;
+    row.appendChild(cell);
+  }
+  return row;
+}
+
+// keyset pages from /admin/logs; "Load more" continues from next_cursor
+async function loadLogs(append) {
   const tbody = document.getElementById("logsBody");
-  tbody.innerHTML = "";
+  const more = document.getElementById("logsMore");
+  if (!append) {
+    tbody.innerHTML = "";
+    nextCursor = null;
+  }
+
+  const params = new URLSearchParams({ limit: PAGE_SIZE, include_archive: "true" });
+  const event = document.getElementById("logsEvent")?.value;
+  if (event) params.append("event", event);
+  if (append && nextCursor) params.set("cursor", nextCursor);
 
   try {
-    const logs = await apiRequest("/admin/logs");
+    const page = await apiRequest(`/admin/logs?${params}`);
+    nextCursor = page.next_cursor;
 
-    if (!logs.length) {
+    if (!append && !page.items.length) {
       const row = document.createElement("tr");
       row.innerHTML =
         '<td colspan="5" style="color: var(--text-muted);">No logs yet</td>';
       tbody.appendChild(row);
-      return;
     }
 
-    logs.forEach((log) => {
-      const row = document.createElement("tr");
-      row.innerHTML = `
-        <td>${log.type}</td>
-        <td>${log.student_name}</td>
-        <td>${log.internship_title}</td>
-        <td>${log.company}</td>
-        <td>${log.status}</td>
-      `;
-      tbody.appendChild(row);
-    });
+    page.items.forEach((log) => tbody.appendChild(logRow(log)));
+    if (more) more.style.display = nextCursor ? "" : "none";
   } catch (err) {
     console.error("Failed to load logs", err);
   }
 }
-
-import { apiRequest } from "./api.js";
-
-document.addEventListener("DOMContentLoaded", loadLogs);
-
-async function loadLogs(){
-    const list = document.getElementById("logsList");
-    list.innerHTML = "";
-
-    const logs = await apiRequest("/admin/logs");
-
-    if(!logs.length){
-        list.innerHTML = "<p>No history yet...</p>";
-        return;
-    }
-
-    logs.forEach(l=>{
-        const li=document.createElement("li");
-        li.textContent = `${l.event} — ${l.time}`;
-        list.appendChild(li);
-    });
-}
@@ -1,26 +1,84 @@
 import Chart from "https://cdn.jsdelivr.net/npm/chart.js";
+import { apiRequest } from "./api.js";
 
-// FUTURE: Replace static with real DB analytics
-// data can come from progress table later
-
-new Chart(document.getElementById("internChart"), {
-  type: "bar",
-  data: {
-    labels:["Week 1","Week 2","Week 3","Week 4"],
-    datasets:[{
-      label: "Performance % (Demo)",
-      data: [70, 75, 80, 90], // replace with backend data later
-      borderWidth: 1
-    }]
-  },
-  options:{
-    responsive: true,
-    plugins:{
-      legend:{ display:true },
-      title:{ display:false }
+// data comes from /admin/analytics (incrementally maintained aggregates)
+
+document.addEventListener("DOMContentLoaded", () => {
+  loadAnalytics();
+});
+
+async function loadAnalytics() {
+  let data;
+  try {
+    data = await apiRequest("/admin/analytics?weeks=12");
+  } catch (err) {
+    console.error("Failed to load analytics", err);
+    return;
+  }
+  renderSummary(data);
+  renderWeeks(data.submissions);
+  renderInternships(data.applications.internships);
+}
+
+function renderSummary(data) {
+  const box = document.getElementById("analyticsSummary");
+  if (!box) return;
+  const apps = data.applications.totals;
+  const approval = data.time_to_approval;
+  box.innerHTML = `
+    <span><b>${apps.total}</b> applications</span>
+    <span><b>${apps.pending}</b> pending</span>
+    <span><b>${apps.approved}</b> approved</span>
+    <span><b>${apps.rejected}</b> rejected</span>
+    <span>avg. time to approval: <b>${approval.avg_hours ?? "–"}</b> h
+      (${approval.within_day}/${approval.approved} within a day)</span>
+  `;
+}
+
+function renderWeeks(weeks) {
+  new Chart(document.getElementById("internChart"), {
+    type: "bar",
+    data: {
+      labels: weeks.map((w) => w.week_start),
+      datasets: [
+        { label: "On time", data: weeks.map((w) => w.on_time), borderWidth: 1 },
+        { label: "Late", data: weeks.map((w) => w.late), borderWidth: 1 },
+      ],
     },
-    scales:{
-      y:{ beginAtZero:true, max:100 }
-    }
+    options: {
+      responsive: true,
+      plugins: {
+        legend: { display: true },
+        title: { display: false },
+      },
+      scales: {
+        x: { stacked: true },
+        y: { stacked: true, beginAtZero: true },
+      },
+    },
+  });
+}
+
+function renderInternships(internships) {
+  const tbody = document.getElementById("analyticsBody");
+  if (!tbody) return;
+  tbody.innerHTML = "";
+
+  if (!internships.length) {
+    tbody.innerHTML =
+      '<tr><td colspan="5" style="color: var(--text-muted);">No applications yet</td></tr>';
+    return;
   }
-});
+
+  internships.forEach((i) => {
+    const row = document.createElement("tr");
+    row.innerHTML = `
+      <td>${i.title} – ${i.company}</td>
+      <td>${i.total}</td>
+      <td>${i.pending}</td>
+      <td>${i.approved}</td>
+      <td>${i.rejected}</td>
+    `;
+    tbody.appendChild(row);
+  });
+}
@@ -1,6 +1,9 @@
 // frontend/assets/js/internship-recs.js
 import { apiRequest } from "./api.js";
 
+const PAGE_SIZE = 20;
+let nextCursor = null;
+
 document.addEventListener("DOMContentLoaded", () => {
   const form = document.getElementById("searchForm");
 
@@ -15,32 +18,36 @@ document.addEventListener("DOMContentLoaded", () => {
   loadRecommendations();
 });
 
-async function loadRecommendations() {
+async function loadRecommendations(append = false) {
   const keywords = document.getElementById("searchKeywords")?.value || "";
   const skills = document.getElementById("searchSkills")?.value || "";
 
   const params = new URLSearchParams();
   if (keywords) params.append("keywords", keywords);
   if (skills) params.append("skills", skills);
+  params.append("limit", PAGE_SIZE);
+  if (append && nextCursor) params.append("cursor", nextCursor);
 
   try {
-    const recs = await apiRequest(
+    const page = await apiRequest(
       `/internships/recommendations?${params.toString()}`
     );
-    renderRecommendations(recs);
+    nextCursor = page?.next_cursor || null;
+    renderRecommendations(page?.items || [], append);
   } catch (err) {
     console.error("Failed to load recommendations", err);
     alert("Failed to load recommendations from server.");
   }
 }
 
-function renderRecommendations(list) {
+function renderRecommendations(list, append = false) {
   const container = document.getElementById("recsContainer");
   if (!container) return;
 
-  container.innerHTML = "";
+  container.querySelector("[data-load-more]")?.remove();
+  if (!append) container.innerHTML = "";
 
-  if (!list.length) {
+  if (!append && !list.length) {
     const card = document.createElement("div");
     card.className = "card";
     card.innerHTML =
@@ -87,10 +94,22 @@ function renderRecommendations(list) {
   });
 
   wireApplyButtons(container);
+
+  if (nextCursor) {
+    const more = document.createElement("button");
+    more.className = "btn btn-ghost";
+    more.type = "button";
+    more.dataset.loadMore = "1";
+    more.textContent = "Load more";
+    more.addEventListener("click", () => loadRecommendations(true));
+    container.appendChild(more);
+  }
 }
 
 function wireApplyButtons(container) {
-  container.querySelectorAll("[data-apply]").forEach((btn) => {
+  // skip buttons already wired by a previous page
+  container.querySelectorAll("[data-apply]:not([data-wired])").forEach((btn) => {
+    btn.dataset.wired = "1";
     btn.addEventListener("click", async () => {
       const internshipId = btn.getAttribute("data-apply");
       if (!internshipId) return;
@@ -5,6 +5,10 @@ const API_BASE = "http://127.0.0.1:8000";
 
 let tasksCache = [];
 let selectedTaskId = null;
+let loadedAt = null; // client time of the last load (for ?since=)
+let fullLoadAt = null;
+// ?since= reports changed tasks, never removed ones: reload the whole board now and then
+const FULL_RELOAD_MS = 5 * 60 * 1000;
 
 document.addEventListener("DOMContentLoaded", () => {
   loadTasks();
@@ -27,59 +31,11 @@ async function loadTasks() {
     '<tr><td colspan="6" style="color:var(--text-muted);">Loading tasks...</td></tr>';
 
   try {
+    const startedAt = new Date();
     const tasks = await apiRequest("/progress/tasks");
     tasksCache = tasks;
-
-    if (!tasks.length) {
-      tbody.innerHTML =
-        '<tr><td colspan="6" style="color:var(--text-muted);">No tasks assigned yet. Once an admin assigns tasks for your approved internships, they will appear here.</td></tr>';
-      if (liveTitle)
-        liveTitle.textContent = "No active task. Waiting for assignments.";
-      if (liveMeta)
-        liveMeta.textContent =
-          "Check back later or contact your mentor/admin about tasks.";
-      return;
-    }
-
-    tbody.innerHTML = "";
-    tasks.forEach((t, index) => {
-      const tr = document.createElement("tr");
-      tr.style.cursor = "pointer";
-
-      const statusColor = getStatusColor(t);
-
-      tr.innerHTML = `
-        <td>${index + 1}</td>
-        <td>${t.title}</td>
-        <td>${t.internship_title}</td>
-        <td>${t.due_date}</td>
-        <td>
-          <span style="color:${statusColor}; font-size:0.8rem;">
-            ${t.status_label}
-          </span>
-        </td>
-        <td>${
-          t.submitted_at
-            ? new Date(t.submitted_at).toLocaleDateString()
-            : "-"
-        }</td>
-      `;
-
-      tr.addEventListener("click", () => {
-        selectTask(t);
-      });
-
-      tbody.appendChild(tr);
-    });
-
-    // AUTO-select live task = closest upcoming due date (rule C1)
-    const live = pickLiveTask(tasks);
-    if (live) {
-      selectTask(live);
-    } else {
-      // Fallback if all overdue: just select first row
-      selectTask(tasks[0]);
-    }
+    loadedAt = fullLoadAt = startedAt;
+    renderTasks(tasks);
   } catch (err) {
     console.error("Failed to load tasks", err);
     tbody.innerHTML =
@@ -92,6 +48,87 @@ async function loadTasks() {
   }
 }
 
+// only rows that changed since the last load (?since=), merged into the cache;
+// the margin covers clock skew between browser and server
+async function refreshTasks() {
+  if (!loadedAt || Date.now() - fullLoadAt.getTime() > FULL_RELOAD_MS) return loadTasks();
+
+  const startedAt = new Date();
+  const since = new Date(loadedAt.getTime() - 60 * 1000).toISOString();
+  try {
+    const changed = await apiRequest(`/progress/tasks?since=${encodeURIComponent(since)}`);
+    loadedAt = startedAt;
+    if (!changed.length) return;
+
+    const byId = new Map(tasksCache.map((t) => [t.task_id, t]));
+    changed.forEach((t) => byId.set(t.task_id, t));
+    tasksCache = [...byId.values()].sort(
+      (a, b) => a.due_date.localeCompare(b.due_date) || a.task_id - b.task_id
+    );
+    renderTasks(tasksCache);
+  } catch (err) {
+    console.error("Failed to refresh tasks", err);
+    loadTasks();
+  }
+}
+
+function renderTasks(tasks) {
+  const tbody = document.getElementById("tasksBody");
+  const liveTitle = document.getElementById("liveTaskTitle");
+  const liveMeta = document.getElementById("liveTaskMeta");
+
+  if (!tasks.length) {
+    tbody.innerHTML =
+      '<tr><td colspan="6" style="color:var(--text-muted);">No tasks assigned yet. Once an admin assigns tasks for your approved internships, they will appear here.</td></tr>';
+    if (liveTitle)
+      liveTitle.textContent = "No active task. Waiting for assignments.";
+    if (liveMeta)
+      liveMeta.textContent =
+        "Check back later or contact your mentor/admin about tasks.";
+    return;
+  }
+
+  tbody.innerHTML = "";
+  tasks.forEach((t, index) => {
+    const tr = document.createElement("tr");
+    tr.style.cursor = "pointer";
+
+    const statusColor = getStatusColor(t);
+
+    tr.innerHTML = `
+      <td>${index + 1}</td>
+      <td>${t.title}</td>
+      <td>${t.internship_title}</td>
+      <td>${t.due_date}</td>
+      <td>
+        <span style="color:${statusColor}; font-size:0.8rem;">
+          ${t.status_label}
+        </span>
+      </td>
+      <td>${
+        t.submitted_at
+          ? new Date(t.submitted_at).toLocaleDateString()
+          : "-"
+      }</td>
+    `;
+
+    tr.addEventListener("click", () => {
+      selectTask(t);
+    });
+
+    tbody.appendChild(tr);
+  });
+
+  // AUTO-select live task = closest upcoming due date (rule C1)
+  const live = pickLiveTask(tasks);
+  if (live) {
+    selectTask(live);
+  } else {
+    // Fallback if all overdue: just select first row
+    selectTask(tasks[0]);
+  }
+}
+
 function getStatusColor(task) {
   if (task.status === "on_time") return "#4ade80"; // green
   if (task.status === "late") return "#facc15"; // yellow
@@ -200,7 +237,7 @@ async function onSubmitTask(e) {
     const data = await res.json();
     alert(`Submitted (${data.status})`);
     fileInput.value = "";
-    loadTasks();
+    refreshTasks();
   } catch (err) {
     console.error("Task submit failed", err);
     alert("Failed to submit task.");
@@ -1,6 +1,9 @@
 // frontend/assets/js/student-recommendations.js
 import { apiRequest } from "./api.js";
 
+const PAGE_SIZE = 20;
+let nextCursor = null;
+
 document.addEventListener("DOMContentLoaded", () => {
   const form = document.getElementById("searchForm");
 
@@ -15,7 +18,7 @@ document.addEventListener("DOMContentLoaded", () => {
   loadRecommendations();
 });
 
-async function loadRecommendations() {
+async function loadRecommendations(append = false) {
   const keywordsInput = document.getElementById("searchKeywords");
   const skillsInput = document.getElementById("searchSkills");
 
@@ -25,23 +28,27 @@ async function loadRecommendations() {
   const params = new URLSearchParams();
   if (keywords) params.append("keywords", keywords);
   if (skills) params.append("skills", skills);
+  params.append("limit", PAGE_SIZE);
+  if (append && nextCursor) params.append("cursor", nextCursor);
 
   try {
-    const recs = await apiRequest(`/internships/recommendations?${params.toString()}`, { method:"GET" });
-    renderRecommendations(recs);
+    const page = await apiRequest(`/internships/recommendations?${params.toString()}`, { method:"GET" });
+    nextCursor = page?.next_cursor || null;
+    renderRecommendations(page?.items || [], append);
   } catch (err) {
     console.error("Failed to load recommendations", err);
     alert("Failed to load recommendations from server.");
   }
 }
 
-function renderRecommendations(list) {
+function renderRecommendations(list, append = false) {
   const container = document.getElementById("recsList");
   if (!container) return;
 
-  container.innerHTML = "";
+  container.querySelector("[data-load-more]")?.remove();
+  if (!append) container.innerHTML = "";
 
-  if (!list || !list.length) {
+  if (!append && (!list || !list.length)) {
     container.innerHTML =
       '<p style="font-size:0.9rem; color:var(--text-muted);">No internships found. Try changing filters or ask admin to add internships.</p>';
     return;
@@ -85,6 +92,16 @@ function renderRecommendations(list) {
   });
 
   wireApplyButtons(container);
+
+  if (nextCursor) {
+    const more = document.createElement("button");
+    more.className = "btn btn-ghost";
+    more.type = "button";
+    more.dataset.loadMore = "1";
+    more.textContent = "Load more";
+    more.onclick = () => loadRecommendations(true);
+    container.appendChild(more);
+  }
 }
 
 async function applyAction(id, btn) {